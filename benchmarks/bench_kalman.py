@@ -0,0 +1,61 @@
+"""
+Benchmark latency per call KalmanFilterTracker.apply:
+mode awal (matriks NumPy), fast (closed form tanpa alokasi) dan steady-state.
+
+    python benchmarks/bench_kalman.py [--calls 20000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.numerical_methods import KalmanFilterTracker
+
+
+def bench(tracker: KalmanFilterTracker, xs, ys, ts) -> np.ndarray:
+    lat = np.empty(len(xs))
+    apply = tracker.apply
+    clock = time.perf_counter_ns
+    for i in range(len(xs)):
+        t0 = clock()
+        apply(xs[i], ys[i], ts[i])
+        lat[i] = clock() - t0
+    return lat
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    n = args.calls
+    ts = np.cumsum(rng.uniform(0.025, 0.045, n)).tolist()
+    xs = (640 + 200 * np.sin(np.arange(n) / 30.0) + rng.normal(0, 3, n)).tolist()
+    ys = (360 + 150 * np.cos(np.arange(n) / 45.0) + rng.normal(0, 3, n)).tolist()
+
+    variants = {
+        "numpy (default)": KalmanFilterTracker(),
+        "fast": KalmanFilterTracker(fast=True),
+        "steady-state": KalmanFilterTracker(steady_state=True),
+    }
+    ref = None
+    for name, tracker in variants.items():
+        lat = bench(tracker, xs, ys, ts)
+        p50, p99 = np.percentile(lat, [50, 99]) / 1000.0
+        out = np.array(tracker.apply(xs[-1], ys[-1], ts[-1] + 0.033))
+        if ref is None:
+            ref = out
+        print(
+            f"{name:>16}: mean {lat.mean() / 1000.0:7.2f} us  p50 {p50:7.2f} us  "
+            f"p99 {p99:7.2f} us  last=({out[0]:.2f}, {out[1]:.2f})  "
+            f"|diff|={np.abs(out - ref).max():.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
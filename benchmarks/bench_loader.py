@@ -0,0 +1,349 @@
+"""
+Benchmark skala loader + renderer pada mesh sintetis (synthetic_obj.py):
+parse OBJ (parser cepat, opsional parser lama), centroid, peak memory parse,
+MeshCache (simpan / hit), build array render, upload VBO, build display list
+dan waktu draw per frame, untuk tiap ukuran mesh.
+
+    python benchmarks/bench_loader.py --sizes 1k,10k,100k,1m --save loader_ref.json
+    python benchmarks/bench_loader.py --sizes 1k,10k,100k,1m --check loader_ref.json
+    python benchmarks/bench_loader.py --sizes 10m --no-gl --materials 256 --attrs v//vn
+
+Tahap GL butuh display (window GLUT seperti bench_scene.py); --no-gl hanya
+mengukur tahap CPU. File sintetis disimpan di --dir dan dipakai ulang.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.rendering.mesh_cache import MeshCache, load_mesh
+from src.rendering.obj_loader import OBJLoader
+from src.rendering.vertex_arrays import build_render_arrays
+
+from synthetic_obj import (
+    ATTR_FORMATS, POLYGON_MIXES, format_count, parse_count, synthetic_path, write_synthetic_obj,
+)
+
+
+# metrik yang dibandingkan dengan baseline: (nama, satuan, selisih absolut minimum
+# yang dianggap nyata — supaya noise di mesh kecil tidak jadi "regresi"). Tahap
+# cache tergantung disk / page cache, jadi ambangnya lebih longgar.
+METRICS = [
+    ("parse_ms", "ms", 2.0),
+    ("parse_legacy_ms", "ms", 2.0),
+    ("centroid_ms", "ms", 1.0),
+    ("parse_peak_mb", "MB", 1.0),
+    ("cache_store_ms", "ms", 20.0),
+    ("cache_hit_ms", "ms", 10.0),
+    ("arrays_ms", "ms", 2.0),
+    ("upload_ms", "ms", 1.0),
+    ("display_list_ms", "ms", 2.0),
+    ("draw_ms", "ms", 0.2),
+    ("draw_p99_ms", "ms", 0.5),
+    ("draw_dl_ms", "ms", 0.2),
+]
+
+
+def _quiet(fn, *args, **kwargs):
+    """Panggil fn tanpa log print per-load (ribuan baris kalau tidak)."""
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+
+def _median(repeat: int, fn, *args, setup=None, sync=None, **kwargs):
+    """
+    Jalankan fn `repeat` kali, return (median waktu dalam ms, hasil terakhir).
+    Median tidak terbawa satu run yang kebetulan cepat (page cache, frekuensi
+    CPU) seperti minimum, jadi --save lalu --check di mesin yang sama tetap
+    sebanding. setup() dipanggil sebelum tiap run di luar waktu, sync()
+    (mis. glFinish) di dalam waktu.
+    """
+    times = []
+    result = None
+    for _ in range(max(1, repeat)):
+        if setup is not None:
+            setup()
+        gc.collect()
+        t0 = time.perf_counter()
+        result = _quiet(fn, *args, **kwargs)
+        if sync is not None:
+            sync()
+        times.append(time.perf_counter() - t0)
+    return round(1e3 * float(np.median(times)), 3), result
+
+
+def measure_cpu(path: str, legacy_max: int, repeat: int = 7, memory: bool = True) -> tuple:
+    """
+    Tahap CPU: parse, centroid, peak memory, MeshCache, array render.
+    Return (hasil, mesh yang sudah digeser ke centroid, RenderArrays).
+    """
+    out: dict = {}
+    out["parse_ms"], loader = _median(repeat, OBJLoader, path, fast=True)
+    mesh = loader.mesh
+    out["centroid_ms"], centroid = _median(repeat, loader.compute_centroid)
+    out["vertices"] = len(mesh.vertices)
+    out["faces"] = mesh.face_count
+    out["triangles"] = int((mesh.face_sizes - 2).sum())
+    out["mesh_mb"] = round(sum(a.nbytes for a in mesh.to_arrays()[0].values()) / 1e6, 2)
+    del loader
+
+    if memory:
+        # pass terpisah: tracemalloc memperlambat parse, jadi tidak dicampur dengan waktu
+        gc.collect()
+        tracemalloc.start()
+        _quiet(OBJLoader, path, fast=True)
+        out["parse_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 1e6, 2)
+        tracemalloc.stop()
+
+    if mesh.face_count <= legacy_max:
+        out["parse_legacy_ms"], _ = _median(repeat, OBJLoader, path)
+
+    cache_dir = tempfile.mkdtemp(prefix="bench_loader_cache_")
+    try:
+        # tanpa batas ukuran: entry 10M face tidak boleh langsung di-evict
+        cache = MeshCache(cache_dir, max_bytes=1 << 62)
+
+        def empty_cache():
+            for name in os.listdir(cache_dir):
+                os.remove(os.path.join(cache_dir, name))
+
+        # parse + centroid + shift + tulis; selisih dengan parse_ms = biaya cache
+        out["cache_store_ms"], _ = _median(repeat, load_mesh, path, cache, setup=empty_cache)
+        out["cache_hit_ms"], _ = _median(repeat, load_mesh, path, cache)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    shifted = mesh.shifted(centroid)
+    out["arrays_ms"], arrays = _median(repeat, build_render_arrays, shifted)
+    out["gpu_mb"] = round(arrays.nbytes / 1e6, 2)
+    out["draw_calls"] = len(arrays.ranges)
+    return out, shifted, arrays
+
+
+def _draw_times(renderer, frames: int) -> np.ndarray:
+    from OpenGL.GL import GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, glClear, glFinish
+
+    times = np.empty(frames)
+    for i in range(frames + 1):
+        renderer.update_state(3.0 * i, 5.0 * i, 1.0)
+        t0 = time.perf_counter()
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        renderer.begin_frame()
+        renderer.draw_object()
+        glFinish()
+        if i > 0:
+            # frame pertama tidak dihitung (driver masih menyiapkan buffer)
+            times[i - 1] = time.perf_counter() - t0
+    return times
+
+
+def measure_gl(mesh, arrays, frames: int, display_list_max: int, repeat: int = 7,
+               width: int = 800, height: int = 600) -> dict:
+    """
+    Tahap GL di context yang sedang aktif: upload VBO (array sudah jadi, jadi
+    murni transfer), draw per frame (median + p99), dan jalur display list lama.
+    """
+    from OpenGL.GL import glDeleteLists, glFinish
+
+    from src.rendering.cube_renderer import CubeRenderer
+
+    out: dict = {}
+    # mesh sintetis yang sudah di-parse dipasang langsung (obj_path=None → tidak parse ulang)
+    renderer = _quiet(CubeRenderer, obj_path=None, use_cache=False)
+    renderer.mesh = mesh
+    renderer.render_arrays = arrays
+
+    def drop_buffers():
+        if renderer.gpu_mesh is not None:
+            renderer.gpu_mesh.release()
+        glFinish()
+
+    out["upload_ms"], _ = _median(repeat, renderer.init_gl, width, height, setup=drop_buffers, sync=glFinish)
+    times = _draw_times(renderer, frames)
+    out["draw_ms"] = round(1e3 * np.median(times), 3)
+    out["draw_p99_ms"] = round(1e3 * np.percentile(times, 99), 3)
+    drop_buffers()
+
+    if mesh.face_count <= display_list_max:
+        renderer = _quiet(CubeRenderer, obj_path=None, use_cache=False, use_vbo=False)
+        renderer.mesh = mesh
+
+        def drop_list():
+            if renderer.gl_list is not None:
+                glDeleteLists(renderer.gl_list, 1)
+                renderer.gl_list = None
+
+        out["display_list_ms"], _ = _median(repeat, renderer.init_gl, width, height, setup=drop_list, sync=glFinish)
+        out["draw_dl_ms"] = round(1e3 * np.median(_draw_times(renderer, frames)), 3)
+        drop_list()
+    return out
+
+
+def init_window(width: int, height: int) -> bool:
+    """Window GLUT untuk context GL; False kalau tidak ada display."""
+    if sys.platform.startswith("linux") and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        print("[bench_loader] no display, GL stages skipped (use --no-gl to silence)")
+        return False
+    from OpenGL.GLUT import (
+        GLUT_DEPTH, GLUT_DOUBLE, GLUT_RGBA, glutCreateWindow, glutInit,
+        glutInitDisplayMode, glutInitWindowSize,
+    )
+
+    glutInit()
+    glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGBA | GLUT_DEPTH)
+    glutInitWindowSize(width, height)
+    glutCreateWindow(b"bench_loader")
+    return True
+
+
+def compare(results: list, baseline: dict, tolerance: float, verbose: bool = True) -> list:
+    """
+    Bandingkan dengan baseline per ukuran (jumlah face) dan metrik.
+    Return daftar regresi: metrik > (1 + tolerance) x baseline dan selisihnya
+    di atas ambang absolut metrik tersebut.
+    """
+    ref = {r["faces"]: r for r in baseline.get("results", [])}
+    regressions = []
+    show = print if verbose else (lambda *a, **k: None)
+    show(f"[bench_loader] vs baseline ({baseline.get('meta', {}).get('date', '?')}), tolerance {tolerance:.0%}:")
+    for r in results:
+        old = ref.get(r["faces"])
+        if old is None:
+            show(f"  {format_count(r['faces']):>6}  (not in baseline)")
+            continue
+        for name, unit, floor in METRICS:
+            if name not in r or name not in old or not old[name]:
+                continue
+            ratio = r[name] / old[name]
+            slower = ratio > 1.0 + tolerance and r[name] - old[name] > floor
+            flag = "REGRESSION" if slower else ("faster" if ratio < 1.0 - tolerance else "")
+            show(f"  {format_count(r['faces']):>6}  {name:<16} {old[name]:>10.2f} -> {r[name]:>10.2f} {unit}"
+                 f"  x{ratio:.2f}  {flag}")
+            if slower:
+                regressions.append((r["faces"], name, old[name], r[name]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1k,10k,100k,1m", help="jumlah face, dipisah koma (1k .. 10m)")
+    parser.add_argument("--materials", type=int, default=32)
+    parser.add_argument("--run", type=int, default=64, help="face per usemtl")
+    parser.add_argument("--polygons", choices=sorted(POLYGON_MIXES), default="mixed")
+    parser.add_argument("--attrs", choices=ATTR_FORMATS, default="v/vt/vn")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dir", default=os.path.join(tempfile.gettempdir(), "bench_loader"),
+                        help="tempat file sintetis (dipakai ulang antar run)")
+    parser.add_argument("--frames", type=int, default=60, help="frame untuk waktu draw")
+    parser.add_argument("--repeat", type=int, default=7, help="ulangi tiap tahap, ambil median")
+    parser.add_argument("--size", default="800x600", help="WxH window")
+    parser.add_argument("--legacy-max", type=parse_count, default=parse_count("100k"),
+                        help="parser lama (per baris) hanya sampai jumlah face ini")
+    parser.add_argument("--display-list-max", type=parse_count, default=parse_count("100k"),
+                        help="display list (glVertex per vertex) hanya sampai jumlah face ini")
+    parser.add_argument("--no-gl", action="store_true", help="hanya tahap CPU")
+    parser.add_argument("--no-memory", action="store_true", help="lewati pass tracemalloc")
+    parser.add_argument("--save", metavar="JSON", help="simpan hasil (jadi baseline)")
+    parser.add_argument("--check", metavar="JSON", help="bandingkan dengan baseline (exit 1 kalau regresi)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="toleransi relatif untuk --check")
+    parser.add_argument("--confirm", type=int, default=2,
+                        help="--check: ukur ulang ukuran yang regresi sampai N kali sebelum gagal")
+    args = parser.parse_args()
+
+    sizes = [parse_count(s) for s in args.sizes.split(",") if s.strip()]
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    use_gl = not args.no_gl and init_window(width, height)
+    os.makedirs(args.dir, exist_ok=True)
+
+    def measure(faces: int) -> dict:
+        path = synthetic_path(args.dir, faces, args.materials, args.polygons, args.attrs, args.seed)
+        if not os.path.exists(path):
+            info = write_synthetic_obj(path, faces, args.materials, args.run,
+                                       args.polygons, args.attrs, args.seed)
+            print(f"[bench_loader] generated {path} ({info['bytes'] / 1e6:.1f} MB, {info['write_s']:.1f} s)")
+
+        row, mesh, arrays = measure_cpu(path, args.legacy_max, args.repeat, memory=not args.no_memory)
+        row["file_mb"] = round(os.path.getsize(path) / 1e6, 2)
+        if use_gl:
+            row.update(measure_gl(mesh, arrays, args.frames, args.display_list_max,
+                                  args.repeat, width, height))
+        return row
+
+    results = []
+    for faces in sizes:
+        row = measure(faces)
+        results.append(row)
+
+        line = "  ".join(f"{name}={row[name]}" for name, _, _ in METRICS if name in row)
+        print(f"[bench_loader] {format_count(faces)} faces ({row['triangles']} triangles, "
+              f"{row['file_mb']} MB): {line}")
+
+    report = {
+        "meta": {
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": f"{platform.system()} {platform.machine()}",
+            "gl": use_gl,
+            "materials": args.materials,
+            "run": args.run,
+            "polygons": args.polygons,
+            "attrs": args.attrs,
+            "seed": args.seed,
+            "frames": args.frames,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"[bench_loader] results written to {args.save}")
+
+    if args.check:
+        with open(args.check) as f:
+            baseline = json.load(f)
+        changed = [k for k in ("materials", "run", "polygons", "attrs", "seed", "frames", "repeat")
+                   if baseline.get("meta", {}).get(k) != report["meta"][k]]
+        if changed:
+            print(f"[bench_loader] warning: baseline was run with different {', '.join(changed)}")
+        regressions = compare(results, baseline, args.tolerance, verbose=False)
+        for _ in range(args.confirm):
+            if not regressions:
+                break
+            # kecepatan mesin berubah dalam hitungan detik (VM, thermal): ukur
+            # ulang ukuran yang kena, regresi nyata tetap lambat di run berikutnya
+            flagged = sorted({faces for faces, *_ in regressions})
+            print(f"[bench_loader] {len(regressions)} possible regression(s), re-measuring "
+                  + ", ".join(format_count(f) for f in flagged))
+            for row in results:
+                if row["faces"] in flagged:
+                    again = measure(row["faces"])
+                    for name, _, _ in METRICS:
+                        if name in row and name in again:
+                            row[name] = min(row[name], again[name])
+            regressions = compare(results, baseline, args.tolerance, verbose=False)
+        compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"[bench_loader] {len(regressions)} regression(s) against {args.check}")
+            sys.exit(1)
+        print(f"[bench_loader] no regressions against {args.check}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark renderer offscreen (tanpa window/GPU): render N frame OBJ pada
+rotasi berurutan, laporkan frame/s dan checksum gambar.
+
+    python benchmarks/bench_render.py models/Lowpoly_tree_sample.obj --frames 120
+    python benchmarks/bench_render.py model.obj --save ref.json     # simpan checksum
+    python benchmarks/bench_render.py model.obj --check ref.json    # bandingkan (exit 1 kalau beda)
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.rendering.cube_renderer import CubeRenderer
+from src.rendering.offscreen import OffscreenRenderer, image_checksum
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("obj", nargs="?", help="file OBJ (kosong = kubus fallback)")
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--size", default="800x600", help="WxH")
+    parser.add_argument("--rot-step", type=float, nargs=2, default=(3.0, 5.0), metavar=("DX", "DY"),
+                        help="penambahan rot_x/rot_y per frame (derajat)")
+    parser.add_argument("--scale", type=float, default=1.0, help="skala seperti dari gesture (x0.1 di GL)")
+    parser.add_argument("--optimize", action="store_true", help="pakai array hasil mesh_optimizer")
+    parser.add_argument("--save", metavar="JSON", help="simpan checksum per frame")
+    parser.add_argument("--check", metavar="JSON", help="bandingkan checksum dengan file referensi")
+    parser.add_argument("--dump", metavar="DIR", help="simpan frame sebagai PNG (butuh cv2)")
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    renderer = CubeRenderer(obj_path=args.obj, use_cache=args.obj is not None, optimize=args.optimize)
+    offscreen = OffscreenRenderer(renderer, width, height)
+    print(f"[bench_render] {offscreen.arrays.triangle_count} triangles, {width}x{height}")
+
+    if args.dump:
+        import cv2
+        os.makedirs(args.dump, exist_ok=True)
+
+    # frame pertama tidak dihitung (alokasi awal)
+    renderer.update_state(0.0, 0.0, args.scale)
+    offscreen.draw()
+
+    checksums = []
+    times = np.empty(args.frames)
+    total = hashlib.blake2b(digest_size=16)
+    for i in range(args.frames):
+        renderer.update_state(i * args.rot_step[0], i * args.rot_step[1], args.scale)
+        t0 = time.perf_counter()
+        img = offscreen.draw()
+        times[i] = time.perf_counter() - t0
+        checksums.append(image_checksum(img))
+        total.update(img.tobytes())
+        if args.dump:
+            cv2.imwrite(os.path.join(args.dump, f"frame_{i:05d}.png"), img[:, :, ::-1])
+
+    print(
+        f"[bench_render] {args.frames} frames: {args.frames / times.sum():.1f} frames/s  "
+        f"mean {1e3 * times.mean():.2f} ms  p50 {1e3 * np.percentile(times, 50):.2f} ms  "
+        f"p99 {1e3 * np.percentile(times, 99):.2f} ms"
+    )
+    print(f"[bench_render] checksum: {total.hexdigest()}")
+
+    result = {
+        "obj": args.obj,
+        "size": [width, height],
+        "rot_step": list(args.rot_step),
+        "scale": args.scale,
+        "checksum": total.hexdigest(),
+        "frames": checksums,
+    }
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(result, f, indent=2)
+
+    if args.check:
+        with open(args.check) as f:
+            ref = json.load(f)
+        bad = [i for i, (a, b) in enumerate(zip(checksums, ref["frames"])) if a != b]
+        if len(ref["frames"]) != len(checksums):
+            print(f"[bench_render] frame count differs: {len(checksums)} vs {len(ref['frames'])}")
+            sys.exit(1)
+        if bad:
+            print(f"[bench_render] {len(bad)} frame(s) differ from {args.check}, first: {bad[0]}")
+            sys.exit(1)
+        print(f"[bench_render] all {len(checksums)} frames match {args.check}")
+
+
+if __name__ == "__main__":
+    main()
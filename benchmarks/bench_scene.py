@@ -0,0 +1,103 @@
+"""
+Benchmark scene katalog: banyak instance dari beberapa OBJ dalam satu window
+GL, tiap asset di-load dan di-upload sekali (MeshRegistry). Butuh display.
+
+    python benchmarks/bench_scene.py models/Lowpoly_tree_sample.obj --instances 400
+    python benchmarks/bench_scene.py a.obj b.obj --instances 100 --naive   # bind + draw per material per instance
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from OpenGL.GL import GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, glClear, glFinish, glLoadMatrixf
+
+from src.rendering.scene import MeshRegistry, Scene, grid_positions, instance_matrices
+
+
+def draw_naive(scene: Scene) -> None:
+    """Pembanding: tiap instance bind buffer sendiri dan satu call per material."""
+    for inst in scene.instances:
+        m = instance_matrices(
+            np.array([inst.position]), np.array([inst.rot_x]), np.array([inst.rot_y]),
+            np.array([inst.scale]), scene.camera_distance,
+        )
+        glLoadMatrixf(m[0])
+        inst.asset.gpu.draw()
+
+
+def run(scene: Scene, frames: int, naive: bool = False, rot_step=(1.0, 2.0)) -> np.ndarray:
+    """Render `frames` frame (instance berputar), return durasi per frame (detik)."""
+    times = np.empty(frames)
+    for i in range(frames):
+        for inst in scene.instances:
+            inst.rot_x += rot_step[0]
+            inst.rot_y += rot_step[1]
+        t0 = time.perf_counter()
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        scene.begin_frame()
+        if naive:
+            draw_naive(scene)
+        else:
+            scene.draw()
+        glFinish()
+        times[i] = time.perf_counter() - t0
+    return times
+
+
+def build_catalogue(scene: Scene, paths, instances: int, spacing: float, scale: float) -> None:
+    positions = grid_positions(instances * len(paths), spacing)
+    for i, position in enumerate(positions):
+        scene.add(paths[i % len(paths)], position=position,
+                  rot_x=7.0 * i, rot_y=11.0 * i, scale=scale)
+    # mundurkan kamera sampai seluruh grid kelihatan
+    half = max(abs(c) for p in positions for c in p[:2]) + spacing
+    scene.set_camera(max(scene.camera_distance, 1.4 * half / np.tan(np.radians(22.5))))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("obj", nargs="+", help="file OBJ (bergantian di grid)")
+    parser.add_argument("--instances", type=int, default=100, help="instance per OBJ")
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--size", default="1280x960", help="WxH")
+    parser.add_argument("--spacing", type=float, default=2.5)
+    parser.add_argument("--scale", type=float, default=0.1)
+    parser.add_argument("--optimize", action="store_true", help="pakai array hasil mesh_optimizer")
+    parser.add_argument("--naive", action="store_true", help="tanpa batching per asset")
+    args = parser.parse_args()
+
+    from OpenGL.GLUT import (
+        GLUT_DEPTH, GLUT_DOUBLE, GLUT_RGBA, glutCreateWindow, glutInit,
+        glutInitDisplayMode, glutInitWindowSize,
+    )
+
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    glutInit()
+    glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGBA | GLUT_DEPTH)
+    glutInitWindowSize(width, height)
+    glutCreateWindow(b"bench_scene")
+
+    scene = Scene(MeshRegistry(optimize=args.optimize))
+    scene.init_gl(width, height)
+    t0 = time.perf_counter()
+    build_catalogue(scene, args.obj, args.instances, args.spacing, args.scale)
+    print(f"[bench_scene] build {1e3 * (time.perf_counter() - t0):.1f} ms  {scene.registry.stats()}")
+
+    run(scene, 1, args.naive)
+    times = run(scene, args.frames, args.naive)
+    print(
+        f"[bench_scene] {len(scene.instances)} instances, {args.frames} frames: "
+        f"{args.frames / times.sum():.1f} frames/s  mean {1e3 * times.mean():.2f} ms  "
+        f"p99 {1e3 * np.percentile(times, 99):.2f} ms"
+    )
+    print(f"[bench_scene] {scene.stats()}")
+    scene.clear()
+
+
+if __name__ == "__main__":
+    main()
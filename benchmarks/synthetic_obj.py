@@ -0,0 +1,202 @@
+"""
+Generator file OBJ/MTL sintetis untuk benchmark loader/renderer (1k - 10M face).
+
+Permukaan grid bergelombang; tiap face diambil dari ring 8 titik di blok 2x2
+grid (boleh tumpang tindih) sehingga ukuran polygon bisa dicampur 3..6 vertex
+tanpa segitiga degenerate. Material berganti tiap `run` face. Ditulis per
+chunk dengan format string sekaligus, jadi 10M face tidak perlu ditahan di
+memori sebagai teks.
+
+    python benchmarks/synthetic_obj.py out.obj --faces 1m --materials 64 --attrs v/vt/vn
+"""
+import argparse
+import math
+import os
+import time
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+# face dengan k vertex: posisi di ring 8 titik blok 2x2 (urutan searah jarum jam
+# mulai dari tengah atas: T, TR, R, BR, B, BL, L, TL). Semua subset ini
+# convex dan fan dari titik pertama tidak menghasilkan segitiga degenerate.
+_RING = np.array([(0, 1), (0, 2), (1, 2), (2, 2), (2, 1), (2, 0), (1, 0), (0, 0)])
+_POLYGONS: Dict[int, Tuple[int, ...]] = {
+    3: (0, 3, 5),
+    4: (0, 2, 4, 6),
+    5: (0, 2, 3, 5, 6),
+    6: (0, 2, 3, 4, 5, 6),
+}
+POLYGON_MIXES: Dict[str, Dict[int, float]] = {
+    "tri": {3: 1.0},
+    "quad": {4: 1.0},
+    "mixed": {3: 0.4, 4: 0.4, 5: 0.1, 6: 0.1},
+}
+ATTR_FORMATS = ("v", "v/vt", "v//vn", "v/vt/vn")
+
+_SUFFIX = {"k": 1_000, "m": 1_000_000}
+
+
+def parse_count(text: str) -> int:
+    """'1k' → 1000, '10m' → 10_000_000, '2500' → 2500."""
+    text = text.strip().lower()
+    if text and text[-1] in _SUFFIX:
+        return int(float(text[:-1]) * _SUFFIX[text[-1]])
+    return int(text)
+
+
+def format_count(n: int) -> str:
+    for suffix, value in (("m", 1_000_000), ("k", 1_000)):
+        if n >= value and n % value == 0:
+            return f"{n // value}{suffix}"
+    return str(n)
+
+
+def _grid_shape(faces: int) -> Tuple[int, int]:
+    """(rows, cols) blok sehingga rows * cols >= faces, kira-kira persegi."""
+    cols = max(1, math.ceil(math.sqrt(faces)))
+    return max(1, math.ceil(faces / cols)), cols
+
+
+def _height(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    return 0.15 * np.sin(3.0 * x) * np.cos(2.0 * y)
+
+
+def _corner_format(attrs: str) -> str:
+    return {"v": "%d", "v/vt": "%d/%d", "v//vn": "%d//%d", "v/vt/vn": "%d/%d/%d"}[attrs]
+
+
+def write_synthetic_obj(path: str, faces: int, materials: int = 16, run: int = 64,
+                        polygons: str = "mixed", attrs: str = "v/vt/vn",
+                        seed: int = 0, chunk: int = 100_000) -> dict:
+    """
+    Tulis `path` (+ .mtl di sebelahnya kalau materials > 0).
+    Return ringkasan: jumlah vertex/face/segitiga, ukuran file, waktu tulis.
+    """
+    if attrs not in ATTR_FORMATS:
+        raise ValueError(f"attrs must be one of {ATTR_FORMATS}")
+    t0 = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    rows, cols = _grid_shape(faces)
+    vrows, vcols = rows + 2, cols + 2
+    with_vt = "vt" in attrs
+    with_vn = "vn" in attrs
+
+    mix = POLYGON_MIXES[polygons]
+    sizes_all = rng.choice(list(mix), size=faces, p=list(mix.values())).astype(np.int64)
+    # urutan material per run diacak (tidak urut id) seperti hasil export
+    n_runs = math.ceil(faces / run) if materials > 0 else 0
+    run_material = rng.integers(0, materials, size=n_runs) if materials > 0 else None
+
+    base = os.path.splitext(path)[0]
+    mtl_name = os.path.basename(base) + ".mtl"
+    if materials > 0:
+        colors = rng.uniform(0.1, 1.0, size=(materials, 3))
+        with open(base + ".mtl", "w") as f:
+            for i, (r, g, b) in enumerate(colors.tolist()):
+                f.write(f"newmtl mat_{i}\nKa 0.2 0.2 0.2\nKd {r:.4f} {g:.4f} {b:.4f}\nKs 0 0 0\nd 1\n\n")
+
+    corner = _corner_format(attrs)
+    face_fmt = {k: "f " + " ".join([corner] * k) + "\n" for k in _POLYGONS}
+    reps = 1 + with_vt + with_vn
+
+    with open(path, "w") as f:
+        f.write(f"# synthetic mesh: {faces} faces, polygons={polygons}, attrs={attrs}\n")
+        if materials > 0:
+            f.write(f"mtllib {mtl_name}\n")
+        f.write("o synthetic\n")
+
+        # 1) vertex (+ vt + vn), satu per titik grid, per baris grid
+        step = max(1, chunk // vcols)
+        for r0 in range(0, vrows, step):
+            r = np.arange(r0, min(r0 + step, vrows), dtype=np.float64)
+            c = np.arange(vcols, dtype=np.float64)
+            x = np.broadcast_to(c / vcols * 4.0 - 2.0, (len(r), vcols)).ravel()
+            y = np.repeat(2.0 - r / vrows * 4.0, vcols)
+            z = _height(x, y)
+            pos = np.column_stack((x, y, z))
+            f.write(("v %.6f %.6f %.6f\n" * len(pos)) % tuple(pos.ravel().tolist()))
+            if with_vt:
+                uv = np.column_stack((np.tile(c / (vcols - 1), len(r)), np.repeat(r / (vrows - 1), vcols)))
+                f.write(("vt %.5f %.5f\n" * len(uv)) % tuple(uv.ravel().tolist()))
+            if with_vn:
+                # normal analitik dari height field
+                dx = 0.45 * np.cos(3.0 * x) * np.cos(2.0 * y)
+                dy = -0.3 * np.sin(3.0 * x) * np.sin(2.0 * y)
+                n = np.column_stack((-dx, -dy, np.ones_like(x)))
+                n /= np.linalg.norm(n, axis=1)[:, None]
+                f.write(("vn %.4f %.4f %.4f\n" * len(n)) % tuple(n.ravel().tolist()))
+
+        # 2) face (+ usemtl tiap `run` face)
+        ring_offsets = _RING[:, 0] * vcols + _RING[:, 1]
+        for s in range(0, faces, chunk):
+            e = min(s + chunk, faces)
+            ids = np.arange(s, e)
+            origin = (ids // cols) * vcols + ids % cols
+            sizes = sizes_all[s:e]
+
+            values = []
+            for k in _POLYGONS:
+                sel = sizes == k
+                if sel.any():
+                    idx = origin[sel, None] + ring_offsets[list(_POLYGONS[k])] + 1  # OBJ 1-based
+                    values.append((np.flatnonzero(sel), idx))
+            # susun ulang supaya urutan face tetap (ukuran bercampur)
+            order_values = np.empty(int(sizes.sum()), dtype=np.int64)
+            starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+            for rows_sel, idx in values:
+                k = idx.shape[1]
+                dst = starts[rows_sel, None] + np.arange(k)
+                order_values[dst.ravel()] = idx.ravel()
+            corners = np.repeat(order_values, reps)
+
+            fmts = [face_fmt[k] for k in sizes.tolist()]
+            if materials > 0:
+                for i in range(-(-s // run) * run, e, run):
+                    # sisipkan usemtl sebelum face ke-i
+                    fmts[i - s] = f"usemtl mat_{run_material[i // run]}\n" + fmts[i - s]
+            f.write("".join(fmts) % tuple(corners.tolist()))
+
+    triangles = int((sizes_all - 2).sum())
+    return {
+        "path": path,
+        "faces": faces,
+        "vertices": vrows * vcols,
+        "triangles": triangles,
+        "materials": materials,
+        "polygons": polygons,
+        "attrs": attrs,
+        "bytes": os.path.getsize(path),
+        "write_s": round(time.perf_counter() - t0, 3),
+    }
+
+
+def synthetic_path(directory: str, faces: int, materials: int, polygons: str, attrs: str,
+                   seed: int = 0) -> str:
+    """Nama file yang menyandikan parameter (dipakai ulang antar run)."""
+    tag = attrs.replace("/", "-")
+    return os.path.join(directory, f"synth_{format_count(faces)}_m{materials}_{polygons}_{tag}_s{seed}.obj")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("out", help="file OBJ tujuan (.mtl ditulis di sebelahnya)")
+    parser.add_argument("--faces", default="10k", help="jumlah face (boleh 1k / 2.5m)")
+    parser.add_argument("--materials", type=int, default=16, help="0 = tanpa mtllib/usemtl")
+    parser.add_argument("--run", type=int, default=64, help="face per usemtl")
+    parser.add_argument("--polygons", choices=sorted(POLYGON_MIXES), default="mixed")
+    parser.add_argument("--attrs", choices=ATTR_FORMATS, default="v/vt/vn")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    info = write_synthetic_obj(args.out, parse_count(args.faces), args.materials, args.run,
+                               args.polygons, args.attrs, args.seed)
+    print(
+        f"[synthetic_obj] {info['path']}: {info['vertices']} vertices, {info['faces']} faces, "
+        f"{info['triangles']} triangles, {info['bytes'] / 1e6:.1f} MB in {info['write_s']:.2f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
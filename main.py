@@ -1,243 +1,502 @@
-import cv2
-import numpy as np
-from OpenGL.raw.GLUT import glutPostRedisplay
-from cvzone.HandTrackingModule import HandDetector
-
-import threading
-import queue
 import time
-import sys
-
-from src.controllers.hand_controller import HandTrackingController
-from src.rendering.cube_renderer import CubeRenderer
-
 
-global_mode = {"mode": 3}   # 1=RAW, 2=SMOOTH, 3=KALMAN
+_T0 = time.perf_counter()
 
-
-def main():
-    cap = cv2.VideoCapture(0)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+import argparse
+import glob
+import os
+import threading
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# modul ringan saja (numpy); cv2, cvzone/mediapipe dan OpenGL diimport
+# di thread startup masing-masing (lihat main)
+from src.capture import open_source
+from src.controllers.detection_pool import DetectionPool, DetectionWorkerError
+from src.diagnostics import Instrumentation, RunLog, SnapshotExporter, StartupProfiler, TraceRecorder
+from src.numerical_methods import TRACKERS, available_trackers, create_batch_tracker, create_tracker
+from src.rendering.render_scheduler import RenderScheduler
+from src.rendering.render_state import StateSlot
+
+_T_IMPORTS = time.perf_counter()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Hand-tracked 3D object controller")
+    parser.add_argument("--source", action="append", metavar="SRC",
+                        help="index webcam, file video, atau direktori gambar; ulangi untuk "
+                             "beberapa session sekaligus (default: webcam 0)")
+    parser.add_argument("--model", action="append", metavar="OBJ",
+                        help="file OBJ per session (urut sesuai --source, yang terakhir "
+                             "dipakai untuk sisanya; default models/mug.obj)")
+    parser.add_argument("--source-fps", type=float, default=None, metavar="FPS",
+                        help="fps untuk timestamp direktori gambar / override fps video")
+    parser.add_argument("--max-speed", action="store_true",
+                        help="proses frame secepat mungkin: tanpa preview, tanpa window 3D, "
+                             "file tidak diputar real-time")
+    parser.add_argument("--no-preview", action="store_true",
+                        help="tanpa window preview kamera (keyboard tetap lewat window 3D)")
+    parser.add_argument("--preview-scale", type=float, default=1.0, metavar="S",
+                        help="ukuran preview relatif terhadap frame kamera (mis. 0.5)")
+    parser.add_argument("--preview-hz", type=float, default=0.0, metavar="HZ",
+                        help="batas frekuensi update preview; 0 = tiap frame")
+    parser.add_argument("--log", metavar="PATH",
+                        help="tulis rot_x/rot_y/scale per frame ke CSV ('-' = stdout; "
+                             "default '-' saat --max-speed)")
+    parser.add_argument("--mode", type=int, choices=(1, 2, 3), default=3,
+                        help="mode filter awal: 1=RAW, 2=SMOOTH, 3=KALMAN")
+    parser.add_argument("--tracker", metavar="SPEC",
+                        help="filter rotasi dari registry, menggantikan --mode 2/3 ("
+                             + ", ".join(available_trackers()) + "; parameter: one-euro:beta=0.1)")
+    parser.add_argument("--landmark-tracker", default="kalman", metavar="SPEC",
+                        help="filter batch untuk landmark (scale), format sama dengan --tracker")
+    parser.add_argument("--record", metavar="PATH",
+                        help="rekam deteksi tangan per frame ke file trace .npz")
+    parser.add_argument("--detect-every", type=int, default=1, metavar="N",
+                        help="jalankan deteksi tiap N frame, sisanya prediksi tracker")
+    parser.add_argument("--no-roi", action="store_true",
+                        help="selalu deteksi full frame (tanpa crop ROI)")
+    parser.add_argument("--workers", type=int, default=0, metavar="N",
+                        help="deteksi di N proses worker (shared memory); 0 = di proses utama "
+                             "(beberapa --source: otomatis satu worker per session, maks. jumlah core)")
+    parser.add_argument("--profile", action="store_true",
+                        help="ukur durasi tiap tahap pipeline (histogram p50/p95/p99)")
+    parser.add_argument("--hud", action="store_true",
+                        help="tampilkan tabel profil di preview (tombol 'h' untuk toggle)")
+    parser.add_argument("--profile-out", metavar="PATH",
+                        help="export snapshot profil berkala ke CSV atau JSON (.json/.jsonl)")
+    parser.add_argument("--profile-interval", type=float, default=5.0, metavar="SEC",
+                        help="interval export snapshot profil (detik)")
+    parser.add_argument("--fps", type=float, default=60.0,
+                        help="batas frame rate window 3D; 0 = ikut vsync")
+    parser.add_argument("--target-fps", type=float, default=None, metavar="FPS",
+                        help="aktifkan kualitas adaptif: turunkan/naikkan resolusi deteksi, "
+                             "jumlah tangan, interval deteksi dan LOD mesh untuk menjaga FPS ini")
+    parser.add_argument("--max-latency", type=float, default=None, metavar="MS",
+                        help="kualitas adaptif juga turun kalau umur frame melebihi batas ini")
+    args = parser.parse_args(argv)
+    try:
+        if args.tracker:
+            create_tracker(args.tracker)
+        create_batch_tracker(args.landmark_tracker, 1)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def write_logs(sessions, path):
+    """Satu CSV per session; beberapa session → nama file diberi akhiran _<index>."""
+    for session in sessions:
+        if len(sessions) == 1:
+            session.log.write(path)
+        elif path == "-":
+            print(f"# {session.name}")
+            session.log.write(path)
+        else:
+            root, ext = os.path.splitext(path)
+            session.log.write(f"{root}_{session.index}{ext or '.csv'}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sources = args.source or ["0"]
+    models = args.model or ["models/mug.obj"]
+    n_sessions = len(sources)
+    workers = args.workers
+    if n_sessions > 1 and workers == 0:
+        # satu session per core; deteksi di thread utama tidak ikut skala
+        workers = min(n_sessions, os.cpu_count() or 1)
+        print(f"[Sessions] {n_sessions} sources -> {workers} detection workers")
+
+    # --max-speed: hanya jalur deteksi → filter → integrasi yang diukur
+    use_gl = not args.max_speed
+    preview = not (args.max_speed or args.no_preview)
+    log_path = args.log or ("-" if args.max_speed else None)
+
+    expected = ["first processed frame"] + (["first rendered frame"] if use_gl else [])
+    startup = StartupProfiler(_T0, expected=expected)
+    startup.record("imports", _T0, _T_IMPORTS)
 
     width = 1280
     height = 720
-    cx = width / 2.0
-    cy = height / 2.0
 
-    detector = HandDetector(detectionCon=0.8, maxHands=2)
-
-    rot_ctrl = HandTrackingController()
-    rot_ctrl.set_mode(3)
-
-    scale = 1.0
-    scale_alpha = 0.2
-    baseline_left_pos = None
-    last_baseline_time = time.time()
-    baseline_interval = 1.0
-
-    rot_x = 0.0
-    rot_y = 0.0
-
-    rot_dx_s = 0.0
-    rot_dy_s = 0.0
-
-    render_queue = queue.Queue()
-    cube = CubeRenderer(obj_path="models/mug.obj")
+    # ============ STARTUP PARALEL ============ #
+    # kamera, model deteksi, mesh dan context GL tidak saling bergantung
+    def open_camera(spec, index):
+        with startup.phase("camera" if n_sessions == 1 else f"camera {index}"):
+            # webcam dibaca di thread sendiri (selalu frame terbaru);
+            # file diputar real-time kecuali --max-speed
+            return open_source(spec, width, height,
+                               realtime=not args.max_speed, fps=args.source_fps)
+
+    def load_detector():
+        with startup.phase("detector"):
+            if workers > 0:
+                # deteksi paralel di proses lain, beberapa frame sekaligus (pipelined);
+                # slot shared memory seukuran frame terbesar
+                sizes = [f.result().frame_size for f in camera_futures]
+                w = max(size[0] for size in sizes)
+                h = max(size[1] for size in sizes)
+                pool = DetectionPool(
+                    workers,
+                    frame_shape=(h, w, 3),
+                    n_slots=workers + 1 + n_sessions,
+                    # frame dibagi round-robin ke worker (dan dari beberapa kamera),
+                    # jadi frame berturutan di satu worker tidak saling menyambung:
+                    # tracking mediapipe dimatikan, tiap frame dideteksi penuh
+                    detector_kwargs=dict(staticMode=True, detectionCon=0.8, maxHands=2),
+                )
+                return pool, None
+            from cvzone.HandTrackingModule import HandDetector
+            from src.controllers.detection_scheduler import DetectionScheduler
+
+            use_roi = not args.no_roi
+            # tracking mediapipe membawa region tangan dari gambar sebelumnya;
+            # crop ROI (posisi/ukuran berubah, diselingi rescan full frame) atau
+            # frame dari beberapa kamera tidak berada di koordinat yang sama,
+            # jadi tracking hanya untuk full frame dari satu kamera
+            static = use_roi or n_sessions > 1
+            detector = HandDetector(staticMode=static, detectionCon=0.8, maxHands=2)
+            # deteksi di ROI sekitar prediksi Kalman / lewati frame (lihat DetectionScheduler)
+            scheduler = DetectionScheduler(
+                detector,
+                detect_every=args.detect_every,
+                use_roi=use_roi,
+                min_score=0.8,
+                max_hands=2,
+            )
+            return None, scheduler
+
+    executor = ThreadPoolExecutor(max_workers=1 + n_sessions, thread_name_prefix="startup")
+    camera_futures = [executor.submit(open_camera, spec, i) for i, spec in enumerate(sources)]
+    detector_future = executor.submit(load_detector)
+    # ========================================= #
+
+    from src.controllers.gesture_session import GestureSession
+
+    # state gesture + state render terpisah per session
+    gestures = [
+        GestureSession(width, height, mode=args.mode, tracker=args.tracker,
+                       landmark_tracker=args.landmark_tracker)
+        for _ in range(n_sessions)
+    ]
+    # state terbaru vision → GL (tanpa lock, diekstrapolasi saat draw)
+    states = [StateSlot() for _ in range(n_sessions)]
+
+    recorder = TraceRecorder(args.record) if args.record else None
+
+    # profil per tahap; kalau tidak aktif semua pemanggilan langsung return
+    inst = Instrumentation(enabled=args.profile or args.hud or bool(args.profile_out))
+    exporter = SnapshotExporter(args.profile_out, args.profile_interval) if args.profile_out else None
+    # state UI yang diubah dari keyboard (window 3D maupun preview)
+    ui = {"hud": args.hud}
+    stop = threading.Event()
+
+    # redraw hanya kalau salah satu state berubah / masih diekstrapolasi, dibatasi --fps
+    render_sched = RenderScheduler(states, target_fps=args.fps or None)
 
     # ================= THREAD OPENGL ================= #
     def gl_thread():
-        from OpenGL.GLUT import (
-            glutInit, glutInitDisplayMode, glutInitWindowSize,
-            glutCreateWindow, glutDisplayFunc, glutIdleFunc, glutMainLoop,
-            glutKeyboardFunc,
-            GLUT_DOUBLE, GLUT_RGBA, GLUT_DEPTH
-        )
-
-        glutInit()
-        glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGBA | GLUT_DEPTH)
-        glutInitWindowSize(800, 600)
-        glutCreateWindow(b"3D Object")
-
-        cube.init_gl(800, 600)
+        # satu window + context untuk semua session, satu viewport per session
+        from src.rendering.viewports import ViewportGrid, grid_shape
+
+        cols, rows = grid_shape(n_sessions)
+        win_w, win_h = (800, 600) if n_sessions == 1 else (640 * cols, 480 * rows)
+
+        with startup.phase("gl context"):
+            from OpenGL.GLUT import (
+                glutInit, glutInitDisplayMode, glutInitWindowSize,
+                glutCreateWindow, glutDisplayFunc, glutTimerFunc, glutMainLoop,
+                glutKeyboardFunc, glutPostRedisplay, glutReshapeFunc, glutSetWindowTitle,
+                GLUT_DOUBLE, GLUT_RGBA, GLUT_DEPTH
+            )
+            from src.rendering.cube_renderer import CubeRenderer
+
+            glutInit()
+            glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGBA | GLUT_DEPTH)
+            glutInitWindowSize(win_w, win_h)
+            glutCreateWindow(b"3D Object")
+
+        # langsung gambar kubus fallback, model asli di-load di background lalu
+        # ditukar begitu siap; model yang sama cukup satu renderer
+        with startup.phase("gl upload"):
+            by_path = {}
+            for path in models:
+                if path not in by_path:
+                    # LOD dibangun hanya kalau kualitas adaptif boleh menurunkan detail mesh
+                    renderer = by_path[path] = CubeRenderer(obj_path=None, lod=quality is not None)
+                    if quality is not None:
+                        renderer.lod_bias = quality.settings["lod_bias"]
+                    renderer.init_gl(win_w, win_h)
+                    renderer.load_async(path)
+        renderers = [by_path[models[min(i, len(models) - 1)]] for i in range(n_sessions)]
+        unique = list(by_path.values())
+        gl_renderers.extend(unique)
+        grid = ViewportGrid(n_sessions, win_w, win_h)
+        title = [""]
+        if sys.stdin is not None and not sys.stdin.closed:
+            threading.Thread(target=command_thread, args=(unique,), name="commands", daemon=True).start()
 
         def display():
-            try:
-                rx, ry, sc = render_queue.get_nowait()
-                cube.update_state(rx, ry, sc)
-            except queue.Empty:
-                pass
-            cube.draw()
-            glutPostRedisplay()
+            # rotasi/scale diekstrapolasi ke waktu draw pakai velocity state terakhir
+            t0 = time.perf_counter()
+            t_draw = time.time()
+            seq = render_sched.seq()
+            grid.draw([(r, s.sample(t_draw)) for r, s in zip(renderers, states)])
+            render_sched.frame_drawn(seq)
+            startup.mark("first rendered frame")
+            if inst.enabled:
+                inst.record("render", time.perf_counter() - t0)
+                inst.record("age.state", max(t_draw - s.read()[1][0] for s in states))
+
+        def reshape(w, h):
+            grid.resize(w, h)
+            render_sched.invalidate()
+
+        def update_title():
+            loading = [
+                f"{os.path.basename(r.load_status['path'])} ({r.load_status['stage']})"
+                for r in unique if r.loading
+            ]
+            # tekstur di-decode / di-upload setelah mesh sudah tampil
+            loading += [
+                f"{os.path.basename(path)} ({stage})"
+                for r in unique for path, stage in r.texture_status()
+            ]
+            text = "3D Object"
+            if loading:
+                text += " - loading " + ", ".join(loading)
+            if text != title[0]:
+                title[0] = text
+                glutSetWindowTitle(text.encode("utf-8"))
+
+        def tick(_value):
+            # mesh baru yang siap ditukar / tekstur yang masih di-upload
+            # → gambar ulang walau state tidak berubah
+            if any(r.swap_ready or r.uploading for r in unique):
+                render_sched.invalidate()
+            update_title()
+            if render_sched.tick(time.time()):
+                glutPostRedisplay()
+            glutTimerFunc(render_sched.next_delay_ms(), tick, 0)
 
         def keyboard(key, x, y):
-            k = key.decode("utf-8")
-            if k == '1':
-                global_mode["mode"] = 1
-                print("Mode rotation: RAW")
-            elif k == '2':
-                global_mode["mode"] = 2
-                rot_ctrl.set_mode(2)
-                print("Mode rotation: SMOOTH")
-            elif k == '3':
-                global_mode["mode"] = 3
-                rot_ctrl.set_mode(3)
-                print("Mode rotation: KALMAN")
-            elif k == 'q' or ord(k) == 27:
-                print("Exit requested")
-                sys.exit(0)
+            handle_key(key.decode("utf-8", "ignore"))
 
         glutDisplayFunc(display)
-        glutIdleFunc(display)
+        glutReshapeFunc(reshape)
         glutKeyboardFunc(keyboard)
+        glutTimerFunc(0, tick, 0)
         glutMainLoop()
 
-    threading.Thread(target=gl_thread, daemon=True).start()
+    # ============ KUALITAS ADAPTIF ============ #
+    gl_renderers = []
+    quality = None
+    if args.target_fps:
+        from src.controllers.quality_controller import QualityController
+
+        def apply_quality(settings):
+            if scheduler is not None:
+                scheduler.detect_scale = settings["detect_scale"]
+                scheduler.max_hands = int(settings["max_hands"])
+                scheduler.detect_every = int(settings["detect_every"])
+            for renderer in gl_renderers:
+                renderer.lod_bias = int(settings["lod_bias"])
+
+        quality = QualityController(
+            args.target_fps,
+            max_latency=args.max_latency / 1000.0 if args.max_latency else None,
+            on_change=apply_quality,
+        )
+    # ========================================== #
+
+    # daftar model untuk tombol n/p: --model lalu semua OBJ di models/
+    catalogue = list(dict.fromkeys(models + sorted(glob.glob(os.path.join("models", "*.obj")))))
+
+    def switch_model(renderers, step):
+        for renderer in renderers:
+            current = renderer.load_status["path"] if renderer.load_status else renderer.obj_path
+            index = catalogue.index(current) if current in catalogue else -1
+            path = catalogue[(index + step) % len(catalogue)]
+            print(f"[Model] {current} -> {path}")
+            renderer.load_async(path)
+
+    def set_tracker(spec):
+        try:
+            for gesture in gestures:
+                gesture.set_tracker(spec)
+        except ValueError as e:
+            print(f"[Tracker] {e}")
+            return
+        print(f"Mode rotation: {gestures[0].mode_name}")
+
+    def command_thread(renderers):
+        # perintah operator lewat stdin: "load <obj>", "next", "prev", "models",
+        # "tracker <spec>", "trackers"
+        for line in sys.stdin:
+            cmd, _, arg = line.strip().partition(" ")
+            if cmd == "load" and arg:
+                for renderer in renderers:
+                    renderer.load_async(arg.strip())
+            elif cmd in ("next", "prev"):
+                switch_model(renderers, 1 if cmd == "next" else -1)
+            elif cmd == "models":
+                print("\n".join(catalogue))
+            elif cmd == "tracker" and arg:
+                set_tracker(arg.strip())
+            elif cmd == "trackers":
+                for name, spec in TRACKERS.items():
+                    params = ",".join(f"{k}={v}" for k, v in spec.params.items())
+                    print(f"{name:<14} {spec.description}" + (f" [{params}]" if params else ""))
+            elif cmd:
+                print("[Commands] load <obj>, next, prev, models, tracker <spec>, trackers")
+
+    def handle_key(k):
+        """Tombol dari window 3D atau preview (sama saja, preview boleh mati)."""
+        if k in ('1', '2', '3'):
+            for gesture in gestures:
+                gesture.set_mode(int(k))
+            print(f"Mode rotation: {gestures[0].mode_name}")
+        elif k == 't':
+            # tracker berikutnya di registry (raw = tombol 1)
+            names = [name for name in available_trackers() if name != "raw"]
+            current = gestures[0].tracker_name.partition(":")[0]
+            index = names.index(current) if current in names else -1
+            set_tracker(names[(index + 1) % len(names)])
+        elif k in ('n', 'p') and gl_renderers:
+            switch_model(gl_renderers, 1 if k == 'n' else -1)
+        elif k == 'h':
+            ui["hud"] = not ui["hud"]
+            inst.enabled = inst.enabled or ui["hud"]
+        elif k == 'q' or k == '\x1b':
+            print("Exit requested")
+            stop.set()
+
+    if use_gl:
+        threading.Thread(target=gl_thread, name="gl", daemon=True).start()
     # ================================================= #
 
-    while True:
-        ok, frame = cap.read()
-        if not ok:
-            break
-
-        img = cv2.flip(frame, 1)
-        hands, img = detector.findHands(img, flipType=False)
-
-        rot_vector = (0.0, 0.0)
-        now = time.time()
-        mode_rot = global_mode["mode"]
-
-        if hands:
-            hands = sorted(hands, key=lambda h: h['center'][0])
-
-            # kiri → rotasi
-            if len(hands) >= 1:
-                left = hands[0]
-                x_raw, y_raw = left['center']
-
-                if mode_rot == 1:          # RAW
-                    x_f, y_f = float(x_raw), float(y_raw)
-                else:
-                    x_f, y_f = rot_ctrl.process(float(x_raw), float(y_raw))
-
-                cv2.circle(img, (int(x_raw), int(y_raw)), 7, (0, 0, 255), -1)
-                cv2.circle(img, (int(x_f), int(y_f)), 7, (0, 255, 0), 2)
-
-                if mode_rot == 1:
-                    # RAW: pakai posisi absolut
-                    rot_vector = (x_f, y_f)
-                else:
-                    if baseline_left_pos is None:
-                        baseline_left_pos = (x_f, y_f)
-
-                    dx = x_f - baseline_left_pos[0]
-                    dy = y_f - baseline_left_pos[1]
-                    rot_vector = (dx, dy)
-
-                    cv2.circle(img,
-                               (int(baseline_left_pos[0]), int(baseline_left_pos[1])),
-                               7, (255, 0, 0), 2)
-                    cv2.line(img,
-                             (int(baseline_left_pos[0]), int(baseline_left_pos[1])),
-                             (int(x_f), int(y_f)),
-                             (255, 0, 0), 1)
-
-                    if now - last_baseline_time > baseline_interval:
-                        baseline_left_pos = (x_f, y_f)
-                        last_baseline_time = now
-
-            # kanan → scale
-            if len(hands) >= 2:
-                right = hands[1]
-                lmR = right['lmList']
-                x_thumb, y_thumb, _ = lmR[4]
-                x_idx, y_idx, _ = lmR[8]
-
-                dist = np.hypot(x_idx - x_thumb, y_idx - y_thumb)
-
-                # hanya batas bawah jarak (supaya tidak 0)
-                d_min = 30.0
-                d_clamped = max(d_min, dist)
-
-                # batas bawah skala
-                s_min = 0.5
-                # sensitivitas pembesaran (semakin besar, semakin cepat membesar)
-                k = 1.0 / (200.0 - d_min)
-
-                t = (d_clamped - d_min)
-                target_scale = s_min + k * t  # bisa > 2.0, tidak ada limit atas
-
-                if mode_rot == 1:
-                    # RAW: langsung
-                    scale = target_scale
-                else:
-                    # mode lain: smoothing
-                    scale = (1 - scale_alpha) * scale + scale_alpha * target_scale
-
-                cv2.line(img, (int(x_thumb), int(y_thumb)),
-                         (int(x_idx), int(y_idx)), (255, 0, 0), 2)
-                cv2.putText(img, f"dist={int(dist)} scale={scale:.2f}",
-                            (20, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.6,
-                            (0, 255, 255), 2)
-        else:
-            baseline_left_pos = None
-
-        # ========== mapping / integrasi rotasi ==========
-        dx, dy = rot_vector
-
-        if mode_rot == 1:
-            # RAW: perkuat jitter dekat tengah
-            x_norm = (dx - cx) / cx       # -1..1
-            y_norm = (dy - cy) / cy       # -1..1
-
-            jitter_gain = 180.0            # naikkan jika perlu
-            x_nonlin = np.sign(x_norm) * (abs(x_norm) ** 0.5)
-            y_nonlin = np.sign(y_norm) * (abs(y_norm) ** 0.5)
-
-            rot_x = -y_nonlin * jitter_gain
-            rot_y =  x_nonlin * jitter_gain
-        else:
-            alpha = 0.3
-            rot_dx_s = (1 - alpha) * rot_dx_s + alpha * dx
-            rot_dy_s = (1 - alpha) * rot_dy_s + alpha * dy
-
-            dead = 1.0
-            dx_eff = 0.0 if abs(rot_dx_s) < dead else rot_dx_s
-            dy_eff = 0.0 if abs(rot_dy_s) < dead else rot_dy_s
-            gain = 0.04
-
-            rot_x += -dy_eff * gain
-            rot_y +=  dx_eff * gain
-        # ================================================
-
-        if render_queue.empty():
-            render_queue.put((rot_x, rot_y, scale))
-
-        t_left = baseline_interval - (now - last_baseline_time)
-        mode_name = {1: "RAW", 2: "SMOOTH", 3: "KALMAN"}.get(mode_rot, "UNK")
-
-        cv2.putText(img,
-                    f"Rot vec: ({rot_vector[0]:.1f},{rot_vector[1]:.1f}) | Reset in {t_left:.1f}s",
-                    (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.6,
-                    (255, 255, 255), 2)
-
-        cv2.putText(img,
-                    f"rot_x={rot_x:.2f} rot_y={rot_y:.2f} scale={scale:.2f} mode={mode_name}",
-                    (20, 110), cv2.FONT_HERSHEY_SIMPLEX, 0.6,
-                    (0, 255, 0), 2)
-
-        cv2.putText(img,
-                    "Left: rotation (1=RAW,2=Smooth,3=Kalman)  |  Right: scale",
-                    (20, img.shape[0] - 30), cv2.FONT_HERSHEY_SIMPLEX,
-                    0.6, (200, 200, 200), 2)
-
-        cv2.imshow("Two-Hand Control (Rotation + Scale)", img)
-
-        if cv2.waitKey(1) == 27:
-            break
-
-    cap.release()
-    cv2.destroyAllWindows()
+    from src.controllers.detection_scheduler import draw_hands
+    from src.controllers.session_pool import Session, SessionPool
+
+    pool, scheduler = detector_future.result()
+    sessions = []
+    for i, (future, gesture, state) in enumerate(zip(camera_futures, gestures, states)):
+        source = future.result()
+        gesture.set_frame_size(*source.frame_size)
+        name = "camera" if n_sessions == 1 else f"session {i} ({sources[i]})"
+        sessions.append(Session(i, source, gesture, state, name=name,
+                                scheduler=scheduler, log=RunLog()))
+    executor.shutdown(wait=False)
+    session_pool = SessionPool(sessions, pool)
+    previews = []
+    if preview:
+        from src.diagnostics.preview import PreviewWindow
+
+        for session in sessions:
+            title = "Two-Hand Control (Rotation + Scale)"
+            if n_sessions > 1:
+                title += f" - {session.name}"
+            previews.append(PreviewWindow(title, args.preview_scale, args.preview_hz))
+    if quality is not None:
+        if pool is not None:
+            print("[Quality] detection runs in worker processes: only mesh LOD is adapted")
+        quality.apply()
+
+    try:
+        while not session_pool.finished:
+            inst.begin()
+            t_iter = time.perf_counter()
+            wait_before = session_pool.wait_time
+            latency = None
+            processed = 0
+            sent = session_pool.feed(inst)
+            # tunggu hanya kalau semua worker sudah punya pekerjaan / tidak ada frame baru
+            block = pool is not None and (sent == 0 or pool.in_flight > workers)
+            for session, seq, now, hands, img, slot in session_pool.collect(block):
+                if slot is not None:
+                    inst.lap("detect")
+                if hands:
+                    hands = sorted(hands, key=lambda h: h['center'][0])
+
+                if recorder is not None and session.index == 0:
+                    recorder.record(hands, now)
+
+                gesture = session.gesture
+                rot_x, rot_y, scale = gesture.update(hands, now)
+                inst.lap("gesture")
+
+                session.state.publish(now, rot_x, rot_y, scale, velocity=gesture.velocity)
+                session.log.append(seq, now, len(hands), rot_x, rot_y, scale)
+
+                # overlay di buffer preview kecil yang dipakai ulang, hanya kalau jatuh tempo
+                window = previews[session.index] if preview else None
+                if window is not None and window.due():
+                    buf = window.prepare(img)
+                    draw_hands(buf, hands, window.scale)
+                    gesture.draw(buf, window.scale)
+                    if ui["hud"]:
+                        inst.draw_hud(buf)
+                    key = window.show(buf)
+                    if key != -1:
+                        handle_key(chr(key & 0xFF))
+                    inst.lap("overlay")
+
+                startup.mark("first processed frame")
+                session_pool.release(slot)
+                processed += 1
+                # timestamp file tanpa real-time = waktu video, bukan umur frame
+                if not args.max_speed:
+                    latency = max(latency or 0.0, time.time() - now)
+
+            if stop.is_set():
+                break
+
+            if exporter is not None:
+                exporter.maybe_export(inst)
+            if quality is not None and processed:
+                t_end = time.perf_counter()
+                busy = (t_end - t_iter) - (session_pool.wait_time - wait_before)
+                quality.update(t_end, busy, latency)
+    except KeyboardInterrupt:
+        pass
+    except DetectionWorkerError as e:
+        # hasil worker yang mati tidak akan datang; tutup rapi daripada menunggu selamanya
+        print(f"[DetectionPool] {e}")
+    for session in sessions:
+        session.log.finish()
+
+    if recorder is not None:
+        recorder.close()
+    if inst.enabled:
+        for name, summary in inst.snapshot().items():
+            print(f"[Profile] {name}: {summary}")
+    if exporter is not None:
+        exporter.close(inst)
+    for session in sessions:
+        print(f"[Capture] {session.name}: {session.source.stats()}")
+    if use_gl:
+        print(f"[Render] {render_sched.stats()}")
+    if quality is not None:
+        print(f"[Quality] {quality.stats()}")
+    if pool is not None:
+        print(f"[DetectionPool] {pool.stats()}")
+        pool.close()
+    else:
+        print(f"[Detection] {scheduler.stats()}")
+    for session in sessions:
+        session.source.release()
+    if previews:
+        import cv2
+
+        print(f"[Preview] {previews[0].stats()}")
+        cv2.destroyAllWindows()
+
+    if log_path is not None:
+        write_logs(sessions, log_path)
+    for session in sessions:
+        summary = session.log.summary()
+        print(summary if n_sessions == 1 else f"{summary} [{session.name}]")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,10 @@
+from .threaded_capture import Frame, LatestFrameCapture
+from .frame_source import ImageDirSource, VideoFileSource, open_source
+
+__all__ = [
+    'Frame',
+    'LatestFrameCapture',
+    'ImageDirSource',
+    'VideoFileSource',
+    'open_source',
+]
@@ -0,0 +1,141 @@
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .threaded_capture import Frame, LatestFrameCapture
+
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".webp")
+
+
+class _FileSource(ABC):
+    """
+    Sumber frame dari file: frame dibaca berurutan tanpa ada yang dibuang.
+    Timestamp = index / fps (waktu video, bukan jam dinding), jadi hasil
+    tracker sama persis di tiap run berapa pun kecepatan prosesnya.
+
+    realtime=True → read() menunggu sampai waktu frame itu (seperti kamera),
+    timestamp digeser ke jam dinding supaya cocok dengan renderer.
+    """
+
+    def __init__(self, fps: float, realtime: bool = False):
+        self.fps = fps if fps and fps > 0 else 30.0
+        self.realtime = realtime
+        self.frame_size: Tuple[int, int] = (0, 0)
+        self._t0: Optional[float] = None
+        self.delivered = 0
+        self.last_age = 0.0
+        # True setelah frame terakhir (read() None hanya di akhir file)
+        self.eof = False
+
+    @abstractmethod
+    def _grab(self) -> Optional[np.ndarray]:
+        # frame berikutnya (BGR), None = habis
+        pass
+
+    def read(self, timeout: float = 1.0) -> Optional[Frame]:
+        image = self._grab()
+        if image is None:
+            self.eof = True
+            return None
+        t = self.delivered / self.fps
+        if self.realtime:
+            if self._t0 is None:
+                self._t0 = time.time()
+            t += self._t0
+            delay = t - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            self.last_age = max(0.0, time.time() - t)
+        self.delivered += 1
+        return Frame(self.delivered, t, image)
+
+    def stats(self) -> dict:
+        return {"delivered": self.delivered, "fps": self.fps, "realtime": self.realtime}
+
+    def release(self) -> None:
+        pass
+
+
+class VideoFileSource(_FileSource):
+    def __init__(self, path: str, realtime: bool = False, fps: Optional[float] = None):
+        import cv2
+
+        self.path = path
+        self.cap = cv2.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise IOError(f"cannot open video: {path}")
+        super().__init__(fps or self.cap.get(cv2.CAP_PROP_FPS), realtime)
+        self.frame_size = (
+            int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        )
+        self._buffer: Optional[np.ndarray] = None
+
+    def _grab(self) -> Optional[np.ndarray]:
+        # frame dipakai caller sampai read() berikutnya → buffer boleh dipakai ulang
+        ok, img = self.cap.read(self._buffer)
+        if not ok:
+            return None
+        self._buffer = img
+        return img
+
+    def release(self) -> None:
+        self.cap.release()
+
+
+class ImageDirSource(_FileSource):
+    def __init__(self, path: str, realtime: bool = False, fps: float = 30.0):
+        import cv2
+
+        self._imread = cv2.imread
+        self.path = path
+        self.files: List[str] = sorted(
+            os.path.join(path, name) for name in os.listdir(path)
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        if not self.files:
+            raise IOError(f"no images in directory: {path}")
+        super().__init__(fps, realtime)
+        first = self._imread(self.files[0])
+        self.frame_size = (first.shape[1], first.shape[0])
+
+    def _grab(self) -> Optional[np.ndarray]:
+        while self.delivered < len(self.files):
+            img = self._imread(self.files[self.delivered])
+            if img is not None:
+                return img
+            print(f"[ImageDirSource] skip unreadable {self.files[self.delivered]}")
+            del self.files[self.delivered]
+        return None
+
+
+def open_source(spec: str, width: int = 1280, height: int = 720,
+                realtime: bool = True, fps: Optional[float] = None):
+    """
+    "0", "1", ... → webcam (LatestFrameCapture, frame lama dibuang),
+    direktori → ImageDirSource, selain itu → VideoFileSource.
+    Semua punya read(timeout) / stats() / release() / last_age / frame_size / eof.
+    """
+    if spec.isdigit():
+        import cv2
+
+        cap = cv2.VideoCapture(int(spec))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        # kamera boleh memberi resolusi lain dari yang diminta; slot shared
+        # memory dan center RAW harus ikut ukuran yang benar-benar dikirim
+        size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        if size[0] <= 0 or size[1] <= 0:
+            # backend yang belum tahu ukurannya sebelum frame pertama
+            ok, img = cap.read()
+            size = (img.shape[1], img.shape[0]) if ok else (width, height)
+        if size != (width, height):
+            print(f"[Capture] camera {spec}: requested {width}x{height}, got {size[0]}x{size[1]}")
+        return LatestFrameCapture(cap, frame_size=size).start()
+    if os.path.isdir(spec):
+        return ImageDirSource(spec, realtime=realtime, fps=fps or 30.0)
+    return VideoFileSource(spec, realtime=realtime, fps=fps)
@@ -0,0 +1,151 @@
+import threading
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+class Frame:
+    def __init__(self, seq: int, t: float, image: np.ndarray):
+        self.seq = seq          # nomor urut frame dari kamera (mulai 1)
+        self.t = t              # waktu capture (time.time())
+        self.image = image
+
+
+class LatestFrameCapture:
+    """
+    Baca kamera di thread sendiri. Ring buffer kecil (tanpa copy): satu slot
+    dipegang consumer, satu slot frame terbaru, sisanya ditulis thread capture.
+    read() selalu mengembalikan frame terbaru; frame yang sudah digantikan
+    sebelum sempat dibaca dibuang dan dihitung di `dropped`. read() yang
+    timeout (kamera lambat / tersendat) juga None, tapi `eof` tetap False:
+    hanya `eof` yang berarti kamera benar-benar berhenti.
+    """
+
+    def __init__(self, cap, ring_size: int = 3, stall_threshold: float = 0.2,
+                 frame_size: Tuple[int, int] = (0, 0)):
+        if ring_size < 3:
+            raise ValueError("ring_size must be >= 3")
+        self.cap = cap
+        # (width, height) frame yang dikirim kamera
+        self.frame_size = frame_size
+        self.stall_threshold = stall_threshold
+
+        self._buffers: List[Optional[np.ndarray]] = [None] * ring_size
+        self._seq = [0] * ring_size
+        self._t = [0.0] * ring_size
+        self._latest: Optional[int] = None    # slot frame terbaru
+        self._in_use: Optional[int] = None    # slot yang sedang dipakai consumer
+        self._last_read_seq = 0
+        self._cond = threading.Condition()
+        self._running = False
+        self._eof = False
+        self._thread: Optional[threading.Thread] = None
+
+        # metrik
+        self.captured = 0
+        self.delivered = 0
+        self.dropped = 0
+        # stalls: gap antar frame kamera > stall_threshold (dihitung sekali, di
+        # thread capture); timeouts: read() yang kembali tanpa frame baru
+        self.stalls = 0
+        self.timeouts = 0
+        self.max_gap = 0.0
+        self.last_age = 0.0
+
+    def start(self) -> "LatestFrameCapture":
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, name="capture", daemon=True)
+        self._thread.start()
+        return self
+
+    @property
+    def eof(self) -> bool:
+        """Kamera habis / gagal dibaca atau capture sudah dihentikan."""
+        return self._eof or not self._running
+
+    def _free_slot(self) -> int:
+        for i in range(len(self._buffers)):
+            if i != self._latest and i != self._in_use:
+                return i
+        raise RuntimeError("no free capture slot")
+
+    def _loop(self) -> None:
+        last_t = None
+        while self._running:
+            with self._cond:
+                slot = self._free_slot()
+            # cap.read(buffer) menulis ulang buffer slot yang sama (tanpa alokasi)
+            ok, img = self.cap.read(self._buffers[slot])
+            t = time.time()
+            if not ok:
+                with self._cond:
+                    self._eof = True
+                    self._cond.notify_all()
+                break
+
+            if last_t is not None:
+                gap = t - last_t
+                self.max_gap = max(self.max_gap, gap)
+                if gap > self.stall_threshold:
+                    self.stalls += 1
+            last_t = t
+
+            with self._cond:
+                self.captured += 1
+                if self._latest is not None and self._seq[self._latest] > self._last_read_seq:
+                    # frame terbaru sebelumnya belum sempat dibaca → dibuang
+                    self.dropped += 1
+                self._buffers[slot] = img
+                self._seq[slot] = self.captured
+                self._t[slot] = t
+                self._latest = slot
+                self._cond.notify_all()
+
+    def read(self, timeout: float = 1.0) -> Optional[Frame]:
+        """
+        Frame terbaru yang belum pernah dibaca. None kalau kamera habis (eof)
+        atau belum ada frame baru dalam timeout (dihitung di `timeouts`).
+        """
+        deadline = time.time() + timeout
+        with self._cond:
+            while self._latest is None or self._seq[self._latest] <= self._last_read_seq:
+                if self._eof or not self._running:
+                    return None
+                remaining = deadline - time.time()
+                if remaining <= 0 or not self._cond.wait(remaining):
+                    if self._latest is None or self._seq[self._latest] <= self._last_read_seq:
+                        if not self._eof and self._running:
+                            # stall kamera sendiri dihitung thread capture (gap)
+                            self.timeouts += 1
+                        return None
+            # slot lama dilepas, slot terbaru dipegang consumer
+            slot = self._latest
+            self._in_use = slot
+            self._last_read_seq = self._seq[slot]
+            self.delivered += 1
+            frame = Frame(self._seq[slot], self._t[slot], self._buffers[slot])
+        self.last_age = time.time() - frame.t
+        return frame
+
+    def stats(self) -> dict:
+        return {
+            "captured": self.captured,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "stalls": self.stalls,
+            "timeouts": self.timeouts,
+            "max_gap_ms": self.max_gap * 1000.0,
+            "last_age_ms": self.last_age * 1000.0,
+        }
+
+    def stop(self) -> None:
+        self._running = False
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+    def release(self) -> None:
+        self.stop()
+        self.cap.release()
@@ -0,0 +1,185 @@
+import multiprocessing as mp
+import queue
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class DetectionWorkerError(RuntimeError):
+    """Proses worker mati; tiket yang sedang dikerjakannya tidak akan kembali."""
+
+
+def _plain_hands(hands) -> List[dict]:
+    """Hand dict → tipe Python biasa (kecil, murah di-pickle lewat queue)."""
+    out = []
+    for hand in hands:
+        out.append({
+            'lmList': [[int(v) for v in lm] for lm in hand['lmList']],
+            'bbox': tuple(int(v) for v in hand['bbox']),
+            'center': tuple(int(v) for v in hand['center']),
+            'type': hand.get('type'),
+        })
+    return out
+
+
+def _worker_main(shm_name: str, shape: Tuple[int, ...], n_slots: int,
+                 tasks, results, detector_kwargs: dict) -> None:
+    # import berat hanya di proses worker
+    from cvzone.HandTrackingModule import HandDetector
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frames = np.ndarray((n_slots,) + shape, dtype=np.uint8, buffer=shm.buf)
+    detector = HandDetector(**detector_kwargs)
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            slot, ticket, t, h, w = task
+            try:
+                result = detector.findHands(frames[slot, :h, :w], draw=False, flipType=False)
+                hands = _plain_hands(result[0] if isinstance(result, tuple) else result)
+            except Exception as e:
+                # satu frame gagal → hasil kosong, tiket tetap kembali supaya urutan tidak macet
+                print(f"[DetectionPool] worker error on ticket {ticket}: {e}")
+                hands = []
+            results.put((ticket, slot, t, hands))
+    finally:
+        del frames
+        shm.close()
+
+
+class DetectionPool:
+    """
+    HandDetector di beberapa proses worker. Frame dikirim lewat ring buffer
+    shared memory yang sudah dialokasikan (tanpa pickle frame), hasil
+    dikeluarkan sesuai urutan submit (boleh dari beberapa sumber sekaligus,
+    seq tiap sumber tidak harus unik).
+
+    Alur di main loop:
+        slot = pool.acquire()            # buffer frame kosong (None = penuh)
+        cv2.flip(frame, 1, dst=pool.buffer(slot, h, w))
+        pool.submit(slot, seq, t)
+        done = pool.get(block=...)       # (seq, t, hands, slot) urut submit
+        ... pakai pool.frame(slot) untuk overlay ...
+        pool.release(slot)
+    """
+
+    def __init__(self, n_workers: int = 2, frame_shape: Tuple[int, int, int] = (720, 1280, 3),
+                 n_slots: Optional[int] = None, detector_kwargs: Optional[dict] = None):
+        self.n_workers = n_workers
+        self.frame_shape = tuple(frame_shape)
+        # tiap worker 1 frame + 1 frame menunggu + 1 frame dipakai main untuk overlay
+        self.n_slots = n_slots or n_workers + 2
+        nbytes = int(np.prod(self.frame_shape)) * self.n_slots
+
+        self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._frames = np.ndarray((self.n_slots,) + self.frame_shape, dtype=np.uint8, buffer=self._shm.buf)
+        self._free = list(range(self.n_slots))
+        self._shapes: Dict[int, Tuple[int, int]] = {}
+
+        ctx = mp.get_context("spawn")
+        self._tasks = ctx.Queue()
+        self._results = ctx.Queue()
+        self._workers = [
+            ctx.Process(
+                target=_worker_main,
+                args=(self._shm.name, self.frame_shape, self.n_slots,
+                      self._tasks, self._results, detector_kwargs or {}),
+                daemon=True,
+            )
+            for _ in range(n_workers)
+        ]
+        for p in self._workers:
+            p.start()
+
+        # nomor tiket (urutan submit) yang belum dikeluarkan, seq aslinya,
+        # dan hasil yang datang duluan
+        self._pending: List[int] = []
+        self._seqs: Dict[int, int] = {}
+        self._done: Dict[int, tuple] = {}
+        self._ticket = 0
+
+        self.submitted = 0
+        self.dropped = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    @property
+    def free_slots(self) -> int:
+        return len(self._free)
+
+    def acquire(self) -> Optional[int]:
+        if not self._free:
+            self.dropped += 1
+            return None
+        return self._free.pop()
+
+    def frame(self, slot: int) -> np.ndarray:
+        h, w = self._shapes.get(slot, self.frame_shape[:2])
+        return self._frames[slot, :h, :w]
+
+    def buffer(self, slot: int, height: int, width: int) -> np.ndarray:
+        """View writable slot dengan ukuran frame (<= frame_shape)."""
+        self._shapes[slot] = (height, width)
+        return self._frames[slot, :height, :width]
+
+    def submit(self, slot: int, seq: int, t: float) -> None:
+        h, w = self._shapes.get(slot, self.frame_shape[:2])
+        ticket = self._ticket
+        self._ticket += 1
+        self._pending.append(ticket)
+        self._seqs[ticket] = seq
+        self._tasks.put((slot, ticket, t, h, w))
+        self.submitted += 1
+
+    def release(self, slot: int) -> None:
+        self._free.append(slot)
+
+    def get(self, block: bool = False, timeout: float = 1.0) -> Optional[tuple]:
+        """
+        Hasil berikutnya sesuai urutan submit: (seq, t, hands, slot) atau None.
+        DetectionWorkerError kalau ada worker yang mati (hasilnya tidak akan datang).
+        """
+        if not self._pending:
+            return None
+        while self._pending[0] not in self._done:
+            try:
+                ticket, slot, t, hands = self._results.get(block=block, timeout=timeout if block else None)
+            except queue.Empty:
+                if block:
+                    self.check_workers()
+                return None
+            self._done[ticket] = (self._seqs.pop(ticket), t, hands, slot)
+        return self._done.pop(self._pending.pop(0))
+
+    def check_workers(self) -> None:
+        dead = [p for p in self._workers if not p.is_alive()]
+        if dead:
+            codes = ", ".join(str(p.exitcode) for p in dead)
+            raise DetectionWorkerError(
+                f"{len(dead)} detection worker(s) died (exit code {codes}), "
+                f"{self.in_flight} frame(s) lost"
+            )
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.n_workers,
+            "submitted": self.submitted,
+            "dropped": self.dropped,
+            "in_flight": self.in_flight,
+        }
+
+    def close(self) -> None:
+        for _ in self._workers:
+            self._tasks.put(None)
+        for p in self._workers:
+            p.join(timeout=2.0)
+            if p.is_alive():
+                p.terminate()
+        del self._frames
+        self._shm.close()
+        self._shm.unlink()
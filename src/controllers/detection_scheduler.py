@@ -0,0 +1,257 @@
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from ..numerical_methods import KalmanFilterTracker
+
+
+class _HandTrack:
+    """Satu tangan yang sedang diikuti: Kalman untuk center + hasil deteksi terakhir."""
+
+    def __init__(self, hand: dict, t: float):
+        self.kalman = KalmanFilterTracker(fast=True)
+        self.kalman.apply(float(hand['center'][0]), float(hand['center'][1]), t)
+        self.hand = hand
+        self.t = t
+
+    def update(self, hand: dict, t: float) -> None:
+        self.kalman.apply(float(hand['center'][0]), float(hand['center'][1]), t)
+        self.hand = hand
+        self.t = t
+
+    def predict_center(self, t: float) -> Tuple[float, float]:
+        # posisi Kalman + velocity (px/frame) * jumlah frame sejak update terakhir
+        k = self.kalman
+        dt = (t - self.t) / k.frame_period
+        x, y = k.get_position()
+        vx, vy = k.get_velocity()
+        return x + vx * dt, y + vy * dt
+
+    def predicted_hand(self, t: float) -> dict:
+        """Hasil deteksi terakhir digeser ke posisi prediksi."""
+        px, py = self.predict_center(t)
+        cx, cy = self.hand['center']
+        dx, dy = int(round(px - cx)), int(round(py - cy))
+        x, y, w, h = self.hand['bbox']
+        hand = dict(self.hand)
+        hand['lmList'] = [[lx + dx, ly + dy] + list(rest) for lx, ly, *rest in self.hand['lmList']]
+        hand['bbox'] = (x + dx, y + dy, w, h)
+        hand['center'] = (cx + dx, cy + dy)
+        hand['predicted'] = True
+        return hand
+
+
+class DetectionScheduler:
+    """
+    Bungkus HandDetector supaya tidak selalu jalan full-frame:
+    - ROI: deteksi hanya di crop (diperkecil) sekitar posisi prediksi Kalman,
+      fallback ke full frame kalau jumlah tangan / confidence turun.
+    - detect_every=N: deteksi hanya tiap N frame, frame di antaranya diisi
+      prediksi tracker (posisi + velocity).
+    - detect_scale < 1: frame (dan batas sisi ROI) diperkecil sebelum deteksi.
+    detect_every / detect_scale / max_hands boleh diubah saat jalan
+    (lihat QualityController).
+    """
+
+    def __init__(
+        self,
+        detector,
+        detect_every: int = 1,
+        use_roi: bool = True,
+        roi_margin: float = 0.5,
+        roi_max_side: int = 384,
+        min_score: float = 0.8,
+        max_hands: int = 2,
+        rescan_interval: int = 15,
+        detect_scale: float = 1.0,
+    ):
+        self.detector = detector
+        self.detect_every = max(1, detect_every)
+        self.use_roi = use_roi
+        self.roi_margin = roi_margin
+        self.roi_max_side = roi_max_side
+        self.min_score = min_score
+        self.max_hands = max_hands
+        self.detect_scale = detect_scale
+        # selama tangan yang diikuti < max_hands, full frame tiap sekian deteksi
+        # supaya tangan baru di luar ROI tetap ketemu
+        self.rescan_interval = rescan_interval
+        self._since_full = 0
+
+        self.tracks: List[_HandTrack] = []
+        self.frame_index = 0
+        self.last_roi: Optional[Tuple[int, int, int, int]] = None
+
+        # statistik
+        self.full_detections = 0
+        self.roi_detections = 0
+        self.predicted_frames = 0
+        self.detected_pixels = 0
+
+    # ---------------- deteksi ---------------- #
+
+    def _run_detector(self, img: np.ndarray) -> Tuple[List[dict], List[float]]:
+        result = self.detector.findHands(img, draw=False, flipType=False)
+        hands = result[0] if isinstance(result, tuple) else result
+        scores = []
+        res = getattr(self.detector, "results", None)
+        handedness = getattr(res, "multi_handedness", None) or []
+        for i in range(len(hands)):
+            scores.append(handedness[i].classification[0].score if i < len(handedness) else 1.0)
+        self.detected_pixels += img.shape[0] * img.shape[1]
+        return hands, scores
+
+    def _roi(self, t: float, width: int, height: int) -> Optional[Tuple[int, int, int, int]]:
+        """Gabungan bbox prediksi semua track, diperlebar roi_margin."""
+        if not self.tracks:
+            return None
+        x0, y0, x1, y1 = width, height, 0, 0
+        for track in self.tracks:
+            hand = track.predicted_hand(t)
+            bx, by, bw, bh = hand['bbox']
+            mx, my = bw * self.roi_margin, bh * self.roi_margin
+            x0 = min(x0, bx - mx)
+            y0 = min(y0, by - my)
+            x1 = max(x1, bx + bw + mx)
+            y1 = max(y1, by + bh + my)
+        x0, y0 = max(0, int(x0)), max(0, int(y0))
+        x1, y1 = min(width, int(x1)), min(height, int(y1))
+        if x1 - x0 < 32 or y1 - y0 < 32:
+            return None
+        return x0, y0, x1, y1
+
+    @staticmethod
+    def _to_full_frame(hand: dict, x0: int, y0: int, s: float) -> dict:
+        """Koordinat hasil deteksi di crop (skala s) → koordinat frame penuh."""
+        inv = 1.0 / s
+        out = dict(hand)
+        out['lmList'] = [
+            [int(lx * inv + x0), int(ly * inv + y0)] + [int(v * inv) for v in rest]
+            for lx, ly, *rest in hand['lmList']
+        ]
+        bx, by, bw, bh = hand['bbox']
+        out['bbox'] = (int(bx * inv + x0), int(by * inv + y0), int(bw * inv), int(bh * inv))
+        cx, cy = hand['center']
+        out['center'] = (int(cx * inv + x0), int(cy * inv + y0))
+        return out
+
+    def _detect_roi(self, img: np.ndarray, t: float) -> Optional[List[dict]]:
+        h, w = img.shape[:2]
+        roi = self._roi(t, w, h)
+        if roi is None:
+            return None
+        x0, y0, x1, y1 = roi
+        crop = img[y0:y1, x0:x1]
+        s = min(1.0, self.roi_max_side * self.detect_scale / float(max(x1 - x0, y1 - y0)))
+        if s < 1.0:
+            crop = cv2.resize(crop, None, fx=s, fy=s, interpolation=cv2.INTER_AREA)
+
+        hands, scores = self._run_detector(crop)
+        self.roi_detections += 1
+        self.last_roi = roi
+        # kurang tangan dari yang diikuti atau confidence rendah → perlu full frame
+        if len(hands) < len(self.tracks) or any(sc < self.min_score for sc in scores):
+            return None
+        return [self._to_full_frame(hand, x0, y0, s) for hand in hands]
+
+    def _detect_full(self, img: np.ndarray) -> List[dict]:
+        s = self.detect_scale
+        if s < 1.0:
+            small = cv2.resize(img, None, fx=s, fy=s, interpolation=cv2.INTER_AREA)
+            hands, _ = self._run_detector(small)
+            hands = [self._to_full_frame(hand, 0, 0, s) for hand in hands]
+        else:
+            hands, _ = self._run_detector(img)
+        self.full_detections += 1
+        self._since_full = 0
+        self.last_roi = None
+        return hands
+
+    # ---------------- tracking ---------------- #
+
+    def _update_tracks(self, hands: List[dict], t: float) -> None:
+        """Cocokkan hasil deteksi ke track terdekat (maks. 2 tangan, greedy cukup)."""
+        remaining = list(self.tracks)
+        new_tracks: List[_HandTrack] = []
+        for hand in hands[:self.max_hands]:
+            cx, cy = hand['center']
+            best = None
+            best_d = np.inf
+            for track in remaining:
+                px, py = track.predict_center(t)
+                d = (px - cx) ** 2 + (py - cy) ** 2
+                if d < best_d:
+                    best, best_d = track, d
+            if best is not None:
+                remaining.remove(best)
+                best.update(hand, t)
+                new_tracks.append(best)
+            else:
+                new_tracks.append(_HandTrack(hand, t))
+        self.tracks = new_tracks
+
+    def detect(self, img: np.ndarray, t: float) -> List[dict]:
+        """Pengganti detector.findHands: list hand dict dalam koordinat frame penuh."""
+        index = self.frame_index
+        self.frame_index += 1
+
+        if self.tracks and index % self.detect_every != 0:
+            self.predicted_frames += 1
+            return [track.predicted_hand(t) for track in self.tracks]
+
+        hands = None
+        self._since_full += 1
+        rescan = len(self.tracks) < self.max_hands and self._since_full >= self.rescan_interval
+        if self.use_roi and self.tracks and not rescan:
+            hands = self._detect_roi(img, t)
+        if hands is None:
+            hands = self._detect_full(img)
+
+        hands = hands[:self.max_hands]
+        self._update_tracks(hands, t)
+        return hands
+
+    def stats(self) -> dict:
+        frames = max(1, self.frame_index)
+        return {
+            "frames": self.frame_index,
+            "full_detections": self.full_detections,
+            "roi_detections": self.roi_detections,
+            "predicted_frames": self.predicted_frames,
+            "detected_megapixels_per_frame": self.detected_pixels / frames / 1e6,
+        }
+
+
+_MIRROR_TYPE = {'Left': 'Right', 'Right': 'Left'}
+
+
+def mirror_hands(hands: List[dict], width: int) -> List[dict]:
+    """
+    Hasil deteksi di frame asli → koordinat frame yang dicerminkan
+    horizontal (tampilan selfie), tanpa perlu cv2.flip seluruh frame.
+    """
+    out = []
+    for hand in hands:
+        m = dict(hand)
+        m['lmList'] = [[width - 1 - lx] + list(rest) for lx, *rest in hand['lmList']]
+        bx, by, bw, bh = hand['bbox']
+        m['bbox'] = (width - bx - bw, by, bw, bh)
+        cx, cy = hand['center']
+        m['center'] = (width - 1 - cx, cy)
+        if hand.get('type') in _MIRROR_TYPE:
+            m['type'] = _MIRROR_TYPE[hand['type']]
+        out.append(m)
+    return out
+
+
+def draw_hands(img: np.ndarray, hands: List[dict], scale: float = 1.0) -> None:
+    """Gambar landmark & bbox (pengganti gambar bawaan findHands); scale = ukuran img / frame."""
+    for hand in hands:
+        color = (0, 200, 255) if hand.get('predicted') else (255, 0, 255)
+        for lm in hand['lmList']:
+            cv2.circle(img, (int(lm[0] * scale), int(lm[1] * scale)), 3, color, cv2.FILLED)
+        x, y, w, h = hand['bbox']
+        pad = 20 * scale
+        cv2.rectangle(img, (int(x * scale - pad), int(y * scale - pad)),
+                      (int((x + w) * scale + pad), int((y + h) * scale + pad)), color, 2)
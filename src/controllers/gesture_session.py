@@ -0,0 +1,241 @@
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .hand_controller import (
+    MODE_KALMAN, MODE_RAW, MODE_SMOOTH, MODE_TRACKER, HandTrackingController,
+)
+
+
+MODE_NAMES = {MODE_RAW: "RAW", MODE_SMOOTH: "SMOOTH", MODE_KALMAN: "KALMAN"}
+
+
+class GestureSession:
+    """
+    Logika gesture per frame (dulu di loop main.py): tangan kiri → rotasi
+    (relatif terhadap baseline yang di-reset tiap baseline_interval), tangan
+    kanan → scale dari jarak jempol-telunjuk.
+
+    update() hanya menghitung state; overlay preview digambar terpisah lewat
+    draw(), jadi bisa dilewati kalau preview mati.
+    """
+
+    def __init__(self, width: int = 1280, height: int = 720, mode: int = MODE_KALMAN,
+                 baseline_interval: float = 1.0, tracker: str | None = None,
+                 landmark_tracker: str = "kalman"):
+        self.cx = width / 2.0
+        self.cy = height / 2.0
+
+        # tracker (nama di registry) menggantikan preset mode 2/3
+        self.rot_ctrl = HandTrackingController(landmark_tracker=landmark_tracker)
+        self.mode = MODE_KALMAN
+        self.set_mode(mode)
+        if tracker is not None:
+            self.set_tracker(tracker)
+
+        self.scale = 1.0
+        self.scale_alpha = 0.2
+        self.baseline_left_pos: Optional[Tuple[float, float]] = None
+        # diisi waktu frame pertama (bukan jam dinding) supaya replay file reproducible
+        self.last_baseline_time: Optional[float] = None
+        self.baseline_interval = baseline_interval
+
+        self.rot_x = 0.0
+        self.rot_y = 0.0
+        self.rot_dx_s = 0.0
+        self.rot_dy_s = 0.0
+        self.rot_vector = (0.0, 0.0)
+        self.now = 0.0
+
+        # data overlay frame terakhir (lihat draw)
+        self._raw: Optional[Tuple[float, float]] = None
+        self._filtered: Optional[Tuple[float, float]] = None
+        self._baseline: Optional[Tuple[float, float]] = None
+        self._pinch: Optional[Tuple[float, float, float, float, float]] = None
+
+    def set_frame_size(self, width: int, height: int) -> None:
+        """Pusat frame untuk mapping RAW (ukuran sumber baru diketahui setelah dibuka)."""
+        if width > 0 and height > 0:
+            self.cx = width / 2.0
+            self.cy = height / 2.0
+
+    def set_mode(self, mode: int) -> None:
+        """MODE_RAW / MODE_SMOOTH / MODE_KALMAN (RAW tidak mengubah filter controller)."""
+        if mode not in MODE_NAMES:
+            return
+        self.mode = mode
+        if mode != MODE_RAW:
+            self.rot_ctrl.set_mode(mode)
+
+    def set_tracker(self, spec: str) -> None:
+        """Filter rotasi dari registry ("one-euro", "ca-kalman:q=0.5"); ValueError kalau tidak dikenal."""
+        self.rot_ctrl.set_tracker(spec)
+        self.mode = self.rot_ctrl.mode
+
+    @property
+    def tracker_name(self) -> str:
+        return self.rot_ctrl.tracker_name
+
+    @property
+    def mode_name(self) -> str:
+        if self.mode == MODE_TRACKER:
+            return self.rot_ctrl.tracker_name.upper()
+        return MODE_NAMES.get(self.mode, "UNK")
+
+    @property
+    def velocity(self):
+        """Velocity untuk StateSlot.publish: RAW tidak diekstrapolasi."""
+        return (0.0, 0.0, 0.0) if self.mode == MODE_RAW else None
+
+    def update(self, hands: List[dict], now: float) -> Tuple[float, float, float]:
+        """hands sudah diurutkan menurut x (slot 0 = tangan kiri). Return (rot_x, rot_y, scale)."""
+        mode_rot = self.mode
+        rot_vector = (0.0, 0.0)
+        self.now = now
+        if self.last_baseline_time is None:
+            self.last_baseline_time = now
+        self._raw = self._filtered = self._baseline = self._pinch = None
+
+        if hands:
+            # semua landmark kedua tangan difilter sekaligus (jalur batch tracker)
+            lm_filtered = self.rot_ctrl.process_landmarks(hands, now)
+
+            # kiri → rotasi
+            left = hands[0]
+            x_raw, y_raw = left['center']
+
+            if mode_rot == MODE_RAW:
+                x_f, y_f = float(x_raw), float(y_raw)
+            else:
+                x_f, y_f = self.rot_ctrl.process(float(x_raw), float(y_raw), now)
+            self._raw = (x_raw, y_raw)
+            self._filtered = (x_f, y_f)
+
+            if mode_rot == MODE_RAW:
+                # RAW: pakai posisi absolut
+                rot_vector = (x_f, y_f)
+            else:
+                if self.baseline_left_pos is None:
+                    self.baseline_left_pos = (x_f, y_f)
+
+                dx = x_f - self.baseline_left_pos[0]
+                dy = y_f - self.baseline_left_pos[1]
+                rot_vector = (dx, dy)
+                self._baseline = self.baseline_left_pos
+
+                if now - self.last_baseline_time > self.baseline_interval:
+                    self.baseline_left_pos = (x_f, y_f)
+                    self.last_baseline_time = now
+
+            # kanan → scale
+            if len(hands) >= 2:
+                self._update_scale(hands[1], lm_filtered[1])
+        else:
+            self.baseline_left_pos = None
+            self.rot_ctrl.process_landmarks([], now)
+
+        self.rot_vector = rot_vector
+        self._integrate(rot_vector)
+        return self.rot_x, self.rot_y, self.scale
+
+    def _update_scale(self, right: dict, lm_filtered: np.ndarray) -> None:
+        if self.mode == MODE_RAW:
+            lmR = right['lmList']
+            x_thumb, y_thumb = lmR[4][:2]
+            x_idx, y_idx = lmR[8][:2]
+        else:
+            lmR = lm_filtered
+            x_thumb, y_thumb = lmR[4]
+            x_idx, y_idx = lmR[8]
+
+        dist = np.hypot(x_idx - x_thumb, y_idx - y_thumb)
+
+        # hanya batas bawah jarak (supaya tidak 0)
+        d_min = 30.0
+        d_clamped = max(d_min, dist)
+
+        # batas bawah skala
+        s_min = 0.5
+        # sensitivitas pembesaran (semakin besar, semakin cepat membesar)
+        k = 1.0 / (200.0 - d_min)
+
+        t = (d_clamped - d_min)
+        target_scale = s_min + k * t  # bisa > 2.0, tidak ada limit atas
+
+        if self.mode == MODE_RAW:
+            # RAW: langsung
+            self.scale = target_scale
+        else:
+            # mode lain: smoothing
+            self.scale = (1 - self.scale_alpha) * self.scale + self.scale_alpha * target_scale
+
+        self._pinch = (x_thumb, y_thumb, x_idx, y_idx, dist)
+
+    def _integrate(self, rot_vector: Tuple[float, float]) -> None:
+        """Mapping / integrasi rotasi."""
+        dx, dy = rot_vector
+
+        if self.mode == MODE_RAW:
+            # RAW: perkuat jitter dekat tengah
+            x_norm = (dx - self.cx) / self.cx       # -1..1
+            y_norm = (dy - self.cy) / self.cy       # -1..1
+
+            jitter_gain = 180.0            # naikkan jika perlu
+            x_nonlin = np.sign(x_norm) * (abs(x_norm) ** 0.5)
+            y_nonlin = np.sign(y_norm) * (abs(y_norm) ** 0.5)
+
+            self.rot_x = -y_nonlin * jitter_gain
+            self.rot_y = x_nonlin * jitter_gain
+        else:
+            alpha = 0.3
+            self.rot_dx_s = (1 - alpha) * self.rot_dx_s + alpha * dx
+            self.rot_dy_s = (1 - alpha) * self.rot_dy_s + alpha * dy
+
+            dead = 1.0
+            dx_eff = 0.0 if abs(self.rot_dx_s) < dead else self.rot_dx_s
+            dy_eff = 0.0 if abs(self.rot_dy_s) < dead else self.rot_dy_s
+            gain = 0.04
+
+            self.rot_x += -dy_eff * gain
+            self.rot_y += dx_eff * gain
+
+    def draw(self, img: np.ndarray, scale: float = 1.0) -> None:
+        """Overlay preview untuk frame terakhir yang di-update (scale = ukuran img / frame)."""
+        def pt(x, y):
+            return int(x * scale), int(y * scale)
+
+        if self._raw is not None:
+            x_raw, y_raw = self._raw
+            x_f, y_f = self._filtered
+            cv2.circle(img, pt(x_raw, y_raw), 7, (0, 0, 255), -1)
+            cv2.circle(img, pt(x_f, y_f), 7, (0, 255, 0), 2)
+            if self._baseline is not None:
+                bx, by = self._baseline
+                cv2.circle(img, pt(bx, by), 7, (255, 0, 0), 2)
+                cv2.line(img, pt(bx, by), pt(x_f, y_f), (255, 0, 0), 1)
+
+        if self._pinch is not None:
+            x_thumb, y_thumb, x_idx, y_idx, dist = self._pinch
+            cv2.line(img, pt(x_thumb, y_thumb), pt(x_idx, y_idx), (255, 0, 0), 2)
+            cv2.putText(img, f"dist={int(dist)} scale={self.scale:.2f}",
+                        (20, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.6,
+                        (0, 255, 255), 2)
+
+        t_left = self.baseline_interval - (self.now - (self.last_baseline_time or self.now))
+        rot_vector = self.rot_vector
+
+        cv2.putText(img,
+                    f"Rot vec: ({rot_vector[0]:.1f},{rot_vector[1]:.1f}) | Reset in {t_left:.1f}s",
+                    (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.6,
+                    (255, 255, 255), 2)
+
+        cv2.putText(img,
+                    f"rot_x={self.rot_x:.2f} rot_y={self.rot_y:.2f} scale={self.scale:.2f} mode={self.mode_name}",
+                    (20, 110), cv2.FONT_HERSHEY_SIMPLEX, 0.6,
+                    (0, 255, 0), 2)
+
+        cv2.putText(img,
+                    "Left: rotation (1=RAW,2=Smooth,3=Kalman,T=next filter)  |  Right: scale",
+                    (20, img.shape[0] - 30), cv2.FONT_HERSHEY_SIMPLEX,
+                    0.6, (200, 200, 200), 2)
@@ -1,22 +1,147 @@
-from typing import Tuple
-from ..numerical_methods import KalmanFilterTracker, ExponentialSmoothing
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from ..numerical_methods import create_batch_tracker, create_tracker, format_tracker_spec
+
+# jumlah landmark per tangan (mediapipe / cvzone)
+LANDMARKS_PER_HAND = 21
+MAX_HANDS = 2
+
+# mode rotasi (tombol 1/2/3): RAW = tanpa filter, mode lain = tracker dari registry
+MODE_RAW = 1
+MODE_SMOOTH = 2
+MODE_KALMAN = 3
+# tracker dipilih lewat nama (--tracker / tombol t), bukan salah satu preset di atas
+MODE_TRACKER = 4
+MODE_TRACKERS: Dict[int, str] = {
+    MODE_SMOOTH: "smoothing",
+    MODE_KALMAN: "kalman",
+}
+
 
 class HandTrackingController:
-    def __init__(self):
-        self.kalman = KalmanFilterTracker()
-        self.smoothing = ExponentialSmoothing(alpha = 0.7)
+    def __init__(self, tracker: str = "kalman", landmark_tracker: str = "kalman"):
+        # filter center tangan kiri (rotasi) dan filter batch semua landmark
+        # (slot tangan x 21 titik); keduanya bisa diganti saat jalan
+        self.set_tracker(tracker)
+        self.set_landmark_tracker(landmark_tracker)
+        self.raw = False
 
-        # 1 = Raw || 2 = Kalman || 3 = Smoothing
-        self.mode = 2
+    @property
+    def mode(self) -> int:
+        if self.raw:
+            return MODE_RAW
+        for mode, name in MODE_TRACKERS.items():
+            if self.tracker_name == name:
+                return mode
+        return MODE_TRACKER
 
     def set_mode(self, mode: int) -> None:
-        if mode in (1, 2, 3):
-            self.mode = mode
+        if mode == MODE_RAW:
+            self.raw = True
+        elif mode in MODE_TRACKERS:
+            self.raw = False
+            self.set_tracker(MODE_TRACKERS[mode])
 
-    def process(self, x: float, y: float) -> Tuple[float, float]:
-        if self.mode == 1:
+    def set_tracker(self, spec: str) -> None:
+        """Ganti filter center ("one-euro", "alpha-beta:alpha=0.3", ...); state mulai dari awal."""
+        tracker = create_tracker(spec)
+        self.tracker_name = format_tracker_spec(spec)
+        # satu assignment: thread lain (keyboard GL / stdin) aman mengganti saat loop jalan
+        self.tracker = tracker
+        self.raw = False
+
+    def set_landmark_tracker(self, spec: str) -> None:
+        landmarks = create_batch_tracker(spec, MAX_HANDS * LANDMARKS_PER_HAND)
+        self.landmark_tracker_name = format_tracker_spec(spec)
+        self.landmarks = landmarks
+        # (type, center) tangan terakhir di tiap slot filter, None = kosong
+        self._slot_hands: List[Tuple[str | None, np.ndarray] | None] = [None] * MAX_HANDS
+
+    def process(self, x: float, y: float, t: float | None = None) -> Tuple[float, float]:
+        # t = timestamp frame (detik), dipakai filter untuk dt yang sebenarnya
+        if self.raw:
             return x, y
-        elif self.mode == 2:
-            return self.smoothing.apply(x, y)
-        else:
-            return self.kalman.apply(x, y)
+        return self.tracker.apply(x, y, t)
+
+    def _assign_slots(self, hands: List[dict], centers: List[np.ndarray]) -> Tuple[List[int], List[int]]:
+        """
+        Slot filter untuk tiap tangan: slot dengan hand['type'] yang sama, lalu
+        (kalau type tidak ada) slot dengan center sebelumnya terdekat, lalu slot
+        kosong. Return (slot per tangan, slot yang ganti tangan → perlu reset).
+        """
+        prev = self._slot_hands
+        slots = [-1] * len(hands)
+        free = list(range(MAX_HANDS))
+
+        def same_type(i: int, slot: int) -> bool:
+            return prev[slot] is not None and prev[slot][0] is not None and prev[slot][0] == hands[i].get('type')
+
+        def comparable(i: int, slot: int) -> bool:
+            # tanpa label type di salah satu sisi, hanya posisi yang bisa dipakai
+            return prev[slot] is not None and (prev[slot][0] is None or hands[i].get('type') is None)
+
+        for i in range(len(hands)):
+            match = next((slot for slot in free if same_type(i, slot)), None)
+            if match is not None:
+                slots[i] = match
+                free.remove(match)
+        # pasangan (tangan, slot) terdekat dulu, bukan urutan list
+        pairs = sorted(
+            (float(np.sum((prev[slot][1] - centers[i]) ** 2)), i, slot)
+            for i in range(len(hands)) if slots[i] < 0
+            for slot in free if comparable(i, slot)
+        )
+        for _, i, slot in pairs:
+            if slots[i] < 0 and slot in free:
+                slots[i] = slot
+                free.remove(slot)
+
+        changed = []
+        for i in range(len(hands)):
+            if slots[i] >= 0:
+                continue
+            # slot kosong dulu; slot bekas tangan lain harus di-reset
+            match = min(free, key=lambda slot: prev[slot] is not None)
+            slots[i] = match
+            free.remove(match)
+            if prev[match] is not None:
+                changed.append(match)
+        return slots, changed
+
+    def process_landmarks(self, hands: List[dict], t: float | None = None) -> List[np.ndarray]:
+        """
+        Filter lmList semua tangan dengan satu update batch. Slot filter
+        mengikuti tangannya (hand['type'] / center terdekat), bukan urutan list,
+        jadi filter tidak diisi tangan lain saat satu tangan keluar frame.
+        Slot tangan yang tidak terdeteksi atau ganti tangan di-reset.
+        Return (21, 2) per tangan, urutan sama dengan hands.
+        """
+        n = LANDMARKS_PER_HAND
+        hands = hands[:MAX_HANDS]
+        lms = [np.asarray(hand['lmList'], dtype=np.float32)[:n, :2] for hand in hands]
+        centers = [lm.mean(axis=0) for lm in lms]
+        slots, changed = self._assign_slots(hands, centers)
+
+        z = np.zeros((MAX_HANDS * n, 2), dtype=np.float32)
+        mask = np.zeros(MAX_HANDS * n, dtype=bool)
+        slot_hands: List[Tuple[str | None, np.ndarray] | None] = [None] * MAX_HANDS
+        for slot, hand, lm, center in zip(slots, hands, lms, centers):
+            z[slot * n: slot * n + len(lm)] = lm
+            mask[slot * n: slot * n + len(lm)] = True
+            slot_hands[slot] = (hand.get('type'), center)
+        self._slot_hands = slot_hands
+
+        landmarks = self.landmarks
+        lost = ~mask & landmarks.initialized
+        for slot in changed:
+            lost[slot * n:(slot + 1) * n] = True
+        if lost.any():
+            landmarks.reset(lost)
+
+        filtered = landmarks.update(z, mask, t)
+        if self.raw:
+            filtered = z
+
+        return [filtered[slot * n:(slot + 1) * n] for slot in slots]
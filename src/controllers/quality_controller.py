@@ -0,0 +1,163 @@
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+# tangga kualitas, dari paling bagus ke paling ringan. Tiap langkah turun
+# mengurangi beban deteksi (resolusi, jumlah tangan, interval) dan/atau
+# detail mesh (lod_bias = level LOD tambahan yang lebih kasar).
+QUALITY_LEVELS: List[Dict[str, float]] = [
+    {"detect_scale": 1.0, "max_hands": 2, "detect_every": 1, "lod_bias": 0},
+    {"detect_scale": 0.75, "max_hands": 2, "detect_every": 1, "lod_bias": 0},
+    {"detect_scale": 0.75, "max_hands": 2, "detect_every": 2, "lod_bias": 1},
+    {"detect_scale": 0.5, "max_hands": 2, "detect_every": 2, "lod_bias": 1},
+    {"detect_scale": 0.5, "max_hands": 1, "detect_every": 3, "lod_bias": 2},
+    {"detect_scale": 0.35, "max_hands": 1, "detect_every": 4, "lod_bias": 3},
+]
+
+
+class QualityController:
+    """
+    Feedback loop yang menjaga loop vision di target fps dengan menaikkan /
+    menurunkan level kualitas (QUALITY_LEVELS).
+
+    Per frame diberi: waktu kerja (tanpa menunggu kamera) dan latency
+    (umur frame saat hasilnya dipublish). Keduanya dirata-rata (EWMA).
+    - turun satu level kalau waktu kerja > periode target / low (kerja tidak
+      lagi muat di budget frame) atau latency > max_latency terus-menerus
+      selama down_after detik. fps loop sendiri tidak dipakai: kamera yang
+      lebih lambat dari target membatasi fps walau kerjanya ringan;
+    - naik satu level kalau waktu kerja < headroom * periode target (level
+      yang lebih berat masih muat) selama up_after detik.
+    Hysteresis: ambang naik/turun berbeda, harus bertahan selama dwell time,
+    cooldown setelah tiap perubahan, dan kalau naik level langsung disusul
+    turun lagi (dalam probation detik), jeda naik berikutnya digandakan.
+    """
+
+    def __init__(self, target_fps: float, max_latency: Optional[float] = None,
+                 levels: Sequence[Dict[str, float]] = QUALITY_LEVELS, level: int = 0,
+                 low: float = 0.9, headroom: float = 0.6,
+                 down_after: float = 1.0, up_after: float = 3.0, cooldown: float = 2.0,
+                 probation: float = 10.0, max_up_after: float = 60.0, alpha: float = 0.1,
+                 on_change: Optional[Callable[[Dict[str, float]], None]] = None):
+        self.target_fps = target_fps
+        self.period = 1.0 / target_fps
+        self.max_latency = max_latency
+        self.levels = list(levels)
+        self.level = min(max(level, 0), len(self.levels) - 1)
+        self.low = low
+        self.headroom = headroom
+        self.down_after = down_after
+        self.base_up_after = up_after
+        self.up_after = up_after
+        self.cooldown = cooldown
+        self.probation = probation
+        self.max_up_after = max_up_after
+        self.alpha = alpha
+        self.on_change = on_change
+
+        self.fps = 0.0
+        self.busy = 0.0
+        self.latency = 0.0
+        self._interval = 0.0
+        self._last: Optional[float] = None
+        self._down_since: Optional[float] = None
+        self._up_since: Optional[float] = None
+        self._changed_at = -float("inf")
+        self._last_up: Optional[float] = None
+
+        self.decisions: List[dict] = []
+
+    @property
+    def settings(self) -> Dict[str, float]:
+        return self.levels[self.level]
+
+    def apply(self) -> None:
+        """Terapkan level saat ini (panggil sekali di awal)."""
+        if self.on_change is not None:
+            self.on_change(self.settings)
+
+    def update(self, now: float, busy: float, latency: Optional[float] = None) -> bool:
+        """
+        Dipanggil tiap iterasi loop yang menghasilkan frame. now = waktu
+        (detik), busy = waktu kerja iterasi ini. Return True kalau level berubah.
+        """
+        a = self.alpha
+        if self._last is not None:
+            dt = now - self._last
+            self._interval = dt if self._interval == 0.0 else (1 - a) * self._interval + a * dt
+            self.fps = 1.0 / self._interval if self._interval > 0 else 0.0
+        self._last = now
+        self.busy = busy if self.busy == 0.0 else (1 - a) * self.busy + a * busy
+        if latency is not None:
+            self.latency = latency if self.latency == 0.0 else (1 - a) * self.latency + a * latency
+
+        if self.fps == 0.0 or now - self._changed_at < self.cooldown:
+            self._down_since = self._up_since = None
+            return False
+
+        # beban diukur dari waktu kerja (tunggu kamera tidak dihitung), bukan dari
+        # fps loop yang dibatasi fps sumber
+        slow = self.busy > self.period / self.low
+        late = self.max_latency is not None and self.latency > self.max_latency
+        room = self.busy < self.headroom * self.period and not (
+            self.max_latency is not None and self.latency > 0.7 * self.max_latency
+        )
+
+        if (slow or late) and self.level < len(self.levels) - 1:
+            self._up_since = None
+            if self._down_since is None:
+                self._down_since = now
+            if now - self._down_since >= self.down_after:
+                reason = f"busy {1e3 * self.busy:.1f} ms > {1e3 * self.period / self.low:.1f} ms" if slow \
+                    else f"latency {1e3 * self.latency:.0f} ms > {1e3 * self.max_latency:.0f} ms"
+                # baru naik lalu langsung kewalahan → tunda naik berikutnya lebih lama
+                if self._last_up is not None and now - self._last_up < self.probation:
+                    self.up_after = min(self.up_after * 2.0, self.max_up_after)
+                self._change(now, self.level + 1, reason)
+                return True
+        elif room and not slow and self.level > 0:
+            self._down_since = None
+            if self._up_since is None:
+                self._up_since = now
+            if now - self._up_since >= self.up_after:
+                self._last_up = now
+                self._change(now, self.level - 1,
+                             f"busy {1e3 * self.busy:.1f} ms < {1e3 * self.headroom * self.period:.1f} ms")
+                return True
+        else:
+            self._down_since = self._up_since = None
+            # stabil cukup lama → jeda naik kembali normal
+            if self._last_up is not None and now - self._last_up > self.probation:
+                self.up_after = self.base_up_after
+        return False
+
+    def _change(self, now: float, level: int, reason: str) -> None:
+        old = self.level
+        self.level = level
+        self._changed_at = now
+        self._down_since = self._up_since = None
+        decision = {
+            "t": now,
+            "from": old,
+            "to": level,
+            "reason": reason,
+            "fps": round(self.fps, 1),
+            "busy_ms": round(1e3 * self.busy, 2),
+            "latency_ms": round(1e3 * self.latency, 1),
+            "settings": dict(self.settings),
+        }
+        self.decisions.append(decision)
+        direction = "down" if level > old else "up"
+        settings = " ".join(f"{k}={v}" for k, v in self.settings.items())
+        print(f"[Quality] {direction} {old} -> {level} ({reason}): {settings}")
+        if self.on_change is not None:
+            self.on_change(self.settings)
+
+    def stats(self) -> dict:
+        return {
+            "level": self.level,
+            "fps": round(self.fps, 1),
+            "busy_ms": round(1e3 * self.busy, 2),
+            "latency_ms": round(1e3 * self.latency, 1),
+            "changes": len(self.decisions),
+            "up_after_s": self.up_after,
+        }
@@ -0,0 +1,152 @@
+import time
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .detection_pool import DetectionPool
+from .detection_scheduler import mirror_hands
+from .gesture_session import GestureSession
+
+
+class Session:
+    """
+    Satu pengguna / kamera: sumber frame + state gesture sendiri + slot state
+    untuk renderer. Tidak ada state yang dibagi dengan session lain.
+    """
+
+    def __init__(self, index: int, source, gesture: GestureSession, state,
+                 name: Optional[str] = None, scheduler=None, log=None):
+        self.index = index
+        self.name = name or f"session {index}"
+        self.source = source
+        self.gesture = gesture
+        # StateSlot yang dibaca viewport session ini
+        self.state = state
+        # DetectionScheduler sendiri kalau deteksi jalan di thread utama
+        self.scheduler = scheduler
+        self.log = log
+        self.done = False
+        self.frames = 0
+
+
+class SessionPool:
+    """
+    Jadwal beberapa Session di atas satu DetectionPool.
+
+    feed() mengambil satu frame dari tiap session yang masih hidup (mulai
+    dari session yang berbeda tiap putaran supaya adil) dan mengirimnya ke
+    worker; frame hanya dibaca kalau ada slot kosong, jadi sumber file tidak
+    kehilangan frame. collect() mengeluarkan hasil yang sudah jadi. Hasil
+    tiap session tetap urut karena DetectionPool mengeluarkan sesuai urutan
+    submit.
+
+    pool=None → deteksi langsung di feed() pakai scheduler milik session
+    (jalur lama satu kamera, tidak paralel).
+
+    Deteksi jalan di frame asli (tidak di-flip); mirror=True → koordinat
+    hasil dicerminkan supaya sama dengan tampilan selfie. img yang
+    dikeluarkan collect() tetap frame asli.
+    """
+
+    def __init__(self, sessions: List[Session], pool: Optional[DetectionPool] = None,
+                 read_timeout: float = 1.0, mirror: bool = True):
+        self.sessions = sessions
+        self.pool = pool
+        self.read_timeout = read_timeout
+        self.mirror = mirror
+        self._owner: Dict[int, Session] = {}
+        self._ready: Deque[tuple] = deque()
+        self._start = 0
+        # total waktu menunggu sumber frame (bukan kerja, lihat QualityController)
+        self.wait_time = 0.0
+
+    @property
+    def active(self) -> List[Session]:
+        return [s for s in self.sessions if not s.done]
+
+    @property
+    def finished(self) -> bool:
+        busy = self.pool is not None and self.pool.in_flight > 0
+        return not self.active and not busy and not self._ready
+
+    def _order(self) -> List[Session]:
+        n = len(self.sessions)
+        order = [self.sessions[(self._start + i) % n] for i in range(n)]
+        self._start = (self._start + 1) % n
+        return [s for s in order if not s.done]
+
+    def _read(self, session: Session):
+        t0 = time.perf_counter()
+        frame = session.source.read(self.read_timeout)
+        self.wait_time += time.perf_counter() - t0
+        if frame is None and session.source.eof:
+            # file habis / kamera berhenti; timeout biasa (kamera lambat) hanya dilewati
+            session.done = True
+            print(f"[SessionPool] {session.name} finished after {session.frames} frames")
+        return frame
+
+    def feed(self, inst=None) -> int:
+        """Baca + kirim satu frame per session aktif. Return jumlah frame yang dikirim."""
+        sent = 0
+        for session in self._order():
+            if self.pool is not None and self.pool.free_slots == 0:
+                break
+            frame = self._read(session)
+            if frame is None:
+                continue
+            if inst is not None:
+                inst.lap("capture")
+                inst.record("age.frame", session.source.last_age)
+
+            if self.pool is None:
+                img = frame.image
+                hands = self._mirror(session.scheduler.detect(img, frame.t), img)
+                if inst is not None:
+                    inst.lap("detect")
+                self._ready.append((session, frame.seq, frame.t, hands, img, None))
+            else:
+                slot = self.pool.acquire()
+                # salin ke shared memory, worker membaca dari slot yang sama
+                h, w = frame.image.shape[:2]
+                np.copyto(self.pool.buffer(slot, h, w), frame.image)
+                if inst is not None:
+                    inst.lap("copy")
+                self.pool.submit(slot, frame.seq, frame.t)
+                self._owner[slot] = session
+            session.frames += 1
+            sent += 1
+        return sent
+
+    def collect(self, block: bool = False) -> Iterator[Tuple[Session, int, float, List[dict], np.ndarray, Optional[int]]]:
+        """
+        Hasil yang sudah jadi: (session, seq, t, hands, img, slot).
+        slot != None → panggil release(slot) setelah img selesai dipakai.
+        block=True → tunggu minimal satu hasil (kalau masih ada yang diproses).
+        """
+        while self._ready:
+            yield self._ready.popleft()
+        if self.pool is None:
+            return
+        while True:
+            done = self.pool.get(block=block)
+            if done is None:
+                return
+            block = False
+            seq, t, hands, slot = done
+            session = self._owner.pop(slot)
+            img = self.pool.frame(slot)
+            yield session, seq, t, self._mirror(hands, img), img, slot
+
+    def _mirror(self, hands: List[dict], img: np.ndarray) -> List[dict]:
+        return mirror_hands(hands, img.shape[1]) if self.mirror and hands else hands
+
+    def release(self, slot: Optional[int]) -> None:
+        if slot is not None:
+            self.pool.release(slot)
+
+    def stats(self) -> dict:
+        out = {s.name: s.frames for s in self.sessions}
+        if self.pool is not None:
+            out["pool"] = self.pool.stats()
+        return out
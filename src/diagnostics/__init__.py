@@ -0,0 +1,15 @@
+from .instrumentation import Instrumentation, SnapshotExporter, StageHistogram
+from .run_log import RunLog
+from .startup import StartupProfiler
+from .trace import Trace, TraceRecorder, synthetic_trace
+
+__all__ = [
+    'Instrumentation',
+    'SnapshotExporter',
+    'RunLog',
+    'StageHistogram',
+    'StartupProfiler',
+    'Trace',
+    'TraceRecorder',
+    'synthetic_trace',
+]
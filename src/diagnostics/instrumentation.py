@@ -0,0 +1,215 @@
+import csv
+import json
+import math
+import os
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+# bin histogram log-spaced: 1 µs .. 10 s, 20 bin per dekade (resolusi ~12%)
+MIN_SECONDS = 1e-6
+BINS_PER_DECADE = 20
+DECADES = 7
+N_BINS = BINS_PER_DECADE * DECADES
+
+# batas atas tiap bin (detik)
+_UPPER = MIN_SECONDS * 10.0 ** ((np.arange(N_BINS) + 1) / BINS_PER_DECADE)
+
+PERCENTILES = (50, 95, 99)
+
+
+class StageHistogram:
+    """Histogram durasi ukuran tetap (tidak menyimpan sampel, tidak alokasi per add)."""
+
+    def __init__(self):
+        # list Python: increment per add jauh lebih murah daripada elemen array NumPy
+        self.counts = [0] * N_BINS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        if seconds <= MIN_SECONDS:
+            i = 0
+        else:
+            i = min(int(math.log10(seconds / MIN_SECONDS) * BINS_PER_DECADE), N_BINS - 1)
+        self.counts[i] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p: float) -> float:
+        """Perkiraan persentil (batas atas bin), detik."""
+        if self.count == 0:
+            return 0.0
+        rank = math.ceil(self.count * p / 100.0)
+        i = int(np.searchsorted(np.cumsum(self.counts), max(rank, 1)))
+        return float(min(_UPPER[min(i, N_BINS - 1)], self.max))
+
+    def copy(self) -> "StageHistogram":
+        hist = StageHistogram()
+        hist.counts = list(self.counts)
+        hist.count = sum(hist.counts)
+        hist.total = self.total
+        hist.max = self.max
+        return hist
+
+    def since(self, prev: "StageHistogram") -> "StageHistogram":
+        """Histogram sampel yang masuk setelah `prev` (salinan lama histogram ini)."""
+        hist = StageHistogram()
+        hist.counts = [a - b for a, b in zip(self.counts, prev.counts)]
+        hist.count = sum(hist.counts)
+        hist.total = self.total - prev.total
+        # max per periode tidak disimpan: batas atas bin tertinggi yang terisi
+        filled = [i for i, c in enumerate(hist.counts) if c]
+        hist.max = min(float(_UPPER[filled[-1]]), self.max) if filled else 0.0
+        return hist
+
+    def reset(self) -> None:
+        self.counts = [0] * N_BINS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def summary(self) -> dict:
+        out = {
+            "count": self.count,
+            "mean_ms": round(1e3 * self.total / self.count, 4) if self.count else 0.0,
+            "max_ms": round(1e3 * self.max, 4),
+        }
+        for p in PERCENTILES:
+            out[f"p{p}_ms"] = round(1e3 * self.percentile(p), 4)
+        return out
+
+
+class Instrumentation:
+    """
+    Durasi per tahap pipeline & umur antrian, masuk ke StageHistogram per nama.
+
+    Di loop utama cukup:
+        inst.begin()            # awal frame
+        ...; inst.lap("capture")
+        ...; inst.lap("detect")  # durasi sejak lap/begin sebelumnya
+    dari thread lain: inst.record("render", seconds).
+
+    enabled=False → semua method langsung return (biaya ~1 pemanggilan fungsi).
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.stages: Dict[str, StageHistogram] = {}
+        self._t0 = 0.0
+        self.started = time.time()
+
+    def _hist(self, name: str) -> StageHistogram:
+        hist = self.stages.get(name)
+        if hist is None:
+            hist = self.stages[name] = StageHistogram()
+        return hist
+
+    def begin(self) -> None:
+        if not self.enabled:
+            return
+        self._t0 = time.perf_counter()
+
+    def lap(self, name: str) -> None:
+        if not self.enabled:
+            return
+        t = time.perf_counter()
+        self._hist(name).add(t - self._t0)
+        self._t0 = t
+
+    def record(self, name: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+        self._hist(name).add(seconds)
+
+    def snapshot(self, reset: bool = False) -> Dict[str, dict]:
+        # list() dulu: thread GL bisa menambah stage baru
+        out = {name: hist.summary() for name, hist in list(self.stages.items())}
+        if reset:
+            for hist in list(self.stages.values()):
+                hist.reset()
+        return out
+
+    def hud_lines(self) -> List[str]:
+        lines = []
+        for name, s in self.snapshot().items():
+            lines.append(
+                f"{name:<10} {s['p50_ms']:6.1f} {s['p95_ms']:6.1f} {s['p99_ms']:6.1f} ms"
+            )
+        return lines
+
+    def draw_hud(self, img: np.ndarray, origin=(None, 30)) -> None:
+        """Tabel p50/p95/p99 per tahap di pojok kanan atas preview."""
+        if not self.enabled:
+            return
+        import cv2
+
+        x, y = origin
+        if x is None:
+            x = img.shape[1] - 360
+        cv2.putText(img, f"{'stage':<10} {'p50':>6} {'p95':>6} {'p99':>6}", (x, y),
+                    cv2.FONT_HERSHEY_PLAIN, 1.0, (255, 255, 255), 1)
+        for line in self.hud_lines():
+            y += 16
+            cv2.putText(img, line, (x, y), cv2.FONT_HERSHEY_PLAIN, 1.0, (0, 255, 255), 1)
+
+
+class SnapshotExporter:
+    """
+    Tulis snapshot Instrumentation tiap interval detik ke CSV (satu baris per
+    tahap) atau JSON lines (ekstensi .json/.jsonl, satu objek per snapshot).
+    Tiap snapshot = satu periode: selisih terhadap salinan histogram saat
+    export sebelumnya. Histogram Instrumentation sendiri tidak di-reset, jadi
+    HUD dan ringkasan [Profile] di akhir tetap mencakup seluruh run.
+    """
+
+    CSV_FIELDS = ["time", "stage", "count", "mean_ms"] + [f"p{p}_ms" for p in PERCENTILES] + ["max_ms"]
+
+    def __init__(self, path: str, interval: float = 5.0):
+        self.path = path
+        self.interval = interval
+        self.json = os.path.splitext(path)[1].lower() in (".json", ".jsonl")
+        self._last = time.time()
+        self._file = open(path, "w", newline="")
+        self._writer: Optional[csv.DictWriter] = None
+        # salinan histogram saat export terakhir
+        self._prev: Dict[str, StageHistogram] = {}
+        if not self.json:
+            self._writer = csv.DictWriter(self._file, fieldnames=self.CSV_FIELDS)
+            self._writer.writeheader()
+
+    def maybe_export(self, inst: Instrumentation, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        if now - self._last < self.interval:
+            return False
+        self.export(inst, now)
+        return True
+
+    def export(self, inst: Instrumentation, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        # list() dulu: thread GL bisa menambah stage baru
+        current = {name: hist.copy() for name, hist in list(inst.stages.items())}
+        snap = {}
+        for name, hist in current.items():
+            prev = self._prev.get(name)
+            snap[name] = (hist.since(prev) if prev is not None else hist).summary()
+        self._prev = current
+        if self.json:
+            self._file.write(json.dumps({"time": now, "stages": snap}) + "\n")
+        else:
+            for name, s in snap.items():
+                if s["count"] == 0:
+                    continue
+                self._writer.writerow(dict(time=f"{now:.3f}", stage=name, **s))
+        self._file.flush()
+        self._last = now
+
+    def close(self, inst: Optional[Instrumentation] = None) -> None:
+        if inst is not None:
+            self.export(inst)
+        self._file.close()
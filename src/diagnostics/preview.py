@@ -0,0 +1,65 @@
+import time
+from typing import Optional
+
+import numpy as np
+
+
+class PreviewWindow:
+    """
+    Preview debug (cv2.imshow) yang bisa diperkecil dan dibatasi frekuensinya.
+
+    Frame asli diperkecil ke buffer yang dipakai ulang lalu dicerminkan
+    (flip hanya di buffer kecil ini, bukan di frame penuh); overlay digambar
+    di buffer yang sama dengan koordinat dikali `scale`. Frame yang tidak
+    jatuh tempo (max_hz) dilewati seluruhnya: tanpa resize, overlay,
+    imshow maupun waitKey.
+    """
+
+    def __init__(self, title: str, scale: float = 1.0, max_hz: float = 0.0):
+        self.title = title
+        self.scale = scale
+        self.period = 1.0 / max_hz if max_hz > 0 else 0.0
+        self._next = 0.0
+        self._small: Optional[np.ndarray] = None
+        self._buf: Optional[np.ndarray] = None
+        self.shown = 0
+        self.skipped = 0
+
+    def due(self, now: Optional[float] = None) -> bool:
+        """True kalau frame ini perlu ditampilkan."""
+        if self.period <= 0.0:
+            return True
+        now = time.perf_counter() if now is None else now
+        if now < self._next:
+            self.skipped += 1
+            return False
+        # jadwal tetap; kalau tertinggal jauh mulai lagi dari sekarang
+        self._next = max(self._next + self.period, now)
+        return True
+
+    def prepare(self, img: np.ndarray) -> np.ndarray:
+        """Buffer preview (diperkecil + dicerminkan) untuk digambari overlay."""
+        import cv2
+
+        h, w = img.shape[:2]
+        size = (max(1, int(round(w * self.scale))), max(1, int(round(h * self.scale))))
+        if self._buf is None or self._buf.shape[1::-1] != size or self._buf.shape[2:] != img.shape[2:]:
+            self._buf = np.empty((size[1], size[0]) + img.shape[2:], dtype=img.dtype)
+            self._small = np.empty_like(self._buf)
+        if self.scale != 1.0:
+            cv2.resize(img, size, dst=self._small, interpolation=cv2.INTER_AREA)
+            cv2.flip(self._small, 1, dst=self._buf)
+        else:
+            cv2.flip(img, 1, dst=self._buf)
+        return self._buf
+
+    def show(self, buf: np.ndarray) -> int:
+        """imshow + waitKey(1); return kode tombol (-1 = tidak ada)."""
+        import cv2
+
+        cv2.imshow(self.title, buf)
+        self.shown += 1
+        return cv2.waitKey(1)
+
+    def stats(self) -> dict:
+        return {"shown": self.shown, "skipped": self.skipped, "scale": self.scale}
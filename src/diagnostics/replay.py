@@ -0,0 +1,185 @@
+"""
+Replay trace deteksi ke tracker (Base) secepat mungkin, tanpa kamera.
+
+    python -m src.diagnostics.replay trace.npz --tracker kalman
+    python -m src.diagnostics.replay --synthetic 10000 --tracker all --json report.json
+    python -m src.diagnostics.replay --synthetic 10000 --tracker "one-euro:beta=0.1,alpha-beta"
+"""
+import argparse
+import inspect
+import json
+import time
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from ..numerical_methods import Base, KalmanFilterTracker, available_trackers, create_tracker
+from .trace import Trace, synthetic_trace
+
+
+# varian di luar registry (jalur implementasi lain dari filter yang sama);
+# nama lain dicari di registry tracker, boleh dengan parameter
+TRACKERS: Dict[str, Callable[[], Base]] = {
+    "kalman-numpy": lambda: KalmanFilterTracker(),
+}
+
+
+def make_tracker(spec: str) -> Base:
+    if spec in TRACKERS:
+        return TRACKERS[spec]()
+    return create_tracker(spec)
+
+
+def _split_specs(text: str) -> list:
+    """ "one-euro:beta=0.1,min_cutoff=2,kalman" → ["one-euro:beta=0.1,min_cutoff=2", "kalman"]"""
+    specs = []
+    for part in text.split(","):
+        if specs and "=" in part and ":" not in part:
+            specs[-1] += "," + part
+        else:
+            specs.append(part.strip())
+    return [spec for spec in specs if spec]
+
+# lag dicari sampai sekian frame
+MAX_LAG = 30
+
+
+def _shift_error(output: np.ndarray, reference: np.ndarray, k: int) -> float:
+    """MSE antara output[i] dan reference[i - k] (k > 0 = output tertinggal)."""
+    if k >= 0:
+        a, b = output[k:], reference[:len(reference) - k]
+    else:
+        a, b = output[:len(output) + k], reference[-k:]
+    ok = ~(np.isnan(a).any(axis=1) | np.isnan(b).any(axis=1))
+    if not ok.any():
+        return np.inf
+    return float(np.mean(np.sum((a[ok] - b[ok]) ** 2, axis=1)))
+
+
+def _best_lag(output: np.ndarray, reference: np.ndarray, max_lag: int = MAX_LAG) -> float:
+    """
+    Lag (frame, pecahan) yang membuat output paling mirip reference yang digeser.
+    Minimum dicari per frame lalu diperhalus dengan interpolasi parabola.
+    """
+    max_lag = min(max_lag, len(output) // 2)
+    shifts = np.arange(-max_lag, max_lag + 1)
+    errors = np.array([_shift_error(output, reference, int(k)) for k in shifts])
+    i = int(np.argmin(errors))
+    if 0 < i < len(errors) - 1 and np.all(np.isfinite(errors[i - 1:i + 2])):
+        e0, e1, e2 = errors[i - 1:i + 2]
+        denom = e0 - 2.0 * e1 + e2
+        if denom > 0:
+            return float(shifts[i] + 0.5 * (e0 - e2) / denom)
+    return float(shifts[i])
+
+
+def replay(trace: Trace, tracker: Base, slot: int = 0) -> dict:
+    """
+    Jalankan tracker pada center tangan `slot` di semua frame yang terdeteksi.
+    Return metrik throughput, latency, lag dan jitter.
+    """
+    valid = ~np.isnan(trace.centers[:, slot, 0])
+    idx = np.flatnonzero(valid)
+    xs = trace.centers[idx, slot, 0].astype(np.float64).tolist()
+    ys = trace.centers[idx, slot, 1].astype(np.float64).tolist()
+    ts = trace.t[idx].tolist()
+
+    apply = tracker.apply
+    uses_time = "t" in inspect.signature(apply).parameters
+    out = np.empty((len(idx), 2))
+    lat = np.empty(len(idx))
+    clock = time.perf_counter_ns
+
+    start = time.perf_counter()
+    for i in range(len(idx)):
+        t0 = clock()
+        if uses_time:
+            fx, fy = apply(xs[i], ys[i], ts[i])
+        else:
+            fx, fy = apply(xs[i], ys[i])
+        lat[i] = clock() - t0
+        out[i, 0] = fx
+        out[i, 1] = fy
+    total = time.perf_counter() - start
+
+    raw = np.stack([xs, ys], axis=1) if len(idx) else np.empty((0, 2))
+    report = {
+        "tracker": tracker.get_name(),
+        "updates": int(len(idx)),
+        "updates_per_s": len(idx) / total if total > 0 else 0.0,
+    }
+    if len(idx):
+        p50, p95, p99 = np.percentile(lat, [50, 95, 99]) / 1000.0
+        report.update(latency_us_p50=p50, latency_us_p95=p95, latency_us_p99=p99,
+                      latency_us_max=lat.max() / 1000.0)
+    if len(idx) > 2:
+        # jitter = RMS turunan kedua output (px/frame²); raw sebagai pembanding
+        report["jitter_px"] = float(np.sqrt(np.mean(np.sum(np.diff(out, 2, axis=0) ** 2, axis=1))))
+        report["raw_jitter_px"] = float(np.sqrt(np.mean(np.sum(np.diff(raw, 2, axis=0) ** 2, axis=1))))
+
+        if trace.truth is not None and slot == 0:
+            truth = trace.truth[idx].astype(np.float64)
+            report["rmse_px"] = float(np.sqrt(np.mean(np.sum((out - truth) ** 2, axis=1))))
+            report["raw_rmse_px"] = float(np.sqrt(np.mean(np.sum((raw - truth) ** 2, axis=1))))
+            report["lag_frames"] = _best_lag(out, truth)
+        else:
+            report["lag_frames"] = _best_lag(out, raw)
+    return report
+
+
+def format_report(r: dict) -> str:
+    parts = [f"{r['tracker']:>32}", f"{r['updates_per_s']:>10.0f} upd/s"]
+    if "latency_us_p50" in r:
+        parts.append(
+            f"lat p50/p95/p99 {r['latency_us_p50']:.1f}/{r['latency_us_p95']:.1f}/"
+            f"{r['latency_us_p99']:.1f} us"
+        )
+    if "jitter_px" in r:
+        parts.append(f"jitter {r['jitter_px']:.2f}px (raw {r['raw_jitter_px']:.2f})")
+    if "rmse_px" in r:
+        parts.append(f"rmse {r['rmse_px']:.2f}px (raw {r['raw_rmse_px']:.2f})")
+    if "lag_frames" in r:
+        parts.append(f"lag {r['lag_frames']:.2f} fr")
+    return "  ".join(parts)
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Replay hand-tracking trace through trackers")
+    parser.add_argument("trace", nargs="?", help="file .npz dari TraceRecorder (atau journal .part sesi yang crash)")
+    parser.add_argument("--synthetic", type=int, metavar="N",
+                        help="pakai trace sintetis N frame (tanpa file)")
+    parser.add_argument("--noise", type=float, default=3.0, help="noise trace sintetis (px)")
+    parser.add_argument("--save-synthetic", metavar="PATH", help="simpan trace sintetis")
+    parser.add_argument("--tracker", default="all",
+                        help="tracker dipisah koma (" + ", ".join(available_trackers() + list(TRACKERS))
+                             + "; parameter: one-euro:beta=0.1) atau 'all'")
+    parser.add_argument("--slot", type=int, default=0, help="slot tangan (0 = kiri)")
+    parser.add_argument("--json", metavar="PATH", help="simpan report sebagai JSON")
+    args = parser.parse_args(argv)
+
+    if args.trace:
+        trace = Trace.load(args.trace)
+    else:
+        trace = synthetic_trace(args.synthetic or 3000, noise=args.noise)
+        if args.save_synthetic:
+            trace.save(args.save_synthetic)
+
+    names = available_trackers() + list(TRACKERS) if args.tracker == "all" else _split_specs(args.tracker)
+    reports = []
+    for name in names:
+        try:
+            tracker = make_tracker(name)
+        except ValueError as e:
+            parser.error(str(e))
+        r = replay(trace, tracker, args.slot)
+        r["name"] = name
+        reports.append(r)
+        print(format_report(r))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"frames": len(trace), "reports": reports}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
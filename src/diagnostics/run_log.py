@@ -0,0 +1,48 @@
+import sys
+import time
+from typing import List, Tuple
+
+
+class RunLog:
+    """
+    Log per frame hasil pipeline (rot_x, rot_y, scale) + throughput.
+    Dipakai untuk membandingkan perilaku antar versi pada footage yang sama:
+    simpan ke CSV lalu diff.
+    """
+
+    HEADER = "seq,t,n_hands,rot_x,rot_y,scale"
+
+    def __init__(self):
+        self.rows: List[Tuple[int, float, int, float, float, float]] = []
+        self.started = time.perf_counter()
+        self.finished: float | None = None
+
+    def append(self, seq: int, t: float, n_hands: int,
+               rot_x: float, rot_y: float, scale: float) -> None:
+        self.rows.append((seq, t, n_hands, float(rot_x), float(rot_y), float(scale)))
+
+    def finish(self) -> None:
+        self.finished = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return end - self.started
+
+    @property
+    def fps(self) -> float:
+        return len(self.rows) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def write(self, path: str) -> None:
+        """path '-' = stdout."""
+        out = sys.stdout if path == "-" else open(path, "w")
+        try:
+            out.write(self.HEADER + "\n")
+            for seq, t, n, rx, ry, sc in self.rows:
+                out.write(f"{seq},{t:.6f},{n},{rx:.6f},{ry:.6f},{sc:.6f}\n")
+        finally:
+            if out is not sys.stdout:
+                out.close()
+
+    def summary(self) -> str:
+        return f"[RunLog] {len(self.rows)} frames in {self.elapsed:.2f} s ({self.fps:.1f} frames/s)"
@@ -0,0 +1,63 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class StartupProfiler:
+    """
+    Catat fase startup (boleh berjalan paralel di beberapa thread) relatif ke
+    t0 = awal proses, plus milestone seperti "first rendered frame".
+    Laporan dicetak sekali begitu semua milestone di `expected` tercapai.
+    """
+
+    def __init__(self, t0: Optional[float] = None, expected: Sequence[str] = ()):
+        self.t0 = time.perf_counter() if t0 is None else t0
+        self.expected = list(expected)
+        # (nama, mulai, selesai, thread) dalam detik relatif t0
+        self.phases: List[Tuple[str, float, float, str]] = []
+        self.marks: Dict[str, float] = {}
+        self.reported = False
+        self._lock = threading.Lock()
+
+    def record(self, name: str, start: float, end: float) -> None:
+        with self._lock:
+            self.phases.append((name, start - self.t0, end - self.t0, threading.current_thread().name))
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def mark(self, name: str) -> None:
+        """Milestone (hanya kejadian pertama yang dicatat)."""
+        with self._lock:
+            if name in self.marks:
+                return
+            self.marks[name] = time.perf_counter() - self.t0
+            ready = not self.reported and all(m in self.marks for m in self.expected)
+            if ready:
+                self.reported = True
+        if ready:
+            print(self.report())
+
+    def report(self) -> str:
+        with self._lock:
+            phases = sorted(self.phases, key=lambda p: p[1])
+            marks = sorted(self.marks.items(), key=lambda m: m[1])
+        lines = ["[Startup] phase                      start      end   duration  thread"]
+        for name, start, end, thread in phases:
+            lines.append(
+                f"[Startup] {name:<24} {1e3 * start:7.0f}  {1e3 * end:7.0f}  {1e3 * (end - start):7.0f} ms  {thread}"
+            )
+        if phases:
+            # total durasi > wall time = fase yang tumpang tindih (paralel)
+            busy = sum(end - start for _, start, end, _ in phases)
+            wall = max(end for _, _, end, _ in phases) - min(start for _, start, _, _ in phases)
+            lines.append(f"[Startup] sum of phases {1e3 * busy:.0f} ms in {1e3 * wall:.0f} ms wall")
+        for name, t in marks:
+            lines.append(f"[Startup] {name}: {1e3 * t:.0f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,183 @@
+import os
+import time
+from typing import List, Optional
+
+import numpy as np
+
+
+# jumlah slot tangan & landmark yang direkam (sama dengan HandTrackingController)
+MAX_HANDS = 2
+LANDMARKS = 21
+
+# journal TraceRecorder (path + JOURNAL_SUFFIX): MAGIC lalu record _RECORD
+# berukuran tetap, ditulis bertahap selama sesi jalan
+JOURNAL_SUFFIX = ".part"
+JOURNAL_MAGIC = b"ORTRACE1"
+_RECORD = np.dtype([
+    ("t", "<f8"),
+    ("n_hands", "i1"),
+    ("centers", "<f4", (MAX_HANDS, 2)),
+    ("landmarks", "<f4", (MAX_HANDS, LANDMARKS, 3)),
+])
+
+
+class Trace:
+    """
+    Rekaman deteksi per frame. Slot tangan mengikuti urutan di main.py
+    (diurutkan menurut x, slot 0 = tangan kiri). Nilai NaN = tidak terdeteksi.
+    """
+
+    def __init__(
+        self,
+        t: np.ndarray,
+        n_hands: np.ndarray,
+        centers: np.ndarray,
+        landmarks: np.ndarray,
+        truth: Optional[np.ndarray] = None,
+    ):
+        self.t = t                  # (F,) float64 detik
+        self.n_hands = n_hands      # (F,) int8
+        self.centers = centers      # (F, 2, 2) float32
+        self.landmarks = landmarks  # (F, 2, 21, 3) float32
+        self.truth = truth          # (F, 2) posisi sebenarnya slot 0 (hanya trace sintetis)
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+    def save(self, path: str) -> None:
+        arrays = dict(t=self.t, n_hands=self.n_hands, centers=self.centers, landmarks=self.landmarks)
+        if self.truth is not None:
+            arrays["truth"] = self.truth
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "Trace":
+        """
+        File .npz, atau journal TraceRecorder (path + ".part") kalau sesi
+        berhenti sebelum close() — mis. crash / di-kill.
+        """
+        journal = path if path.endswith(JOURNAL_SUFFIX) else path + JOURNAL_SUFFIX
+        if path == journal or (not os.path.exists(path) and os.path.exists(journal)):
+            return cls.load_journal(journal)
+        with np.load(path) as data:
+            return cls(
+                data["t"],
+                data["n_hands"],
+                data["centers"],
+                data["landmarks"],
+                data["truth"] if "truth" in data else None,
+            )
+
+    @classmethod
+    def load_journal(cls, path: str) -> "Trace":
+        """Journal TraceRecorder; record terakhir yang terpotong (crash) dibuang."""
+        with open(path, "rb") as f:
+            if f.read(len(JOURNAL_MAGIC)) != JOURNAL_MAGIC:
+                raise ValueError(f"not a trace journal: {path}")
+            data = f.read()
+        n = len(data) // _RECORD.itemsize
+        records = np.frombuffer(data, dtype=_RECORD, count=n)
+        return cls(
+            records["t"].copy(),
+            records["n_hands"].copy(),
+            records["centers"].copy(),
+            records["landmarks"].copy(),
+        )
+
+
+class TraceRecorder:
+    """
+    Rekam hasil findHands per frame. Record ditambahkan ke journal
+    (path + ".part") dan di-flush tiap flush_every frame, jadi crash / kill
+    hanya kehilangan frame terakhir; Trace.load(path) membaca journal itu
+    kalau .npz belum ada. close() menyimpan .npz lalu menghapus journal.
+    """
+
+    def __init__(self, path: str, flush_every: int = 30):
+        self.path = path
+        self.journal_path = path + JOURNAL_SUFFIX
+        self.flush_every = flush_every
+        self.frames = 0
+        self._pending: List[tuple] = []
+        self._file = open(self.journal_path, "wb")
+        self._file.write(JOURNAL_MAGIC)
+        self._file.flush()
+
+    def record(self, hands: List[dict], t: Optional[float] = None) -> None:
+        centers = np.full((MAX_HANDS, 2), np.nan, dtype=np.float32)
+        landmarks = np.full((MAX_HANDS, LANDMARKS, 3), np.nan, dtype=np.float32)
+        for slot, hand in enumerate(hands[:MAX_HANDS]):
+            centers[slot] = hand['center'][:2]
+            lm = np.asarray(hand['lmList'], dtype=np.float32)[:LANDMARKS, :3]
+            landmarks[slot, :len(lm), :lm.shape[1]] = lm
+
+        self._pending.append((time.time() if t is None else t, len(hands), centers, landmarks))
+        self.frames += 1
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Tulis record yang tertunda ke journal (sampai ke OS, tahan crash proses)."""
+        if self._pending:
+            self._file.write(np.array(self._pending, dtype=_RECORD).tobytes())
+            self._pending = []
+        self._file.flush()
+
+    def to_trace(self) -> Trace:
+        self.flush()
+        return Trace.load_journal(self.journal_path)
+
+    def close(self) -> None:
+        trace = self.to_trace()
+        self._file.close()
+        trace.save(self.path)
+        os.remove(self.journal_path)
+        print(f"[TraceRecorder] {len(trace)} frames saved to {self.path}")
+
+
+def synthetic_trace(
+    n_frames: int = 3000,
+    fps: float = 30.0,
+    noise: float = 3.0,
+    dropout: float = 0.02,
+    seed: int = 0,
+    width: int = 1280,
+    height: int = 720,
+) -> Trace:
+    """
+    Trace sintetis: gerakan halus + sesekali swipe cepat, ditambah noise
+    gaussian, jitter waktu frame dan frame tanpa deteksi. Posisi sebenarnya
+    disimpan di trace.truth untuk mengukur error & lag.
+    """
+    rng = np.random.default_rng(seed)
+    dt = rng.normal(1.0 / fps, 0.1 / fps, n_frames).clip(0.5 / fps, 2.0 / fps)
+    t = np.cumsum(dt)
+
+    cx, cy = width / 2.0, height / 2.0
+    x = cx + 0.25 * width * np.sin(2 * np.pi * 0.15 * t) + 0.05 * width * np.sin(2 * np.pi * 0.9 * t)
+    y = cy + 0.20 * height * np.cos(2 * np.pi * 0.11 * t)
+
+    # swipe cepat: step halus (sigmoid) di waktu acak
+    for t0 in rng.uniform(t[0], t[-1], max(1, n_frames // 300)):
+        x += 0.15 * width * rng.choice([-1.0, 1.0]) / (1.0 + np.exp(np.clip((t0 - t) * 25.0, -50.0, 50.0)))
+    truth = np.stack([x, y], axis=1).astype(np.float32)
+
+    measured = truth + rng.normal(0.0, noise, truth.shape).astype(np.float32)
+    detected = rng.random(n_frames) >= dropout
+
+    # tangan kanan (slot 1) diam di sisi kanan, dipakai untuk gesture scale
+    right = np.array([0.8 * width, cy], dtype=np.float32)
+    right_meas = right + rng.normal(0.0, noise, (n_frames, 2)).astype(np.float32)
+
+    # landmark: pola tetap di sekitar center + noise
+    pattern = rng.normal(0.0, 40.0, (LANDMARKS, 2)).astype(np.float32)
+    centers = np.full((n_frames, MAX_HANDS, 2), np.nan, dtype=np.float32)
+    landmarks = np.full((n_frames, MAX_HANDS, LANDMARKS, 3), np.nan, dtype=np.float32)
+    for slot, pos in enumerate((measured, right_meas)):
+        centers[detected, slot] = pos[detected]
+        lm = pos[:, None, :] + pattern[None] + rng.normal(0.0, noise, (n_frames, LANDMARKS, 2))
+        landmarks[detected, slot, :, :2] = lm[detected]
+        landmarks[detected, slot, :, 2] = 0.0
+
+    n_hands = np.where(detected, MAX_HANDS, 0).astype(np.int8)
+    return Trace(t, n_hands, centers, landmarks, truth)
@@ -1,9 +1,43 @@
-from .base_tracker import Base
+from .base_tracker import Base, BatchBase
 from .kalman_tracker import KalmanFilterTracker
-from .smoothing_tracker import ExponentialSmoothing
+from .batch_kalman_tracker import BatchKalmanTracker
+from .smoothing_tracker import ExponentialSmoothing, BatchExponentialSmoothing
+from .raw_tracker import RawTracker, BatchRawTracker
+from .one_euro_tracker import OneEuroFilter, BatchOneEuroFilter
+from .alpha_beta_tracker import AlphaBetaTracker, BatchAlphaBetaTracker
+from .ca_kalman_tracker import CAKalmanTracker, BatchCAKalmanTracker
+from .tracker_registry import (
+    TRACKERS,
+    TrackerSpec,
+    available_trackers,
+    create_batch_tracker,
+    create_tracker,
+    format_tracker_spec,
+    parse_tracker_spec,
+    register_tracker,
+)
 
 __all__ = [
     'Base',
+    'BatchBase',
     'KalmanFilterTracker',
+    'BatchKalmanTracker',
     'ExponentialSmoothing',
+    'BatchExponentialSmoothing',
+    'RawTracker',
+    'BatchRawTracker',
+    'OneEuroFilter',
+    'BatchOneEuroFilter',
+    'AlphaBetaTracker',
+    'BatchAlphaBetaTracker',
+    'CAKalmanTracker',
+    'BatchCAKalmanTracker',
+    'TRACKERS',
+    'TrackerSpec',
+    'available_trackers',
+    'create_tracker',
+    'create_batch_tracker',
+    'format_tracker_spec',
+    'parse_tracker_spec',
+    'register_tracker',
 ]
\ No newline at end of file
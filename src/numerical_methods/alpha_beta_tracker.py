@@ -0,0 +1,164 @@
+import math
+from typing import Tuple
+
+import numpy as np
+
+from .base_tracker import Base, BatchBase
+
+
+class AlphaBetaTracker(Base):
+
+    # Filter alpha-beta: prediksi posisi + velocity (px/frame) dengan gain tetap,
+    #   x̂ = x + dt v,  e = z - x̂,  x = x̂ + α e,  v = v + (β / dt) e
+    # Gerak lurus kecepatan konstan diikuti tanpa lag (velocity ikut diestimasi).
+    # beta=None → β = α² / (2 - α) (Benedict-Bordner, redaman kritis).
+    # alpha_max → adaptif: α naik dari alpha ke alpha_max sebanding |e| / jump,
+    # jadi saat manuver (inovasi besar) filter cepat mengejar, saat diam tetap halus.
+
+    def __init__(self, alpha: float = 0.4, beta: float | None = None,
+                 alpha_max: float | None = 0.8, jump: float = 20.0,
+                 frame_period: float = 1.0 / 30.0, max_dt: float = 10.0):
+        self.alpha = alpha
+        self.beta = beta
+        self.alpha_max = alpha_max
+        self.jump = jump
+        # dt dalam satuan frame, sama seperti KalmanFilterTracker
+        self.frame_period = frame_period
+        self.max_dt = max_dt
+
+        self.x = self.y = 0.0
+        self.vx = self.vy = 0.0
+        self.last_t: float | None = None
+        self.initialized = False
+
+    def _frame_dt(self, t: float | None) -> float:
+        if t is None:
+            return 1.0
+        last, self.last_t = self.last_t, t
+        if last is None:
+            return 1.0
+        dt = (t - last) / self.frame_period
+        return min(max(dt, 0.0), self.max_dt)
+
+    def apply(self, x: float, y: float, t: float | None = None) -> Tuple[float, float]:
+        dt = self._frame_dt(t)
+        if not self.initialized:
+            self.x, self.y = x, y
+            self.vx = self.vy = 0.0
+            self.initialized = True
+            return x, y
+
+        px = self.x + dt * self.vx
+        py = self.y + dt * self.vy
+        ex = x - px
+        ey = y - py
+
+        a = self.alpha
+        if self.alpha_max is not None:
+            a += (self.alpha_max - a) * min(1.0, math.hypot(ex, ey) / self.jump)
+        b = self.beta if self.beta is not None else a * a / (2.0 - a)
+
+        self.x = px + a * ex
+        self.y = py + a * ey
+        if dt > 0.0:
+            self.vx += b / dt * ex
+            self.vy += b / dt * ey
+        return self.x, self.y
+
+    def get_position(self) -> Tuple[float, float]:
+        return self.x, self.y
+
+    def get_velocity(self) -> Tuple[float, float]:
+        return self.vx, self.vy
+
+    def get_name(self) -> str:
+        if self.alpha_max is not None:
+            return f"Alpha-Beta (α={self.alpha}..{self.alpha_max})"
+        return f"Alpha-Beta (α={self.alpha})"
+
+
+class BatchAlphaBetaTracker(BatchBase):
+
+    # AlphaBetaTracker untuk N track sekaligus, state posisi & velocity (N, 2)
+
+    def __init__(self, n_tracks: int, alpha: float = 0.4, beta: float | None = None,
+                 alpha_max: float | None = 0.8, jump: float = 20.0,
+                 frame_period: float = 1.0 / 30.0, max_dt: float = 10.0):
+        self.n_tracks = n_tracks
+        self.alpha = alpha
+        self.beta = beta
+        self.alpha_max = alpha_max
+        self.jump = jump
+        self.frame_period = frame_period
+        self.max_dt = max_dt
+
+        self.x = np.zeros((n_tracks, 2), dtype=np.float32)
+        self.v = np.zeros((n_tracks, 2), dtype=np.float32)
+        self.last_t = np.full(n_tracks, np.nan)
+        self.initialized = np.zeros(n_tracks, dtype=bool)
+
+    def reset(self, tracks=None) -> None:
+        if tracks is None:
+            tracks = slice(None)
+        self.x[tracks] = 0.0
+        self.v[tracks] = 0.0
+        self.last_t[tracks] = np.nan
+        self.initialized[tracks] = False
+
+    def update(self, z: np.ndarray, mask: np.ndarray | None = None,
+               t: float | None = None) -> np.ndarray:
+        z = np.asarray(z, dtype=np.float32)
+        if mask is None:
+            mask = np.ones(self.n_tracks, dtype=bool)
+
+        new = mask & ~self.initialized
+        if new.any():
+            self.x[new] = z[new]
+            self.v[new] = 0.0
+            self.last_t[new] = np.nan if t is None else t
+            self.initialized[new] = True
+
+        active = mask & ~new
+        if active.all():
+            self._step(z, slice(None), t)
+        elif active.any():
+            self._step(z, np.flatnonzero(active), t)
+        return self.x.copy()
+
+    def _step(self, z: np.ndarray, idx, t: float | None) -> None:
+        if t is None:
+            dt = np.ones(len(self.last_t[idx]))
+        else:
+            dt = (t - self.last_t[idx]) / self.frame_period
+            dt[np.isnan(dt)] = 1.0
+            dt = np.clip(dt, 0.0, self.max_dt)
+            self.last_t[idx] = t
+        dt = dt[:, None].astype(np.float32)
+
+        x = self.x[idx]
+        v = self.v[idx]
+        x += dt * v
+        e = z[idx] - x
+
+        a = np.full((len(x), 1), self.alpha, dtype=np.float32)
+        if self.alpha_max is not None:
+            norm = np.sqrt(np.einsum("ij,ij->i", e, e))[:, None]
+            a += (self.alpha_max - self.alpha) * np.minimum(1.0, norm / self.jump)
+        b = self.beta if self.beta is not None else a * a / (2.0 - a)
+
+        x += a * e
+        # dt = 0 (frame dobel) → velocity tidak diubah
+        v += np.divide(b * e, dt, out=np.zeros_like(e), where=dt > 0.0)
+
+        if not isinstance(idx, slice):
+            self.x[idx] = x
+            self.v[idx] = v
+
+    def get_positions(self) -> np.ndarray:
+        return self.x.copy()
+
+    def get_velocity(self) -> np.ndarray:
+        return self.v.copy()
+
+    def get_name(self) -> str:
+        return f"Batch Alpha-Beta (α={self.alpha}, {self.n_tracks} tracks)"
@@ -1,11 +1,42 @@
 from abc import ABC, abstractmethod
 from typing import Tuple
 
+import numpy as np
+
+
 class Base(ABC):
     @abstractmethod
-    def apply(self, x: float, y: float) -> Tuple[float, float]:
+    def apply(self, x: float, y: float, t: float | None = None) -> Tuple[float, float]:
+        # t = timestamp pengukuran (detik); filter yang tidak butuh waktu mengabaikannya
+        pass
+
+    @abstractmethod
+    def get_name(self) -> str:
+        pass
+
+
+class BatchBase(ABC):
+
+    # N track independen difilter sekaligus (mis. 21 landmark x 2 tangan).
+    # update() hanya menyentuh track yang ada di mask; track baru langsung
+    # memakai pengukuran, reset() dipakai saat tangan hilang.
+
+    n_tracks: int
+    initialized: np.ndarray
+
+    @abstractmethod
+    def reset(self, tracks=None) -> None:
+        pass
+
+    @abstractmethod
+    def update(self, z: np.ndarray, mask: np.ndarray | None = None,
+               t: float | None = None) -> np.ndarray:
+        pass
+
+    @abstractmethod
+    def get_positions(self) -> np.ndarray:
         pass
 
     @abstractmethod
     def get_name(self) -> str:
-        pass
\ No newline at end of file
+        pass
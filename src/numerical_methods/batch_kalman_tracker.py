@@ -0,0 +1,148 @@
+import numpy as np
+
+from .base_tracker import BatchBase
+from .kalman_tracker import KalmanFilterTracker
+
+
+class BatchKalmanTracker(BatchBase):
+
+    # N track independen, masing-masing state [x, y, vx, vy] (model sama dengan
+    # KalmanFilterTracker). State (N, 4) dan covariance (N, 4, 4) disimpan
+    # bertumpuk sehingga satu frame = satu set operasi vektor untuk semua track.
+    # dt per track dari t (satuan frame, seperti KalmanFilterTracker): F dan Q
+    # mengikuti dt. steady_state=True: gain konvergen (dt = 1) dihitung sekali,
+    # sama dengan KalmanFilterTracker(steady_state=True).
+
+    def __init__(self, n_tracks: int, q: float = 0.03, r: float = 0.1, p0: float = 10.0,
+                 steady_state: bool = False, frame_period: float = 1.0 / 30.0,
+                 max_dt: float = 10.0):
+        self.n_tracks = n_tracks
+        self.p0 = p0
+        self.steady_state = steady_state
+        self.frame_period = frame_period
+        self.max_dt = max_dt
+
+        self.F = np.array([
+            [1, 0, 1, 0],
+            [0, 1, 0, 1],
+            [0, 0, 1, 0],
+            [0, 0, 0, 1]
+        ], dtype=np.float32)
+        self.Q = np.eye(4, dtype=np.float32) * q
+        self.R = np.eye(2, dtype=np.float32) * r
+
+        self.x = np.zeros((n_tracks, 4), dtype=np.float32)
+        self.P = np.tile(np.eye(4, dtype=np.float32) * p0, (n_tracks, 1, 1))
+        self.last_t = np.full(n_tracks, np.nan)
+        self.initialized = np.zeros(n_tracks, dtype=bool)
+
+        # gain (k_pos, k_vel) steady-state; sumbu x dan y punya noise sama
+        self._k: tuple | None = None
+        if steady_state:
+            self._k = KalmanFilterTracker._converge([p0, 0.0, p0], q, q, r, 1e-9, 10000)
+
+        # buffer kerja, dipakai ulang tiap frame
+        self._S_inv = np.empty((n_tracks, 2, 2), dtype=np.float32)
+        self._K = np.empty((n_tracks, 4, 2), dtype=np.float32)
+
+    def reset(self, tracks=None) -> None:
+        """Reset track (index / mask); None = semua track. Dipakai saat tangan hilang."""
+        if tracks is None:
+            tracks = slice(None)
+        self.x[tracks] = 0.0
+        self.P[tracks] = np.eye(4, dtype=np.float32) * self.p0
+        self.last_t[tracks] = np.nan
+        self.initialized[tracks] = False
+
+    def update(self, z: np.ndarray, mask: np.ndarray | None = None,
+               t: float | None = None) -> np.ndarray:
+        """
+        z: pengukuran (N, 2). mask: (N,) track yang punya pengukuran frame ini;
+        track lain tidak disentuh. Return posisi hasil filter (N, 2).
+        t = timestamp frame (detik); None = anggap tepat 1 frame.
+        """
+        z = np.asarray(z, dtype=np.float32)
+        if mask is None:
+            mask = np.ones(self.n_tracks, dtype=bool)
+
+        # track baru: langsung pakai pengukuran
+        new = mask & ~self.initialized
+        if new.any():
+            self.x[new, :2] = z[new]
+            self.x[new, 2:] = 0.0
+            self.last_t[new] = np.nan if t is None else t
+            self.initialized[new] = True
+
+        active = mask & ~new
+        if active.all():
+            self._step(z, slice(None), t)
+        elif active.any():
+            self._step(z, np.flatnonzero(active), t)
+
+        return self.x[:, :2].copy()
+
+    def _step(self, z: np.ndarray, idx, t: float | None) -> None:
+        if t is None:
+            dt = np.ones(len(self.last_t[idx]), dtype=np.float32)
+        else:
+            dt = (t - self.last_t[idx]) / self.frame_period
+            dt[np.isnan(dt)] = 1.0
+            dt = np.clip(dt, 0.0, self.max_dt).astype(np.float32)
+            self.last_t[idx] = t
+
+        x = self.x[idx]
+        if self._k is not None:
+            # gain tetap: prediksi ikut dt, covariance tidak dihitung
+            k0, k1 = self._k
+            x[:, :2] += dt[:, None] * x[:, 2:]
+            y = z[idx] - x[:, :2]
+            x[:, :2] += k0 * y
+            x[:, 2:] += k1 * y
+            if not isinstance(idx, slice):
+                self.x[idx] = x
+            return
+
+        P = self.P[idx]
+
+        # PREDICT: x̂ = F(dt) x, P̂ = F P F^T + Q dt
+        # F hanya "pos += dt vel", jadi F P F^T = tambah blok baris lalu blok kolom
+        dt3 = dt[:, None, None]
+        x[:, :2] += dt[:, None] * x[:, 2:]
+        P[:, :2, :] += dt3 * P[:, 2:, :]
+        P[:, :, :2] += dt3 * P[:, :, 2:]
+        P += self.Q * dt3
+
+        # INNOVATION: y = z - H x̂, S = H P̂ H^T + R (= blok 2x2 kiri atas + R)
+        y = z[idx] - x[:, :2]
+        S = P[:, :2, :2] + self.R
+
+        # S^-1 closed form untuk 2x2
+        det = S[:, 0, 0] * S[:, 1, 1] - S[:, 0, 1] * S[:, 1, 0]
+        S_inv = self._S_inv[idx] if isinstance(idx, slice) else np.empty_like(S)
+        S_inv[:, 0, 0] = S[:, 1, 1] / det
+        S_inv[:, 1, 1] = S[:, 0, 0] / det
+        S_inv[:, 0, 1] = -S[:, 0, 1] / det
+        S_inv[:, 1, 0] = -S[:, 1, 0] / det
+
+        # K = P̂ H^T S^-1 (H^T memilih 2 kolom pertama P̂)
+        K = self._K[idx] if isinstance(idx, slice) else np.empty((len(x), 4, 2), dtype=np.float32)
+        np.matmul(P[:, :, :2], S_inv, out=K)
+
+        # UPDATE: x = x̂ + K y, P = (I - K H) P̂ = P̂ - K (H P̂)
+        x += np.einsum("nij,nj->ni", K, y)
+        P -= np.matmul(K, P[:, :2, :])
+
+        if not isinstance(idx, slice):
+            self.x[idx] = x
+            self.P[idx] = P
+
+    def get_positions(self) -> np.ndarray:
+        return self.x[:, :2].copy()
+
+    def get_velocity(self) -> np.ndarray:
+        return self.x[:, 2:].copy()
+
+    def get_name(self) -> str:
+        if self.steady_state:
+            return f"Batch Kalman Filter, steady-state ({self.n_tracks} tracks)"
+        return f"Batch Kalman Filter ({self.n_tracks} tracks)"
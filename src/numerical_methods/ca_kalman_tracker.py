@@ -0,0 +1,212 @@
+from typing import Tuple
+
+import numpy as np
+
+from .base_tracker import Base, BatchBase
+
+
+class CAKalmanTracker(Base):
+
+    # Kalman constant-acceleration: state per sumbu [pos, vel, acc] (satuan
+    # frame, seperti KalmanFilterTracker), F(dt) = [[1, dt, dt²/2], [0, 1, dt], [0, 0, 1]].
+    # Percepatan ikut diestimasi, jadi awal/akhir gerakan (tangan mulai /
+    # berhenti) lebih cepat diikuti daripada model constant-velocity.
+    #
+    # Sumbu x dan y saling lepas dengan noise yang sama, jadi covariance 3x3
+    # simetris (6 skalar) cukup satu untuk kedua sumbu; inovasi skalar →
+    # update closed form tanpa matriks / alokasi NumPy.
+
+    def __init__(self, q: float = 0.2, r: float = 9.0, p0: float = 10.0,
+                 frame_period: float = 1.0 / 30.0, max_dt: float = 10.0):
+        # q: process noise percepatan (px²/frame⁴ per frame), r: noise pengukuran (px²)
+        self.q = q
+        self.r = r
+        self.p0 = p0
+        self.frame_period = frame_period
+        self.max_dt = max_dt
+
+        self.px = self.py = 0.0
+        self.vx = self.vy = 0.0
+        self.ax = self.ay = 0.0
+        # covariance [[a, b, c], [b, d, e], [c, e, f]]
+        self.cov = [r, 0.0, 0.0, p0, 0.0, p0]
+        self.last_t: float | None = None
+        self.initialized = False
+
+    def _frame_dt(self, t: float | None) -> float:
+        if t is None:
+            return 1.0
+        last, self.last_t = self.last_t, t
+        if last is None:
+            return 1.0
+        dt = (t - last) / self.frame_period
+        return min(max(dt, 0.0), self.max_dt)
+
+    @staticmethod
+    def _covariance_step(cov, dt: float, q: float, r: float) -> Tuple[float, float, float]:
+        """Predict + update covariance (in place), return gain (k_pos, k_vel, k_acc)."""
+        a, b, c, d, e, f = cov
+        h = 0.5 * dt * dt
+        # P̂ = F P F^T + Q(dt), Q = diag(0, 0, q dt)
+        m0 = a + dt * b + h * c
+        m1 = b + dt * d + h * e
+        m2 = c + dt * e + h * f
+        a = m0 + dt * m1 + h * m2
+        b = m1 + dt * m2
+        c = m2
+        n1 = d + dt * e
+        n2 = e + dt * f
+        d = n1 + dt * n2
+        e = n2
+        f = f + q * dt
+        # H = [1, 0, 0]: S = a + r, K = P̂ H^T / S, P = (I - K H) P̂
+        s = a + r
+        k0, k1, k2 = a / s, b / s, c / s
+        cov[0] = a - k0 * a
+        cov[1] = b - k0 * b
+        cov[2] = c - k0 * c
+        cov[3] = d - k1 * b
+        cov[4] = e - k1 * c
+        cov[5] = f - k2 * c
+        return k0, k1, k2
+
+    def apply(self, x: float, y: float, t: float | None = None) -> Tuple[float, float]:
+        dt = self._frame_dt(t)
+        if not self.initialized:
+            self.px, self.py = x, y
+            self.vx = self.vy = self.ax = self.ay = 0.0
+            self.cov = [self.r, 0.0, 0.0, self.p0, 0.0, self.p0]
+            self.initialized = True
+            return x, y
+
+        h = 0.5 * dt * dt
+        px = self.px + dt * self.vx + h * self.ax
+        py = self.py + dt * self.vy + h * self.ay
+        vx = self.vx + dt * self.ax
+        vy = self.vy + dt * self.ay
+
+        k0, k1, k2 = self._covariance_step(self.cov, dt, self.q, self.r)
+        ex = x - px
+        ey = y - py
+        self.px = px + k0 * ex
+        self.py = py + k0 * ey
+        self.vx = vx + k1 * ex
+        self.vy = vy + k1 * ey
+        self.ax += k2 * ex
+        self.ay += k2 * ey
+        return self.px, self.py
+
+    def get_position(self) -> Tuple[float, float]:
+        return self.px, self.py
+
+    def get_velocity(self) -> Tuple[float, float]:
+        return self.vx, self.vy
+
+    def get_name(self) -> str:
+        return f"CA Kalman (q={self.q}, r={self.r})"
+
+
+class BatchCAKalmanTracker(BatchBase):
+
+    # CAKalmanTracker untuk N track: state pos/vel/acc (N, 2), covariance
+    # 6 skalar per track (N, 6) — track mulai di frame berbeda, jadi
+    # covariance-nya tidak bisa dibagi.
+
+    def __init__(self, n_tracks: int, q: float = 0.2, r: float = 9.0, p0: float = 10.0,
+                 frame_period: float = 1.0 / 30.0, max_dt: float = 10.0):
+        self.n_tracks = n_tracks
+        self.q = q
+        self.r = r
+        self.p0 = p0
+        self.frame_period = frame_period
+        self.max_dt = max_dt
+
+        self.p = np.zeros((n_tracks, 2), dtype=np.float32)
+        self.v = np.zeros((n_tracks, 2), dtype=np.float32)
+        self.a = np.zeros((n_tracks, 2), dtype=np.float32)
+        self.cov = np.tile(np.array([r, 0.0, 0.0, p0, 0.0, p0], dtype=np.float32), (n_tracks, 1))
+        self.last_t = np.full(n_tracks, np.nan)
+        self.initialized = np.zeros(n_tracks, dtype=bool)
+
+    def reset(self, tracks=None) -> None:
+        if tracks is None:
+            tracks = slice(None)
+        self.p[tracks] = 0.0
+        self.v[tracks] = 0.0
+        self.a[tracks] = 0.0
+        self.cov[tracks] = (self.r, 0.0, 0.0, self.p0, 0.0, self.p0)
+        self.last_t[tracks] = np.nan
+        self.initialized[tracks] = False
+
+    def update(self, z: np.ndarray, mask: np.ndarray | None = None,
+               t: float | None = None) -> np.ndarray:
+        z = np.asarray(z, dtype=np.float32)
+        if mask is None:
+            mask = np.ones(self.n_tracks, dtype=bool)
+
+        new = mask & ~self.initialized
+        if new.any():
+            self.reset(new)
+            self.p[new] = z[new]
+            self.last_t[new] = np.nan if t is None else t
+            self.initialized[new] = True
+
+        active = mask & ~new
+        if active.all():
+            self._step(z, slice(None), t)
+        elif active.any():
+            self._step(z, np.flatnonzero(active), t)
+        return self.p.copy()
+
+    def _step(self, z: np.ndarray, idx, t: float | None) -> None:
+        if t is None:
+            dt = np.ones(len(self.last_t[idx]), dtype=np.float32)
+        else:
+            dt = (t - self.last_t[idx]) / self.frame_period
+            dt[np.isnan(dt)] = 1.0
+            dt = np.clip(dt, 0.0, self.max_dt).astype(np.float32)
+            self.last_t[idx] = t
+        h = 0.5 * dt * dt
+
+        # covariance: rumus yang sama dengan CAKalmanTracker._covariance_step, per kolom
+        a, b, c, d, e, f = self.cov[idx].T
+        m0 = a + dt * b + h * c
+        m1 = b + dt * d + h * e
+        m2 = c + dt * e + h * f
+        a = m0 + dt * m1 + h * m2
+        b = m1 + dt * m2
+        c = m2
+        n1 = d + dt * e
+        n2 = e + dt * f
+        d = n1 + dt * n2
+        e = n2
+        f = f + self.q * dt
+        s = a + self.r
+        k0, k1, k2 = a / s, b / s, c / s
+        self.cov[idx] = np.stack((a - k0 * a, b - k0 * b, c - k0 * c,
+                                  d - k1 * b, e - k1 * c, f - k2 * c), axis=1)
+
+        dt, h = dt[:, None], h[:, None]
+        p = self.p[idx]
+        v = self.v[idx]
+        acc = self.a[idx]
+        p += dt * v + h * acc
+        v += dt * acc
+        err = z[idx] - p
+        p += k0[:, None] * err
+        v += k1[:, None] * err
+        acc += k2[:, None] * err
+
+        if not isinstance(idx, slice):
+            self.p[idx] = p
+            self.v[idx] = v
+            self.a[idx] = acc
+
+    def get_positions(self) -> np.ndarray:
+        return self.p.copy()
+
+    def get_velocity(self) -> np.ndarray:
+        return self.v.copy()
+
+    def get_name(self) -> str:
+        return f"Batch CA Kalman (q={self.q}, r={self.r}, {self.n_tracks} tracks)"
@@ -5,8 +5,16 @@ from .base_tracker import Base
 class KalmanFilterTracker(Base):
 
     # State: [x, y, vx, vy]
-
-    def __init__(self):
+    #
+    # fast=True: update tanpa alokasi. Dengan F/H/Q/R di sini sumbu x dan y
+    # saling lepas, jadi tiap sumbu cukup state (pos, vel) + covariance 2x2
+    # simetris (3 skalar) dan inovasi diselesaikan closed form.
+    # steady_state=True: gain konvergen dihitung sekali, update jadi biaya tetap
+    # (setara filter alpha-beta).
+
+    def __init__(self, fast: bool = False, steady_state: bool = False,
+                 frame_period: float = 1.0 / 30.0, max_dt: float = 10.0,
+                 q: float = 0.03, r: float = 0.1):
         # PREDIKSI KEMANA
         self.F = np.array([
             [1, 0, 1, 0],
@@ -22,27 +30,118 @@ class KalmanFilterTracker(Base):
         ], dtype=np.float32)
 
         # SEBERAPA HALUS / PERCAYA MODEL vs SENSOR
-        self.Q = np.eye(4, dtype=np.float32) * 0.03  # process noise - model
-        self.R = np.eye(2, dtype=np.float32) * 0.1   # measurement noise - sensor
+        self.Q = np.eye(4, dtype=np.float32) * q     # process noise - model
+        self.R = np.eye(2, dtype=np.float32) * r     # measurement noise - sensor
 
         # STATE & COVARIANCE
         self.x = np.zeros((4, 1), dtype=np.float32)      # [x, y, vx, vy]^T
         self.P = np.eye(4, dtype=np.float32) * 10        # covariance 4x4
         self.initialized = False
 
-    def apply(self, x: float, y: float) -> Tuple[float, float]:
-        # measurement vector (2x1)
-        z = np.array([[x], [y]], dtype=np.float32)
+        # dt dalam satuan frame: dt = (t - t_prev) / frame_period, 1.0 = frame normal
+        self.frame_period = frame_period
+        self.max_dt = max_dt
+        self.last_t: float | None = None
+
+        self.fast = fast or steady_state
+        self.steady_state = steady_state
+        self._reset_fast()
+        if steady_state:
+            self._compute_steady_state_gain()
+
+    def _reset_fast(self) -> None:
+        # state & covariance per sumbu untuk jalur cepat
+        self._px = self._py = self._vx = self._vy = 0.0
+        p0 = float(self.P[0, 0])
+        # [a, b, c] = [[a, b], [b, c]] covariance (pos, vel) sumbu x dan y
+        self._cx = [p0, 0.0, float(self.P[2, 2])]
+        self._cy = [float(self.P[1, 1]), 0.0, float(self.P[3, 3])]
+        # (q_pos, q_vel, r) per sumbu sebagai float biasa (akses numpy per call mahal)
+        self._noise_x = (float(self.Q[0, 0]), float(self.Q[2, 2]), float(self.R[0, 0]))
+        self._noise_y = (float(self.Q[1, 1]), float(self.Q[3, 3]), float(self.R[1, 1]))
+
+    def _compute_steady_state_gain(self, tol: float = 1e-9, max_iter: int = 10000) -> None:
+        """Iterasi Riccati (dt = 1 frame) sampai gain konvergen."""
+        self._kx = self._converge(self._cx[:], *self._noise_x, tol, max_iter)
+        self._ky = self._converge(self._cy[:], *self._noise_y, tol, max_iter)
+
+    @staticmethod
+    def _converge(cov, qp, qv, r, tol, max_iter) -> Tuple[float, float]:
+        k0 = k1 = 0.0
+        for _ in range(max_iter):
+            prev = (k0, k1)
+            k0, k1 = KalmanFilterTracker._covariance_step(cov, 1.0, qp, qv, r)
+            if abs(k0 - prev[0]) < tol and abs(k1 - prev[1]) < tol:
+                break
+        return k0, k1
+
+    @staticmethod
+    def _covariance_step(cov, dt, qp, qv, r) -> Tuple[float, float]:
+        """Predict + update covariance 2x2 satu sumbu (in place), return gain (k_pos, k_vel)."""
+        a, b, c = cov
+        # P̂ = F P F^T + Q(dt),  F = [[1, dt], [0, 1]]
+        a = a + 2.0 * dt * b + dt * dt * c + qp * dt
+        b = b + dt * c
+        c = c + qv * dt
+        # S = a + r (skalar), K = P̂ H^T / S
+        s = a + r
+        k0 = a / s
+        k1 = b / s
+        # P = (I - K H) P̂
+        cov[0] = (1.0 - k0) * a
+        cov[1] = (1.0 - k0) * b
+        cov[2] = c - k1 * b
+        return k0, k1
+
+    def _frame_dt(self, t: float | None) -> float:
+        if t is None:
+            return 1.0
+        last, self.last_t = self.last_t, t
+        if last is None:
+            return 1.0
+        dt = (t - last) / self.frame_period
+        return min(max(dt, 0.0), self.max_dt)
+
+    def _apply_fast(self, x: float, y: float, dt: float) -> Tuple[float, float]:
+        px = self._px + dt * self._vx
+        py = self._py + dt * self._vy
+        if self.steady_state:
+            kx0, kx1 = self._kx
+            ky0, ky1 = self._ky
+        else:
+            kx0, kx1 = self._covariance_step(self._cx, dt, *self._noise_x)
+            ky0, ky1 = self._covariance_step(self._cy, dt, *self._noise_y)
+        ex = x - px
+        ey = y - py
+        self._px = px + kx0 * ex
+        self._py = py + ky0 * ey
+        self._vx += kx1 * ex
+        self._vy += ky1 * ey
+        return self._px, self._py
+
+    def apply(self, x: float, y: float, t: float | None = None) -> Tuple[float, float]:
+        # t = timestamp pengukuran (detik); None = anggap tepat 1 frame
+        dt = self._frame_dt(t)
 
         if not self.initialized:
             self.x[0, 0] = x
             self.x[1, 0] = y
+            self._px, self._py = x, y
             self.initialized = True
             return x, y
 
+        if self.fast:
+            return self._apply_fast(x, y, dt)
+
+        # measurement vector (2x1)
+        z = np.array([[x], [y]], dtype=np.float32)
+
+        # F dan Q mengikuti dt sebenarnya (dt = 1 → sama dengan model awal)
+        self.F[0, 2] = self.F[1, 3] = dt
+
         # PREDICT (time update)
         self.x = self.F @ self.x                          # x̂ = F x
-        self.P = self.F @ self.P @ self.F.T + self.Q      # P̂ = F P F^T + Q
+        self.P = self.F @ self.P @ self.F.T + self.Q * dt # P̂ = F P F^T + Q
 
         # INNOVATION (measurement update)
         y_tilde = z - self.H @ self.x                     # y = z - H x̂
@@ -60,8 +159,17 @@ class KalmanFilterTracker(Base):
 
         return float(self.x[0, 0]), float(self.x[1, 0])
 
+    def get_position(self) -> Tuple[float, float]:
+        if self.fast:
+            return self._px, self._py
+        return float(self.x[0, 0]), float(self.x[1, 0])
+
     def get_velocity(self) -> Tuple[float, float]:
+        if self.fast:
+            return self._vx, self._vy
         return float(self.x[2, 0]), float(self.x[3, 0])
 
     def get_name(self) -> str:
+        if self.steady_state:
+            return "Kalman Filter (steady-state)"
         return "Kalman Filter"
\ No newline at end of file
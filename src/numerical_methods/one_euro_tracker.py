@@ -0,0 +1,154 @@
+import math
+from typing import Tuple
+
+import numpy as np
+
+from .base_tracker import Base, BatchBase
+
+
+def _smoothing_factor(cutoff: float, dt: float) -> float:
+    # low-pass orde 1: α = r / (r + 1), r = 2π f_c dt
+    r = 2.0 * math.pi * cutoff * dt
+    return r / (r + 1.0)
+
+
+class OneEuroFilter(Base):
+
+    # One Euro filter (Casiez et al., CHI 2012): low-pass yang cutoff-nya naik
+    # sebanding kecepatan, f_c = min_cutoff + beta * |kecepatan|.
+    # Diam → cutoff rendah (jitter diredam); gerak cepat → cutoff tinggi (lag kecil).
+    # Kecepatan (px/s) juga di-low-pass dengan d_cutoff. Satu cutoff untuk
+    # kedua sumbu (dari besar vektor kecepatan) supaya arah gerak tidak terdistorsi.
+
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 0.05, d_cutoff: float = 1.0,
+                 frame_period: float = 1.0 / 30.0, max_dt: float = 1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        # dt (detik) kalau t tidak diberikan, dan batas atas dt (tangan hilang lama)
+        self.frame_period = frame_period
+        self.max_dt = max_dt
+
+        self.x = self.y = 0.0
+        self.dx = self.dy = 0.0
+        self.last_t: float | None = None
+        self.initialized = False
+
+    def apply(self, x: float, y: float, t: float | None = None) -> Tuple[float, float]:
+        if not self.initialized:
+            self.x, self.y = x, y
+            self.dx = self.dy = 0.0
+            self.last_t = t
+            self.initialized = True
+            return x, y
+
+        if t is None or self.last_t is None:
+            dt = self.frame_period
+        else:
+            dt = t - self.last_t
+            if dt <= 0.0:
+                # timestamp sama (frame dobel): tidak ada info baru
+                return self.x, self.y
+            dt = min(dt, self.max_dt)
+        self.last_t = t
+
+        # kecepatan dari posisi terfilter sebelumnya, lalu di-low-pass
+        a_d = _smoothing_factor(self.d_cutoff, dt)
+        self.dx += a_d * ((x - self.x) / dt - self.dx)
+        self.dy += a_d * ((y - self.y) / dt - self.dy)
+
+        cutoff = self.min_cutoff + self.beta * math.hypot(self.dx, self.dy)
+        a = _smoothing_factor(cutoff, dt)
+        self.x += a * (x - self.x)
+        self.y += a * (y - self.y)
+        return self.x, self.y
+
+    def get_position(self) -> Tuple[float, float]:
+        return self.x, self.y
+
+    def get_velocity(self) -> Tuple[float, float]:
+        # px per frame (sama dengan satuan velocity KalmanFilterTracker)
+        return self.dx * self.frame_period, self.dy * self.frame_period
+
+    def get_name(self) -> str:
+        return f"One Euro (min_cutoff={self.min_cutoff}, beta={self.beta})"
+
+
+class BatchOneEuroFilter(BatchBase):
+
+    # OneEuroFilter untuk N track sekaligus; tiap track menyimpan waktu
+    # update terakhirnya sendiri (track yang tidak ada di mask tidak maju).
+
+    def __init__(self, n_tracks: int, min_cutoff: float = 1.0, beta: float = 0.05,
+                 d_cutoff: float = 1.0, frame_period: float = 1.0 / 30.0, max_dt: float = 1.0):
+        self.n_tracks = n_tracks
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.frame_period = frame_period
+        self.max_dt = max_dt
+
+        self.x = np.zeros((n_tracks, 2), dtype=np.float32)
+        self.dx = np.zeros((n_tracks, 2), dtype=np.float32)
+        self.last_t = np.full(n_tracks, np.nan)
+        self.initialized = np.zeros(n_tracks, dtype=bool)
+
+    def reset(self, tracks=None) -> None:
+        if tracks is None:
+            tracks = slice(None)
+        self.x[tracks] = 0.0
+        self.dx[tracks] = 0.0
+        self.last_t[tracks] = np.nan
+        self.initialized[tracks] = False
+
+    def update(self, z: np.ndarray, mask: np.ndarray | None = None,
+               t: float | None = None) -> np.ndarray:
+        z = np.asarray(z, dtype=np.float32)
+        if mask is None:
+            mask = np.ones(self.n_tracks, dtype=bool)
+
+        new = mask & ~self.initialized
+        if new.any():
+            self.x[new] = z[new]
+            self.dx[new] = 0.0
+            self.last_t[new] = np.nan if t is None else t
+            self.initialized[new] = True
+
+        active = mask & ~new
+        if active.all():
+            self._step(z, slice(None), t)
+        elif active.any():
+            self._step(z, np.flatnonzero(active), t)
+        return self.x.copy()
+
+    def _step(self, z: np.ndarray, idx, t: float | None) -> None:
+        if t is None:
+            dt = np.full(len(self.last_t[idx]), self.frame_period)
+        else:
+            dt = t - self.last_t[idx]
+            dt[np.isnan(dt)] = self.frame_period
+            self.last_t[idx] = t
+        # dt <= 0 (frame dobel) → track tidak berubah
+        moving = dt > 0.0
+        dt = np.clip(dt, 1e-6, self.max_dt)[:, None]
+
+        x = self.x[idx]
+        dx = self.dx[idx]
+        r = 2.0 * np.pi * self.d_cutoff * dt
+        a_d = np.where(moving[:, None], r / (r + 1.0), 0.0)
+        dx += a_d * ((z[idx] - x) / dt - dx)
+
+        cutoff = self.min_cutoff + self.beta * np.sqrt(np.einsum("ij,ij->i", dx, dx))[:, None]
+        r = 2.0 * np.pi * cutoff * dt
+        a = np.where(moving[:, None], r / (r + 1.0), 0.0)
+        x += a * (z[idx] - x)
+
+        if not isinstance(idx, slice):
+            self.x[idx] = x
+            self.dx[idx] = dx
+
+    def get_positions(self) -> np.ndarray:
+        return self.x.copy()
+
+    def get_name(self) -> str:
+        return f"Batch One Euro (min_cutoff={self.min_cutoff}, beta={self.beta}, {self.n_tracks} tracks)"
@@ -0,0 +1,49 @@
+from typing import Tuple
+
+import numpy as np
+
+from .base_tracker import Base, BatchBase
+
+
+class RawTracker(Base):
+
+    # tanpa filter: pengukuran diteruskan apa adanya (pembanding di replay / registry)
+
+    def apply(self, x: float, y: float, t: float | None = None) -> Tuple[float, float]:
+        return x, y
+
+    def get_name(self) -> str:
+        return "Raw"
+
+
+class BatchRawTracker(BatchBase):
+
+    # track tanpa pengukuran di frame ini tetap di posisi terakhir
+
+    def __init__(self, n_tracks: int):
+        self.n_tracks = n_tracks
+        self.x = np.zeros((n_tracks, 2), dtype=np.float32)
+        self.initialized = np.zeros(n_tracks, dtype=bool)
+
+    def reset(self, tracks=None) -> None:
+        if tracks is None:
+            tracks = slice(None)
+        self.x[tracks] = 0.0
+        self.initialized[tracks] = False
+
+    def update(self, z: np.ndarray, mask: np.ndarray | None = None,
+               t: float | None = None) -> np.ndarray:
+        z = np.asarray(z, dtype=np.float32)
+        if mask is None:
+            self.x[:] = z
+            self.initialized[:] = True
+        else:
+            self.x[mask] = z[mask]
+            self.initialized |= mask
+        return self.x.copy()
+
+    def get_positions(self) -> np.ndarray:
+        return self.x.copy()
+
+    def get_name(self) -> str:
+        return f"Batch Raw ({self.n_tracks} tracks)"
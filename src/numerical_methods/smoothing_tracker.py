@@ -1,5 +1,8 @@
 from typing import Tuple
-from .base_tracker import Base
+
+import numpy as np
+
+from .base_tracker import Base, BatchBase
 
 class ExponentialSmoothing(Base):
 
@@ -11,7 +14,8 @@ class ExponentialSmoothing(Base):
         self.prev_y: float = 0.0
         self.initialized = False
 
-    def apply(self, x: float, y: float) -> Tuple[float, float]:
+    def apply(self, x: float, y: float, t: float | None = None) -> Tuple[float, float]:
+        # t tidak dipakai (α tetap per frame)
         if not self.initialized:
             self.prev_x = x
             self.prev_y = y
@@ -24,3 +28,45 @@ class ExponentialSmoothing(Base):
 
     def get_name(self) -> str:
         return f"Exponential Smoothing (α={self.alpha})"
+
+
+class BatchExponentialSmoothing(BatchBase):
+
+    # ExponentialSmoothing untuk N track sekaligus, state (N, 2)
+
+    def __init__(self, n_tracks: int, alpha: float = 0.7):
+        self.n_tracks = n_tracks
+        self.alpha = alpha
+        self.x = np.zeros((n_tracks, 2), dtype=np.float32)
+        self.initialized = np.zeros(n_tracks, dtype=bool)
+
+    def reset(self, tracks=None) -> None:
+        if tracks is None:
+            tracks = slice(None)
+        self.x[tracks] = 0.0
+        self.initialized[tracks] = False
+
+    def update(self, z: np.ndarray, mask: np.ndarray | None = None,
+               t: float | None = None) -> np.ndarray:
+        z = np.asarray(z, dtype=np.float32)
+        if mask is None:
+            mask = np.ones(self.n_tracks, dtype=bool)
+
+        new = mask & ~self.initialized
+        if new.any():
+            self.x[new] = z[new]
+            self.initialized[new] = True
+
+        active = mask & ~new
+        if active.all():
+            # x += α (z - x), in place
+            self.x += self.alpha * (z - self.x)
+        elif active.any():
+            self.x[active] += self.alpha * (z[active] - self.x[active])
+        return self.x.copy()
+
+    def get_positions(self) -> np.ndarray:
+        return self.x.copy()
+
+    def get_name(self) -> str:
+        return f"Batch Exponential Smoothing (α={self.alpha}, {self.n_tracks} tracks)"
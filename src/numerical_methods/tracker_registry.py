@@ -0,0 +1,153 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .alpha_beta_tracker import AlphaBetaTracker, BatchAlphaBetaTracker
+from .base_tracker import Base, BatchBase
+from .batch_kalman_tracker import BatchKalmanTracker
+from .ca_kalman_tracker import BatchCAKalmanTracker, CAKalmanTracker
+from .kalman_tracker import KalmanFilterTracker
+from .one_euro_tracker import BatchOneEuroFilter, OneEuroFilter
+from .raw_tracker import BatchRawTracker, RawTracker
+from .smoothing_tracker import BatchExponentialSmoothing, ExponentialSmoothing
+
+
+class TrackerSpec:
+    """
+    Satu filter di registry: nama, parameter default, konstruktor jalur
+    skalar (satu titik, Base) dan jalur batch (N titik, BatchBase). Kedua
+    konstruktor menerima parameter yang sama.
+    """
+
+    def __init__(self, name: str, scalar: Callable[..., Base],
+                 batch: Callable[..., BatchBase], params: Dict[str, Optional[float]],
+                 description: str = ""):
+        self.name = name
+        self.scalar = scalar
+        self.batch = batch
+        self.params = params
+        self.description = description
+
+    def resolve(self, overrides: Dict[str, Optional[float]]) -> Dict[str, Optional[float]]:
+        unknown = set(overrides) - set(self.params)
+        if unknown:
+            known = ", ".join(self.params) or "none"
+            raise ValueError(f"unknown parameter(s) for tracker '{self.name}': "
+                             f"{', '.join(sorted(unknown))} (known: {known})")
+        params = dict(self.params)
+        params.update(overrides)
+        return params
+
+
+TRACKERS: Dict[str, TrackerSpec] = {}
+
+
+def register_tracker(name: str, scalar: Callable[..., Base], batch: Callable[..., BatchBase],
+                     description: str = "", **params: Optional[float]) -> TrackerSpec:
+    """Tambah / ganti filter di registry (params = nilai default yang boleh di-override)."""
+    spec = TrackerSpec(name, scalar, batch, params, description)
+    TRACKERS[name] = spec
+    return spec
+
+
+def available_trackers() -> List[str]:
+    return list(TRACKERS)
+
+
+def _parse_value(text: str) -> Optional[float]:
+    text = text.strip()
+    if text.lower() in ("none", "off"):
+        return None
+    return float(text)
+
+
+def parse_tracker_spec(spec: str) -> Tuple[str, Dict[str, Optional[float]]]:
+    """
+    "one-euro:min_cutoff=0.5,beta=0.1" → ("one-euro", {"min_cutoff": 0.5, "beta": 0.1}).
+    Nilai "none" → None (mis. alpha-beta:alpha_max=none = tanpa adaptasi).
+    """
+    name, _, rest = spec.strip().partition(":")
+    params: Dict[str, Optional[float]] = {}
+    for item in filter(None, (p.strip() for p in rest.split(","))):
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"expected key=value in tracker spec, got '{item}'")
+        try:
+            params[key.strip()] = _parse_value(value)
+        except ValueError:
+            raise ValueError(f"invalid value for '{key.strip()}' in tracker spec: '{value}'") from None
+    return name.strip(), params
+
+
+def _lookup(spec: str, overrides: Dict[str, Optional[float]]) -> Tuple[TrackerSpec, Dict[str, Optional[float]]]:
+    name, params = parse_tracker_spec(spec)
+    if name not in TRACKERS:
+        raise ValueError(f"unknown tracker '{name}' (available: {', '.join(TRACKERS)})")
+    entry = TRACKERS[name]
+    params.update(overrides)
+    return entry, entry.resolve(params)
+
+
+def create_tracker(spec: str, **overrides: Optional[float]) -> Base:
+    """Filter jalur skalar dari nama / spec ("kalman", "one-euro:beta=0.1")."""
+    entry, params = _lookup(spec, overrides)
+    return entry.scalar(**params)
+
+
+def create_batch_tracker(spec: str, n_tracks: int, **overrides: Optional[float]) -> BatchBase:
+    """Filter jalur batch untuk n_tracks titik dengan spec yang sama."""
+    entry, params = _lookup(spec, overrides)
+    return entry.batch(n_tracks, **params)
+
+
+def format_tracker_spec(spec: str) -> str:
+    """Bentuk kanonik spec: nama + hanya parameter yang beda dari default."""
+    entry, params = _lookup(spec, {})
+    changed = [f"{k}={v}" for k, v in params.items() if v != entry.params[k]]
+    return entry.name + (":" + ",".join(changed) if changed else "")
+
+
+register_tracker(
+    "raw", lambda: RawTracker(), lambda n: BatchRawTracker(n),
+    "tanpa filter",
+)
+register_tracker(
+    "smoothing",
+    lambda alpha: ExponentialSmoothing(alpha=alpha),
+    lambda n, alpha: BatchExponentialSmoothing(n, alpha=alpha),
+    "exponential smoothing, α tetap per frame",
+    alpha=0.7,
+)
+register_tracker(
+    "kalman",
+    lambda q, r: KalmanFilterTracker(fast=True, q=q, r=r),
+    lambda n, q, r: BatchKalmanTracker(n, q=q, r=r),
+    "Kalman constant-velocity",
+    q=0.03, r=0.1,
+)
+register_tracker(
+    "kalman-steady",
+    lambda q, r: KalmanFilterTracker(steady_state=True, q=q, r=r),
+    lambda n, q, r: BatchKalmanTracker(n, steady_state=True, q=q, r=r),
+    "Kalman constant-velocity dengan gain steady-state",
+    q=0.03, r=0.1,
+)
+register_tracker(
+    "alpha-beta",
+    lambda alpha, beta, alpha_max, jump: AlphaBetaTracker(alpha, beta, alpha_max, jump),
+    lambda n, alpha, beta, alpha_max, jump: BatchAlphaBetaTracker(n, alpha, beta, alpha_max, jump),
+    "alpha-beta, gain naik saat inovasi besar",
+    alpha=0.4, beta=None, alpha_max=0.8, jump=20.0,
+)
+register_tracker(
+    "one-euro",
+    lambda min_cutoff, beta, d_cutoff: OneEuroFilter(min_cutoff, beta, d_cutoff),
+    lambda n, min_cutoff, beta, d_cutoff: BatchOneEuroFilter(n, min_cutoff, beta, d_cutoff),
+    "One Euro, cutoff naik sebanding kecepatan",
+    min_cutoff=1.0, beta=0.05, d_cutoff=1.0,
+)
+register_tracker(
+    "ca-kalman",
+    lambda q, r: CAKalmanTracker(q=q, r=r),
+    lambda n, q, r: BatchCAKalmanTracker(n, q=q, r=r),
+    "Kalman constant-acceleration",
+    q=0.2, r=9.0,
+)
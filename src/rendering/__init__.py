@@ -1,7 +1,36 @@
-from .obj_loader import OBJLoader
-from .cube_renderer import CubeRenderer
+import importlib
 
-__all__ = [
-    'OBJLoader',
-    'CubeRenderer'
-]
\ No newline at end of file
+# nama → submodule. Diimport saat pertama kali dipakai, supaya
+# `import src.rendering.render_state` dll. tidak ikut memuat OpenGL.
+_EXPORTS = {
+    'MeshData': '.mesh_data',
+    'OBJLoader': '.obj_loader',
+    'MeshCache': '.mesh_cache',
+    'load_mesh': '.mesh_cache',
+    'RenderArrays': '.vertex_arrays',
+    'build_render_arrays': '.vertex_arrays',
+    'OptimizeStats': '.mesh_optimizer',
+    'optimize_render_arrays': '.mesh_optimizer',
+    'LODSelector': '.lod',
+    'build_lod_chain': '.lod',
+    'StateSlot': '.render_state',
+    'RenderScheduler': '.render_scheduler',
+    'CubeRenderer': '.cube_renderer',
+    'ViewportGrid': '.viewports',
+    'MeshRegistry': '.scene',
+    'Scene': '.scene',
+    'OffscreenRenderer': '.offscreen',
+    'TextureCache': '.textures',
+    'TextureManager': '.textures',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,40 +1,121 @@
+import math
+import threading
+import time
+
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
-from .obj_loader import OBJLoader
+from .gpu_mesh import GpuMesh
+from .lod import DEFAULT_LOD_RATIOS, LODSelector, bounding_radius, build_lod_chain
+from .mesh_cache import MeshCache, load_mesh
+from .mesh_data import MeshData
+from .mesh_optimizer import load_optimized_arrays, optimize_render_arrays
+from .textures import Texture, TextureCache, TextureManager
+from .vertex_arrays import RenderArrays, build_render_arrays
+
+
+# kamera (lihat draw / init_gl)
+CAMERA_DISTANCE = 7.0
+FOV_Y = 45.0
+Z_NEAR = 0.1
+Z_FAR = 100.0
+
+# lighting fixed-function (juga dipakai backend offscreen)
+CLEAR_COLOR = (0.1, 0.1, 0.1, 1.0)
+LIGHT_POSITION = (15.0, 15.0, 20.0, 0.3)
+LIGHT_DIFFUSE = (0.1, 0.1, 0.1, 0.1)
+LIGHT_AMBIENT = (0.2, 0.2, 0.2, 0.1)
+
+
+def init_gl_state():
+    """State GL global: depth test, lighting, culling (sama untuk semua objek)."""
+    glClearColor(*CLEAR_COLOR)
+    glEnable(GL_DEPTH_TEST)
+
+    # lighting dasar (posisi lampu ikut modelview saat ini → set di eye space)
+    glMatrixMode(GL_MODELVIEW)
+    glLoadIdentity()
+    glEnable(GL_LIGHTING)
+    glEnable(GL_LIGHT0)
+    glLightfv(GL_LIGHT0, GL_POSITION, LIGHT_POSITION)
+    glLightfv(GL_LIGHT0, GL_DIFFUSE, LIGHT_DIFFUSE)
+    glLightfv(GL_LIGHT0, GL_AMBIENT, LIGHT_AMBIENT)
+
+    glEnable(GL_COLOR_MATERIAL)
+    glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
+
+    glEnable(GL_CULL_FACE)
+    glCullFace(GL_BACK)
+    glFrontFace(GL_CCW)
 
 
 class CubeRenderer:
-    def __init__(self, obj_path: str | None = None):
+    def __init__(self, obj_path: str | None = None, cache: MeshCache | None = None,
+                 use_cache: bool = True, use_vbo: bool = True,
+                 optimize: bool = False, weld_tolerance: float = 1e-5,
+                 lod: bool = False, lod_ratios=DEFAULT_LOD_RATIOS,
+                 lod_background: bool = True, textures: bool = True,
+                 texture_cache: TextureCache | None = None):
         self.rot_x = 0.0
         self.rot_y = 0.0
         self.scale = 1.0
+        self.obj_path = obj_path
+
+        # True  → vertex/index buffer object (satu draw call per material)
+        # False → display list immediate mode (jalur lama)
+        self.use_vbo = use_vbo
+        self.optimize = optimize
+        self.weld_tolerance = weld_tolerance
 
         # display list id (dibuat di init_gl)
         self.gl_list: int | None = None
+        # buffer object (dibuat di init_gl kalau use_vbo)
+        self.gpu_mesh: GpuMesh | None = None
+        self.render_arrays: RenderArrays | None = None
 
-        if obj_path is not None:
-            loader = OBJLoader(obj_path)
+        # level of detail: level 0 = gpu_mesh, sisanya diisi setelah LOD selesai dibuat
+        self.lod_levels: list[GpuMesh] = []
+        self.lod_selector: LODSelector | None = None
+        self.lod_level = 0
+        # level tambahan yang lebih kasar dari pilihan LODSelector (QualityController)
+        self.lod_bias = 0
+        # (generasi mesh, array level 1..n) dari thread LOD
+        self._lod_arrays: tuple[int, list[RenderArrays]] | None = None
+        self.viewport_height = 600
+        self.lod = lod
+        self.lod_ratios = lod_ratios
 
-            # hitung centroid supaya pivot di tengah objek
-            cx, cy, cz = loader.compute_centroid()
-            print(f"[CubeRenderer] CENTROID: ({cx:.2f}, {cy:.2f}, {cz:.2f})")
+        if cache is None and use_cache:
+            cache = MeshCache()
+        self.cache = cache
 
-            # geser vertex sehingga pusat objek di (0,0,0)
-            self.vertices = [
-                (v[0] - cx, v[1] - cy, v[2] - cz)
-                for v in loader.vertices
-            ]
-            # faces = List[List[int]] (bisa 3,4,5,... vertex)
-            self.faces = loader.faces
-            self.face_colors = loader.face_colors
-            self.face_normals = loader.face_normals
+        # tekstur map_Kd (hanya jalur VBO; display list tetap warna Kd)
+        self.textures: TextureManager | None = None
+        if textures and use_vbo:
+            self.textures = TextureManager(texture_cache, use_cache=use_cache)
+
+        # load async (lihat load_async): hasil worker menunggu di _pending
+        # sampai di-upload dan ditukar di thread GL
+        self._load_generation = 0
+        # generasi mesh yang sedang tampil (LOD hanya berlaku untuk mesh ini)
+        self._shown_generation = 0
+        self._pending: tuple | None = None
+        # publish di _load_worker dan ambil+kosongkan di _poll_swap harus atomik
+        self._pending_lock = threading.Lock()
+        self.load_status: dict | None = None
 
+        if obj_path is not None:
+            # mesh sudah digeser ke centroid supaya pivot di tengah objek
+            # (dibaca dari cache biner kalau file OBJ/MTL tidak berubah)
+            self.mesh, (cx, cy, cz) = load_mesh(obj_path, cache)
+            print(f"[CubeRenderer] CENTROID: ({cx:.2f}, {cy:.2f}, {cz:.2f})")
             print("[CubeRenderer] vertices shifted by centroid")
+            # decode tekstur baru diminta di init_gl, setelah max_size dibatasi
+            # GL_MAX_TEXTURE_SIZE (batas driver hanya bisa dibaca di konteks GL)
 
         else:
             # fallback cube (face disimpan sebagai quad, akan di-fan-triangulate)
-            self.vertices = [
+            vertices = [
                 (-1, -1, -1),
                 (1, -1, -1),
                 (1, 1, -1),
@@ -44,7 +125,7 @@ class CubeRenderer:
                 (1, 1, 1),
                 (-1, 1, 1),
             ]
-            self.faces = [
+            faces = [
                 [0, 1, 2, 3],  # belakang
                 [4, 5, 6, 7],  # depan
                 [0, 1, 5, 4],  # bawah
@@ -52,14 +133,178 @@ class CubeRenderer:
                 [1, 2, 6, 5],  # kanan
                 [0, 3, 7, 4],  # kiri
             ]
-            self.face_colors = [(0.7, 0.7, 1.0)] * len(self.faces)
-            self.face_normals = [(0.0, 0.0, 1.0)] * len(self.faces)
+            face_colors = [(0.7, 0.7, 1.0)] * len(faces)
+            face_normals = [(0.0, 0.0, 1.0)] * len(faces)
+            self.mesh = MeshData.from_lists(vertices, faces, face_colors, face_normals)
 
         print(
-            f"[CubeRenderer] mesh loaded: {len(self.vertices)} vertices, "
-            f"{len(self.faces)} faces"
+            f"[CubeRenderer] mesh loaded: {len(self.mesh.vertices)} vertices, "
+            f"{self.mesh.face_count} faces"
         )
 
+        # optimasi (weld, urutan cache-friendly, index 16/32 bit) sebelum upload
+        if optimize and use_vbo:
+            self.render_arrays = load_optimized_arrays(
+                obj_path, self.mesh, cache, weld_tolerance
+            )
+
+        self.radius = bounding_radius(self.mesh)
+        if lod and use_vbo:
+            if lod_background:
+                threading.Thread(target=self._build_lods, args=(lod_ratios, 0), daemon=True).start()
+            else:
+                self._build_lods(lod_ratios, 0)
+
+    def _build_lods(self, ratios, generation: int = 0):
+        """Bangun level LOD (CPU saja); upload ke GPU dilakukan di thread GL."""
+        chain = build_lod_chain(self.mesh, ratios)
+        arrays = []
+        for level in chain[1:]:
+            a = build_render_arrays(level)
+            if self.optimize:
+                a, _ = optimize_render_arrays(a, self.weld_tolerance)
+            arrays.append(a)
+        if generation != self._shown_generation:
+            # mesh sudah ditukar selama LOD dibangun (load yang baru dimulai
+            # belum mengganti apa-apa, dan bisa saja gagal)
+            return
+        print(
+            "[CubeRenderer] LOD levels (triangles): "
+            + ", ".join(str(len(level.triangulate()[0])) for level in chain)
+        )
+        self._lod_arrays = (generation, arrays)
+
+    # ================= TEKSTUR ================= #
+    def _request_textures(self, mesh: MeshData) -> dict[int, Texture]:
+        """material id → Texture untuk mesh bertekstur (decode dimulai kalau belum)."""
+        if self.textures is None or not mesh.textured:
+            return {}
+        by_path = self.textures.request(mesh.material_textures)
+        return {i: by_path[p] for i, p in enumerate(mesh.material_textures) if p is not None}
+
+    @property
+    def uploading(self) -> bool:
+        """Ada tekstur yang sudah di-decode dan masih di-upload bertahap (perlu redraw)."""
+        return self.textures is not None and self.textures.uploading
+
+    def texture_status(self) -> list:
+        return self.textures.status() if self.textures is not None else []
+
+    # ================= LOAD ASYNC / HOT SWAP ================= #
+    def load_async(self, obj_path: str) -> int:
+        """
+        Parse + optimasi + bangun array OBJ baru di thread background; mesh
+        saat ini (atau kubus fallback) tetap digambar. Buffer di-upload dan
+        ditukar sekaligus di thread GL (lihat _poll_swap). Load yang lebih
+        baru membatalkan yang lama. Return nomor generasi load.
+        """
+        self._load_generation += 1
+        generation = self._load_generation
+        self.load_status = {"path": obj_path, "stage": "queued", "started": time.perf_counter()}
+        threading.Thread(
+            target=self._load_worker, args=(obj_path, generation),
+            name="mesh-loader", daemon=True,
+        ).start()
+        return generation
+
+    @property
+    def swap_ready(self) -> bool:
+        """Mesh hasil load_async sudah siap di-upload/ditukar di draw berikutnya."""
+        return self._pending is not None
+
+    @property
+    def loading(self) -> bool:
+        return self.load_status is not None and self.load_status["stage"] not in ("done", "failed")
+
+    def _set_stage(self, generation: int, stage: str) -> None:
+        if generation == self._load_generation and self.load_status is not None:
+            self.load_status = dict(self.load_status, stage=stage)
+            print(f"[CubeRenderer] loading {self.load_status['path']}: {stage}")
+
+    def _load_worker(self, obj_path: str, generation: int) -> None:
+        timings = {}
+        try:
+            t = time.perf_counter()
+            self._set_stage(generation, "parse")
+            mesh, _ = load_mesh(obj_path, self.cache)
+            timings["parse"] = time.perf_counter() - t
+            if generation == self._load_generation:
+                # decode tekstur paralel dengan optimasi; mesh ditukar tanpa menunggu tekstur
+                self._request_textures(mesh)
+
+            arrays = None
+            if self.use_vbo:
+                t = time.perf_counter()
+                self._set_stage(generation, "optimize" if self.optimize else "arrays")
+                if self.optimize:
+                    arrays = load_optimized_arrays(obj_path, mesh, self.cache, self.weld_tolerance)
+                else:
+                    arrays = build_render_arrays(mesh)
+                timings["arrays"] = time.perf_counter() - t
+        except Exception as e:
+            # mesh lama tetap dipakai
+            print(f"[CubeRenderer] cannot load {obj_path}: {e}")
+            if generation == self._load_generation:
+                self.load_status = dict(self.load_status, stage="failed", error=str(e))
+            return
+
+        if generation != self._load_generation:
+            return
+        self._set_stage(generation, "upload")
+        pending = (generation, obj_path, mesh, arrays, bounding_radius(mesh), timings)
+        with self._pending_lock:
+            # jangan timpa hasil load yang lebih baru yang belum ditukar
+            if self._pending is None or self._pending[0] < generation:
+                self._pending = pending
+
+    def _poll_swap(self):
+        """Upload + tukar mesh hasil load_async (dipanggil dari thread GL)."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        generation, obj_path, mesh, arrays, radius, timings = pending
+        if generation != self._load_generation:
+            return
+
+        t = time.perf_counter()
+        old_gpu = [self.gpu_mesh] + self.lod_levels[1:] if self.gpu_mesh is not None else []
+        old_list = self.gl_list
+        if self.use_vbo:
+            gpu_mesh = GpuMesh(arrays)
+            gpu_mesh.upload()
+            gpu_mesh.textures = self._request_textures(mesh)
+            self.gpu_mesh, self.render_arrays = gpu_mesh, arrays
+        self.mesh = mesh
+        if not self.use_vbo:
+            self._build_display_list()
+        self.radius = radius
+        self.obj_path = obj_path
+        self._shown_generation = generation
+        self.lod_levels = []
+        self.lod_selector = None
+        self.lod_level = 0
+        self._lod_arrays = None
+
+        for m in old_gpu:
+            m.release()
+        if old_list is not None and old_list != self.gl_list:
+            glDeleteLists(old_list, 1)
+        if self.textures is not None:
+            self.textures.retain(mesh.material_textures or ())
+        timings["upload"] = time.perf_counter() - t
+
+        total = time.perf_counter() - self.load_status["started"]
+        self.load_status = dict(self.load_status, stage="done", timings=timings, total=total)
+        print(
+            f"[CubeRenderer] swapped to {obj_path} ({mesh.face_count} faces): "
+            + ", ".join(f"{k} {1e3 * v:.1f} ms" for k, v in timings.items())
+            + f", total {1e3 * total:.1f} ms"
+        )
+
+        if self.lod and self.use_vbo:
+            threading.Thread(target=self._build_lods, args=(self.lod_ratios, generation), daemon=True).start()
+
     def update_state(self, rot_x: float, rot_y: float, scale: float):
         self.rot_x = rot_x
         self.rot_y = rot_y
@@ -69,37 +314,52 @@ class CubeRenderer:
     def init_gl(self, width: int = 800, height: int = 600):
         print("[CubeRenderer] init_gl")
 
-        glClearColor(0.1, 0.1, 0.1, 1.0)
-        glEnable(GL_DEPTH_TEST)
+        init_gl_state()
+        self.set_viewport(0, 0, width, height)
 
-        # lighting dasar
-        glEnable(GL_LIGHTING)
-        glEnable(GL_LIGHT0)
-        glLightfv(GL_LIGHT0, GL_POSITION, (15.0, 15.0, 20.0, 0.3))
-        glLightfv(GL_LIGHT0, GL_DIFFUSE, (0.1, 0.1, 0.1, 0.1))
-        glLightfv(GL_LIGHT0, GL_AMBIENT, (0.2, 0.2, 0.2, 0.1))
+        if self.textures is not None:
+            # level 0 tidak boleh melebihi batas driver; harus sebelum
+            # _build_buffers karena di sana decode tekstur dimulai
+            max_size = int(glGetIntegerv(GL_MAX_TEXTURE_SIZE))
+            self.textures.max_size = min(self.textures.max_size, max_size)
 
-        glEnable(GL_COLOR_MATERIAL)
-        glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
+        if self.use_vbo:
+            try:
+                self._build_buffers()
+            except Exception as e:
+                # mis. driver tanpa dukungan buffer object
+                print(f"[CubeRenderer] VBO unavailable ({e}), fallback to display list")
+                self.use_vbo = False
+                self.gpu_mesh = None
+                self.textures = None
 
-        glEnable(GL_CULL_FACE)
-        glCullFace(GL_BACK)
-        glFrontFace(GL_CCW)
+        if not self.use_vbo:
+            self._build_display_list()
 
-        glViewport(0, 0, width, height)
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluPerspective(45.0, width / float(height), 0.1, 100.0)
+    def _build_buffers(self):
+        """Upload array interleaved + index ke VBO/IBO (sekali saja)."""
+        if self.render_arrays is None:
+            self.render_arrays = build_render_arrays(self.mesh)
+        arrays = self.render_arrays
 
-        glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
+        self.gpu_mesh = GpuMesh(arrays)
+        self.gpu_mesh.upload()
+        self.gpu_mesh.textures = self._request_textures(self.mesh)
+
+        print(
+            f"[CubeRenderer] VBO uploaded: {len(arrays.vertices)} vertices, "
+            f"{arrays.triangle_count} triangles, {len(arrays.ranges)} draw calls"
+        )
+
+    def _build_display_list(self):
+        vertices, faces, face_colors, face_normals = self.mesh.to_lists()
 
         # ====== BANGUN DISPLAY LIST SEKALI SAJA ======
         self.gl_list = glGenLists(1)
         glNewList(self.gl_list, GL_COMPILE)
 
         glBegin(GL_TRIANGLES)
-        for verts, color, normal in zip(self.faces, self.face_colors, self.face_normals):
+        for verts, color, normal in zip(faces, face_colors, face_normals):
             if len(verts) < 3:
                 continue
 
@@ -108,14 +368,14 @@ class CubeRenderer:
 
             # fan triangulation: (v0,v1,v2), (v0,v2,v3), ...
             v0 = verts[0]
-            x0, y0, z0 = self.vertices[v0]
+            x0, y0, z0 = vertices[v0]
 
             for i in range(1, len(verts) - 1):
                 i1 = verts[i]
                 i2 = verts[i + 1]
 
-                x1, y1, z1 = self.vertices[i1]
-                x2, y2, z2 = self.vertices[i2]
+                x1, y1, z1 = vertices[i1]
+                x2, y2, z2 = vertices[i2]
 
                 glVertex3f(x0, y0, z0)
                 glVertex3f(x1, y1, z1)
@@ -125,12 +385,75 @@ class CubeRenderer:
         glEndList()
         # ====== END DISPLAY LIST ======
 
+    def _poll_lods(self):
+        """Upload level LOD yang sudah jadi (dipanggil dari thread GL)."""
+        if self._lod_arrays is None or self.gpu_mesh is None:
+            return
+        (generation, arrays), self._lod_arrays = self._lod_arrays, None
+        if generation != self._shown_generation:
+            # mesh ditukar setelah LOD selesai dibangun
+            return
+        levels = [self.gpu_mesh]
+        for a in arrays:
+            mesh = GpuMesh(a)
+            mesh.upload()
+            # level LOD membawa UV segitiga aslinya, tekstur dipakai bersama
+            mesh.textures = self.gpu_mesh.textures
+            levels.append(mesh)
+        self.lod_levels = levels
+        self.lod_selector = LODSelector([m.arrays.triangle_count for m in levels])
+
+    def projected_radius(self) -> float:
+        """Radius objek di layar (pixel) untuk skala saat ini."""
+        half_fov = math.radians(FOV_Y) / 2.0
+        return (self.radius * abs(self.scale) / CAMERA_DISTANCE) / math.tan(half_fov) \
+            * (self.viewport_height / 2.0)
+
+    def _current_mesh(self) -> GpuMesh | None:
+        self._poll_lods()
+        if self.lod_selector is None:
+            return self.gpu_mesh
+        level = self.lod_selector.select(self.projected_radius())
+        level = min(level + self.lod_bias, len(self.lod_levels) - 1)
+        if level != self.lod_level:
+            print(f"[CubeRenderer] LOD {self.lod_level} -> {level}")
+            self.lod_level = level
+        return self.lod_levels[level]
+
+    def set_viewport(self, x: int, y: int, width: int, height: int):
+        """Viewport + proyeksi (aspect ikut ukuran viewport)."""
+        glViewport(x, y, width, height)
+        glMatrixMode(GL_PROJECTION)
+        glLoadIdentity()
+        gluPerspective(FOV_Y, width / float(max(height, 1)), Z_NEAR, Z_FAR)
+        self.viewport_height = height
+
+        glMatrixMode(GL_MODELVIEW)
+        glLoadIdentity()
+
     def draw(self):
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        self.begin_frame()
+        self.draw_object()
+        glutSwapBuffers()
+
+    def begin_frame(self):
+        """Pekerjaan sekali per frame (bukan per viewport): swap mesh + upload tekstur."""
+        # mesh baru dari load_async (kalau sudah siap) ditukar sebelum digambar
+        self._poll_swap()
+        if self.textures is not None:
+            # potongan tekstur berikutnya, dibatasi budget per frame
+            self.textures.upload()
+
+    def draw_object(self):
+        """Gambar objek dengan state saat ini di viewport aktif (tanpa clear/swap).
+
+        Panggil begin_frame() sekali per frame sebelumnya.
+        """
         glLoadIdentity()
 
         gluLookAt(
-            0.0, 0.0, 7.0,   # posisi kamera
+            0.0, 0.0, CAMERA_DISTANCE,   # posisi kamera
             0.0, 0.0, 0.0,   # titik yang dilihat
             0.0, 1.0, 0.0,   # up vector
         )
@@ -139,8 +462,9 @@ class CubeRenderer:
         glRotatef(self.rot_x, 1, 0, 0)
         glRotatef(self.rot_y, 0, 1, 0)
 
-        # panggil display list (sangat ringan per-frame)
-        if self.gl_list is not None:
+        mesh = self._current_mesh()
+        if mesh is not None:
+            mesh.draw()
+        elif self.gl_list is not None:
+            # panggil display list (sangat ringan per-frame)
             glCallList(self.gl_list)
-
-        glutSwapBuffers()
@@ -0,0 +1,90 @@
+import ctypes
+
+from OpenGL.GL import *
+from .vertex_arrays import RenderArrays, NORMAL_OFFSET, COLOR_OFFSET, UV_OFFSET
+
+
+class GpuMesh:
+    """RenderArrays yang sudah di-upload ke VBO/IBO (harus dipakai di thread GL)."""
+
+    def __init__(self, arrays: RenderArrays):
+        self.arrays = arrays
+        self.vbo: int | None = None
+        self.ibo: int | None = None
+        self.index_type = GL_UNSIGNED_SHORT if arrays.indices.dtype.itemsize == 2 else GL_UNSIGNED_INT
+        self.index_size = arrays.indices.dtype.itemsize
+        # material id → Texture (textures.py); diisi renderer kalau mesh bertekstur
+        self.textures: dict = {}
+
+    @property
+    def uploaded(self) -> bool:
+        return self.vbo is not None
+
+    def upload(self):
+        arrays = self.arrays
+        vbo, ibo = glGenBuffers(2)
+
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, arrays.vertices.nbytes, arrays.vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, arrays.indices.nbytes, arrays.indices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+        self.vbo, self.ibo = int(vbo), int(ibo)
+
+    def bind(self):
+        stride = self.arrays.stride
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, stride, ctypes.c_void_p(0))
+        glNormalPointer(GL_FLOAT, stride, ctypes.c_void_p(NORMAL_OFFSET))
+        glColorPointer(3, GL_FLOAT, stride, ctypes.c_void_p(COLOR_OFFSET))
+        if self.arrays.textured:
+            glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+            glTexCoordPointer(2, GL_FLOAT, stride, ctypes.c_void_p(UV_OFFSET))
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+
+    def draw_range(self, start: int, count: int):
+        glDrawElements(GL_TRIANGLES, count, self.index_type,
+                       ctypes.c_void_p(start * self.index_size))
+
+    @staticmethod
+    def unbind():
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def draw(self):
+        """
+        Satu draw call per material. Material bertekstur memakai teksturnya
+        (dikali warna Kd + lighting, GL_MODULATE) begitu level pertama sudah
+        di GPU; sebelum itu digambar dengan warna Kd saja.
+        """
+        self.bind()
+        textured = False
+        for material, start, count in self.arrays.ranges:
+            texture = self.textures.get(material)
+            use = texture is not None and texture.bind()
+            if use != textured:
+                if use:
+                    glEnable(GL_TEXTURE_2D)
+                else:
+                    glDisable(GL_TEXTURE_2D)
+                textured = use
+            self.draw_range(start, count)
+        if textured:
+            glDisable(GL_TEXTURE_2D)
+            glBindTexture(GL_TEXTURE_2D, 0)
+        self.unbind()
+
+    def release(self):
+        if self.vbo is not None:
+            glDeleteBuffers(2, [self.vbo, self.ibo])
+        self.vbo = self.ibo = None
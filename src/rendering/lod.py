@@ -0,0 +1,207 @@
+import math
+from typing import List, Sequence
+
+import numpy as np
+
+from .mesh_data import MeshData
+from .obj_loader import OBJLoader
+
+
+# rasio jumlah segitiga tiap level terhadap mesh asli (level 0 = full)
+DEFAULT_LOD_RATIOS = (1.0, 0.4, 0.15, 0.05)
+# level di bawah ini tidak dibuat (tidak ada gunanya untuk mesh kecil)
+MIN_LOD_TRIANGLES = 500
+
+
+def _plane_quadrics(vertices: np.ndarray, tris: np.ndarray) -> np.ndarray:
+    """
+    Quadric bidang tiap segitiga (dibobot luas), 10 koefisien unik:
+    a², ab, ac, ad, b², bc, bd, c², cd, d²  untuk bidang ax + by + cz + d = 0.
+    """
+    p0 = vertices[tris[:, 0]].astype(np.float64)
+    p1 = vertices[tris[:, 1]].astype(np.float64)
+    p2 = vertices[tris[:, 2]].astype(np.float64)
+    n = np.cross(p1 - p0, p2 - p0)
+    length = np.sqrt(np.einsum("ij,ij->i", n, n))
+    area = 0.5 * length
+    length[length == 0.0] = 1.0
+    n /= length[:, None]
+    a, b, c = n[:, 0], n[:, 1], n[:, 2]
+    d = -np.einsum("ij,ij->i", n, p0)
+    q = np.stack([a * a, a * b, a * c, a * d, b * b, b * c, b * d, c * c, c * d, d * d], axis=1)
+    return q * area[:, None]
+
+
+def simplify_mesh(mesh: MeshData, resolution: int,
+                  tri_quadrics: np.ndarray | None = None) -> MeshData:
+    """
+    Simplifikasi vertex clustering dengan quadric error (Lindstrom 2000):
+    vertex dikelompokkan ke grid resolution³, posisi wakil tiap sel adalah
+    titik yang meminimalkan jumlah quadric bidang di sel itu.
+    Semua langkah vektor NumPy, jadi tetap cepat untuk jutaan segitiga.
+    """
+    tris, tri_face = mesh.triangulate()
+    vertices = np.asarray(mesh.vertices, dtype=np.float64)
+    if len(tris) == 0:
+        return mesh
+
+    # 1) sel grid untuk tiap vertex
+    lo = vertices.min(axis=0)
+    extent = np.maximum(vertices.max(axis=0) - lo, 1e-9)
+    cell_size = extent.max() / resolution
+    cell = np.floor((vertices - lo) / cell_size).astype(np.int64)
+    cell = np.minimum(cell, resolution)
+    cell_key = (cell[:, 0] * (resolution + 1) + cell[:, 1]) * (resolution + 1) + cell[:, 2]
+    _, cluster = np.unique(cell_key, return_inverse=True)
+    cluster = cluster.reshape(-1)
+    n_clusters = int(cluster.max()) + 1
+
+    # 2) quadric per cluster = jumlah quadric segitiga yang menyentuh vertex di cluster
+    tri_q = _plane_quadrics(vertices, tris) if tri_quadrics is None else tri_quadrics
+    corner_cluster = cluster[tris].reshape(-1)
+    corner_q = np.repeat(tri_q, 3, axis=0)
+    q = np.stack(
+        [np.bincount(corner_cluster, weights=corner_q[:, k], minlength=n_clusters) for k in range(10)],
+        axis=1,
+    )
+
+    # 3) posisi optimal: A x = -b, fallback ke rata-rata vertex kalau A singular
+    counts = np.bincount(cluster, minlength=n_clusters).astype(np.float64)
+    mean = np.stack(
+        [np.bincount(cluster, weights=vertices[:, k], minlength=n_clusters) for k in range(3)],
+        axis=1,
+    ) / counts[:, None]
+
+    A = np.empty((n_clusters, 3, 3))
+    A[:, 0, 0], A[:, 0, 1], A[:, 0, 2] = q[:, 0], q[:, 1], q[:, 2]
+    A[:, 1, 0], A[:, 1, 1], A[:, 1, 2] = q[:, 1], q[:, 4], q[:, 5]
+    A[:, 2, 0], A[:, 2, 1], A[:, 2, 2] = q[:, 2], q[:, 5], q[:, 7]
+    b = -q[:, [3, 6, 8]]
+
+    positions = mean.copy()
+    scale = np.abs(A).reshape(n_clusters, -1).max(axis=1)
+    det = np.abs(np.linalg.det(A))
+    ok = det > 1e-6 * np.maximum(scale, 1e-30) ** 3
+    if np.any(ok):
+        solved = np.linalg.solve(A[ok], b[ok][:, :, None])[:, :, 0]
+        # titik optimal harus tetap di sekitar selnya, kalau tidak pakai rata-rata
+        near = np.all(np.abs(solved - mean[ok]) <= cell_size, axis=1)
+        idx = np.flatnonzero(ok)[near]
+        positions[idx] = solved[near]
+
+    # 4) segitiga baru: buang yang kolaps dan duplikat
+    new_tris = cluster[tris]
+    valid = (
+        (new_tris[:, 0] != new_tris[:, 1])
+        & (new_tris[:, 1] != new_tris[:, 2])
+        & (new_tris[:, 0] != new_tris[:, 2])
+    )
+    new_tris = new_tris[valid]
+    new_face = tri_face[valid]
+    _, first = np.unique(np.sort(new_tris, axis=1), axis=0, return_index=True)
+    first.sort()
+    new_tris = new_tris[first]
+    new_face = new_face[first]
+    # segitiga yang tersisa adalah segitiga asli, jadi UV corner-nya tetap berlaku
+    face_uvs = None
+    if mesh.textured:
+        corners, _ = mesh.corner_triangles()
+        face_uvs = np.ascontiguousarray(mesh.face_uvs[corners][valid][first].reshape(-1))
+
+    # 5) buang cluster yang tidak dipakai lagi
+    used, remap = np.unique(new_tris, return_inverse=True)
+    new_vertices = positions[used].astype(np.float32)
+    face_indices = remap.reshape(-1).astype(np.int32)
+
+    face_offsets = np.arange(0, len(face_indices) + 1, 3, dtype=np.int32)
+    face_normals = OBJLoader._compute_normals(new_vertices, face_indices, face_offsets)
+    return MeshData(
+        new_vertices,
+        face_indices,
+        face_offsets,
+        np.ascontiguousarray(mesh.face_colors[new_face]),
+        face_normals,
+        np.ascontiguousarray(mesh.face_materials[new_face]),
+        list(mesh.material_names),
+        uvs=mesh.uvs if face_uvs is not None else None,
+        face_uvs=face_uvs,
+        material_textures=mesh.material_textures if face_uvs is not None else None,
+    )
+
+
+def decimate(mesh: MeshData, target_triangles: int, max_iterations: int = 6) -> MeshData:
+    """Cari resolusi grid yang menghasilkan kira-kira target_triangles segitiga."""
+    tris, _ = mesh.triangulate()
+    if target_triangles >= len(tris):
+        return mesh
+    # quadric bidang tidak tergantung resolusi, cukup dihitung sekali
+    tri_q = _plane_quadrics(np.asarray(mesh.vertices, dtype=np.float64), tris)
+
+    # jumlah segitiga hasil clustering ~ 2 * sel permukaan ~ k * resolution²
+    resolution = max(2, int(math.sqrt(target_triangles / 2.0)))
+    best = None
+    for _ in range(max_iterations):
+        result = simplify_mesh(mesh, resolution, tri_q)
+        got = len(result.face_offsets) - 1
+        if best is None or abs(got - target_triangles) < abs(best[1] - target_triangles):
+            best = (result, got)
+        if abs(got - target_triangles) <= 0.1 * target_triangles or got == 0:
+            break
+        new_resolution = max(2, int(round(resolution * math.sqrt(target_triangles / max(got, 1)))))
+        if new_resolution == resolution:
+            break
+        resolution = new_resolution
+    return best[0]
+
+
+def build_lod_chain(mesh: MeshData, ratios: Sequence[float] = DEFAULT_LOD_RATIOS) -> List[MeshData]:
+    """Level 0 = mesh asli, level berikutnya makin kasar."""
+    tris, _ = mesh.triangulate()
+    chain = [mesh]
+    for ratio in ratios[1:]:
+        target = int(len(tris) * ratio)
+        if target < MIN_LOD_TRIANGLES:
+            break
+        level = decimate(mesh, target)
+        if level.face_count >= chain[-1].face_count:
+            continue
+        chain.append(level)
+    return chain
+
+
+def bounding_radius(mesh: MeshData) -> float:
+    """Radius bola pembatas di sekitar origin (mesh sudah digeser ke centroid)."""
+    if len(mesh.vertices) == 0:
+        return 0.0
+    v = np.asarray(mesh.vertices, dtype=np.float64)
+    return float(np.sqrt(np.einsum("ij,ij->i", v, v).max()))
+
+
+class LODSelector:
+    """
+    Pilih level dari ukuran objek di layar (radius dalam pixel).
+    Level i dipakai kalau radius >= min_radius[i]; hysteresis mencegah
+    level bolak-balik di sekitar batas.
+    """
+
+    def __init__(self, triangle_counts: Sequence[int], pixels_per_triangle: float = 2.0,
+                 hysteresis: float = 0.15):
+        self.hysteresis = hysteresis
+        # radius minimum supaya tiap segitiga level i rata-rata >= pixels_per_triangle px²
+        self.min_radius = [
+            math.sqrt(n * pixels_per_triangle / math.pi) for n in triangle_counts
+        ]
+        # level terkasar selalu boleh dipakai
+        self.min_radius[-1] = 0.0
+        self.level = 0
+
+    def select(self, radius_px: float) -> int:
+        level = self.level
+        # naik ke level lebih halus hanya kalau jelas di atas batas
+        while level > 0 and radius_px >= self.min_radius[level - 1] * (1.0 + self.hysteresis):
+            level -= 1
+        # turun ke level lebih kasar hanya kalau jelas di bawah batas
+        while level < len(self.min_radius) - 1 and radius_px < self.min_radius[level] * (1.0 - self.hysteresis):
+            level += 1
+        self.level = level
+        return level
@@ -0,0 +1,382 @@
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .mesh_data import MeshData
+from .obj_loader import OBJLoader, find_mtllib
+
+
+# format file cache:
+#   MAGIC (8 byte) | panjang header (uint32 LE) | header JSON | padding | array...
+# setiap array di-align ke 64 byte supaya bisa langsung di-memmap.
+MAGIC = b"ORMESH01"
+ALIGN = 64
+SUFFIX = ".mesh"
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "OBJECT_ROTATOR_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "object-rotator", "meshes"),
+)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def _align(n: int) -> int:
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+def _file_digest(path: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _find_mtl(obj_path: str, digest=None) -> Optional[str]:
+    """
+    Cari path .mtl dari baris mtllib pertama (tanpa parse OBJ penuh), dibaca
+    per chunk. Kalau digest (objek hashlib) diberikan, semua chunk ikut di-hash
+    sehingga key cukup satu kali baca file; tanpa digest pembacaan berhenti di
+    mtllib pertama. mtllib tidak selalu di header (mis. export 3ds Max menulisnya
+    setelah blok vertex), jadi tidak cukup membaca awal file saja.
+    """
+    name = None
+    tail = b""
+    with open(obj_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            if digest is not None:
+                digest.update(chunk)
+            if name is not None:
+                continue
+            # hanya baris lengkap yang dicari; sisa baris disambung ke chunk berikutnya
+            buf = tail + chunk
+            cut = buf.rfind(b"\n") + 1
+            name = find_mtllib(buf, cut)
+            tail = buf[cut:]
+            if name is not None and digest is None:
+                break
+    if name is None:
+        name = find_mtllib(tail)
+    if name is None:
+        return None
+    return os.path.join(os.path.dirname(obj_path), name)
+
+
+def write_arrays(path: str, arrays: Dict[str, np.ndarray], meta: dict) -> None:
+    """Tulis array ke format cache biner (atomic lewat file .tmp)."""
+    layout = {}
+    offset = 0
+    for name, arr in arrays.items():
+        arr = np.asarray(arr)
+        layout[name] = {
+            "dtype": arr.dtype.str,
+            "shape": list(arr.shape),
+            "offset": offset,
+        }
+        offset = _align(offset + arr.nbytes)
+
+    header = json.dumps({"meta": meta, "arrays": layout}).encode("utf-8")
+    data_start = _align(len(MAGIC) + 4 + len(header))
+
+    # nama tmp unik: beberapa thread (loader mesh, decode tekstur) bisa menulis bersamaan
+    fd, tmp = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=os.path.basename(path) + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            for name, arr in arrays.items():
+                f.seek(data_start + layout[name]["offset"])
+                f.write(np.ascontiguousarray(arr).tobytes())
+            f.truncate(data_start + offset)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _read_header(f, path: str) -> Tuple[dict, int]:
+    """Header JSON file cache + offset awal data array."""
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"not a mesh cache file: {path}")
+    (header_len,) = struct.unpack("<I", f.read(4))
+    header = json.loads(f.read(header_len).decode("utf-8"))
+    return header, _align(len(MAGIC) + 4 + header_len)
+
+
+def read_meta(path: str) -> dict:
+    """Meta file cache saja (header JSON), tanpa membaca data array."""
+    with open(path, "rb") as f:
+        header, _ = _read_header(f, path)
+    return header["meta"]
+
+
+def read_arrays(path: str, mmap: bool = True) -> Tuple[Dict[str, np.ndarray], dict]:
+    """Baca file cache; array di-memmap read-only kalau mmap=True."""
+    with open(path, "rb") as f:
+        header, data_start = _read_header(f, path)
+
+        arrays: Dict[str, np.ndarray] = {}
+        for name, info in header["arrays"].items():
+            dtype = np.dtype(info["dtype"])
+            shape = tuple(info["shape"])
+            count = int(np.prod(shape))
+            if count == 0:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            elif mmap:
+                arrays[name] = np.memmap(
+                    path, dtype=dtype, mode="r",
+                    offset=data_start + info["offset"], shape=shape,
+                )
+            else:
+                f.seek(data_start + info["offset"])
+                arrays[name] = np.fromfile(f, dtype=dtype, count=count).reshape(shape)
+    return arrays, header["meta"]
+
+
+class MeshCache:
+    """
+    Cache disk untuk mesh hasil parse (sudah digeser ke centroid).
+    Key = path, ukuran dan mtime file OBJ, jadi hit tidak membaca isi file.
+    Entry menyimpan ukuran, mtime dan hash isi semua file sumber (OBJ + MTL):
+    MTL dicek lewat stat, dan hash isi baru dihitung ulang kalau stat tidak
+    cocok (mis. file di-touch / di-copy dengan isi yang sama).
+    """
+
+    # naik kalau isi entry berubah (2: UV + tekstur material, 3: key dari stat +
+    # sumber di meta), entry lama jadi miss
+    version = 3
+    suffix = SUFFIX
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        verify_content: bool = True,
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        # False → hanya path/ukuran/mtime, isi file tidak pernah di-hash
+        self.verify_content = verify_content
+
+    def source_files(self, obj_path: str, digests: Optional[Dict[str, str]] = None) -> List[str]:
+        """
+        File sumber entry. Kalau digests diberikan, hash isi OBJ diisi dari
+        pembacaan yang sama dengan pencarian mtllib.
+        """
+        files = [obj_path]
+        h = hashlib.blake2b(digest_size=16) if digests is not None else None
+        mtl_path = _find_mtl(obj_path, h)
+        if h is not None:
+            digests[obj_path] = h.hexdigest()
+        if mtl_path is not None and os.path.exists(mtl_path):
+            files.append(mtl_path)
+        return files
+
+    def key_for(self, obj_path: str, variant: str = "") -> str:
+        """Key entry dari path, ukuran dan mtime file utama (tanpa membaca isi)."""
+        st = os.stat(obj_path)
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{self.version}:{variant}".encode("utf-8"))
+        h.update(os.path.abspath(obj_path).encode("utf-8"))
+        h.update(struct.pack("<qq", st.st_size, st.st_mtime_ns))
+        return h.hexdigest()
+
+    def _sources(self, obj_path: str) -> List[list]:
+        """[path, ukuran, mtime_ns, hash isi] tiap file sumber (file utama pertama)."""
+        digests: Optional[Dict[str, str]] = {} if self.verify_content else None
+        sources = []
+        for path in self.source_files(obj_path, digests):
+            st = os.stat(path)
+            digest = None
+            if digests is not None:
+                digest = digests.get(path) or _file_digest(path)
+            sources.append([os.path.abspath(path), st.st_size, st.st_mtime_ns, digest])
+        return sources
+
+    def _source_valid(self, source: list) -> bool:
+        path, size, mtime_ns, digest = source
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        if (st.st_size, st.st_mtime_ns) == (size, mtime_ns):
+            return True
+        # mtime berubah tapi isi bisa saja sama
+        return (
+            self.verify_content and digest is not None
+            and st.st_size == size and _file_digest(path) == digest
+        )
+
+    def _revalidate(self, obj_path: str, variant: str, entry: str) -> Optional[str]:
+        """
+        Tidak ada entry untuk stat file utama saat ini: cari entry lama dengan
+        variant dan isi file yang sama, lalu pindahkan ke nama entry baru.
+        """
+        if not self.verify_content or not os.path.isdir(self.cache_dir):
+            return None
+        size = os.stat(obj_path).st_size
+        digest = None
+        prefix = self._prefix(obj_path) + "-"
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if not (name.startswith(prefix) and name.endswith(self.suffix)):
+                continue
+            try:
+                meta = read_meta(path)
+            except (OSError, ValueError, KeyError):
+                continue
+            sources = meta.get("sources") or [[None, None, None, None]]
+            if meta.get("variant", "") != variant or sources[0][1] != size or sources[0][3] is None:
+                continue
+            if digest is None:
+                # hash isi hanya dihitung kalau ada kandidat
+                digest = _file_digest(obj_path)
+            if sources[0][3] == digest:
+                try:
+                    os.replace(path, entry)
+                except OSError:
+                    return None
+                return entry
+        return None
+
+    def _prefix(self, obj_path: str) -> str:
+        # prefix per file OBJ, dipakai untuk membuang entry lama dari file yang sama
+        return hashlib.blake2b(
+            os.path.abspath(obj_path).encode("utf-8"), digest_size=8
+        ).hexdigest()
+
+    def _entry_path(self, obj_path: str, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{self._prefix(obj_path)}-{key}{self.suffix}")
+
+    def load(
+        self, obj_path: str, variant: str = "", key: Optional[str] = None
+    ) -> Optional[Tuple[Dict[str, np.ndarray], dict]]:
+        """key = hasil key_for yang sudah dihitung (dipakai ulang oleh store saat miss)."""
+        if key is None:
+            key = self.key_for(obj_path, variant)
+        entry = self._entry_path(obj_path, key)
+        if not os.path.exists(entry) and self._revalidate(obj_path, variant, entry) is None:
+            return None
+        try:
+            arrays, meta = read_arrays(entry)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[MeshCache] corrupt entry {entry}: {e}")
+            self._remove(entry)
+            return None
+        # file utama cocok lewat key; file lain (MTL) dicek di sini
+        if not all(self._source_valid(source) for source in meta.get("sources", [])[1:]):
+            return None
+        # tandai baru dipakai (untuk eviction LRU)
+        os.utime(entry)
+        return arrays, meta
+
+    def store(
+        self,
+        obj_path: str,
+        arrays: Dict[str, np.ndarray],
+        meta: dict,
+        variant: str = "",
+        key: Optional[str] = None,
+    ) -> str:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        if key is None:
+            key = self.key_for(obj_path, variant)
+        entry = self._entry_path(obj_path, key)
+        # hash isi dihitung di sini (sekali per store), bukan saat lookup
+        write_arrays(entry, arrays, dict(meta, variant=variant, sources=self._sources(obj_path)))
+
+        # entry lain dari file OBJ yang sama (dengan variant sama) sudah basi
+        prefix = self._prefix(obj_path) + "-"
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.startswith(prefix) and name.endswith(self.suffix) and path != entry:
+                try:
+                    other_meta = read_meta(path)
+                except (OSError, ValueError, KeyError):
+                    other_meta = {}
+                if other_meta.get("variant", "") == variant:
+                    self._remove(path)
+
+        self.evict(keep=entry)
+        return entry
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """Hapus entry paling lama dipakai sampai total ukuran <= max_bytes."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(self.suffix):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            self._remove(path)
+            total -= size
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def load_mesh(obj_path: str, cache: Optional[MeshCache] = None) -> Tuple[MeshData, Tuple[float, float, float]]:
+    """
+    Load OBJ sebagai MeshData yang sudah digeser ke centroid.
+    Kalau cache diberikan, hasil parse dibaca/ditulis lewat MeshCache.
+    Return (mesh, centroid asli).
+    """
+    t0 = time.perf_counter()
+    if cache is not None:
+        # key dihitung sekali (hash isi file) untuk load dan store
+        key = cache.key_for(obj_path)
+        hit = cache.load(obj_path, key=key)
+        if hit is not None:
+            arrays, meta = hit
+            mesh = MeshData.from_arrays(arrays, meta)
+            centroid = tuple(meta["centroid"])
+            print(
+                f"[MeshCache] hit {obj_path} "
+                f"({(time.perf_counter() - t0) * 1000:.1f} ms)"
+            )
+            return mesh, centroid
+
+    loader = OBJLoader(obj_path, fast=True)
+    centroid = loader.compute_centroid()
+    mesh = loader.mesh.shifted(centroid)
+
+    if cache is not None:
+        arrays, meta = mesh.to_arrays()
+        meta["centroid"] = list(centroid)
+        try:
+            cache.store(obj_path, arrays, meta, key=key)
+        except OSError as e:
+            print(f"[MeshCache] cannot write cache: {e}")
+    print(
+        f"[MeshCache] parsed {obj_path} "
+        f"({(time.perf_counter() - t0) * 1000:.1f} ms)"
+    )
+    return mesh, centroid
@@ -0,0 +1,178 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class MeshData:
+    """Mesh dalam bentuk array NumPy kontigu (hasil parser cepat OBJLoader)."""
+
+    def __init__(
+        self,
+        vertices: np.ndarray,
+        face_indices: np.ndarray,
+        face_offsets: np.ndarray,
+        face_colors: np.ndarray,
+        face_normals: np.ndarray,
+        face_materials: np.ndarray,
+        material_names: List[str],
+        uvs: Optional[np.ndarray] = None,
+        face_uvs: Optional[np.ndarray] = None,
+        material_textures: Optional[List[Optional[str]]] = None,
+    ):
+        # posisi vertex (N, 3) float32
+        self.vertices = vertices
+        # indeks semua face disambung jadi satu (CSR), int32
+        self.face_indices = face_indices
+        # face ke-i = face_indices[face_offsets[i]:face_offsets[i + 1]]
+        self.face_offsets = face_offsets
+        # warna & normal per-face (F, 3) float32
+        self.face_colors = face_colors
+        self.face_normals = face_normals
+        # id material per-face (F,) int32, -1 = tanpa material
+        self.face_materials = face_materials
+        self.material_names = material_names
+        # koordinat tekstur (M, 2) float32 dan indeks UV tiap corner (sejajar
+        # face_indices, -1 = tanpa UV); None kalau tidak ada material bertekstur
+        self.uvs = uvs
+        self.face_uvs = face_uvs
+        # path tekstur map_Kd per material (sejajar material_names), None = warna Kd saja
+        self.material_textures = material_textures
+        # cache hasil triangulate() (bisa juga diisi dari MeshCache)
+        self._triangulation: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    @property
+    def face_count(self) -> int:
+        return len(self.face_offsets) - 1
+
+    @property
+    def face_sizes(self) -> np.ndarray:
+        return np.diff(self.face_offsets)
+
+    @property
+    def textured(self) -> bool:
+        return self.uvs is not None and self.face_uvs is not None and any(self.material_textures or ())
+
+    def centroid(self) -> Tuple[float, float, float]:
+        """Centroid semua vertex (dihitung dalam float64)."""
+        if len(self.vertices) == 0:
+            return (0.0, 0.0, 0.0)
+        c = self.vertices.mean(axis=0, dtype=np.float64)
+        return float(c[0]), float(c[1]), float(c[2])
+
+    def shifted(self, offset: Tuple[float, float, float]) -> "MeshData":
+        """Salinan mesh dengan semua vertex digeser sebesar -offset."""
+        vertices = (self.vertices - np.asarray(offset, dtype=np.float64)).astype(np.float32)
+        mesh = MeshData(
+            vertices,
+            self.face_indices,
+            self.face_offsets,
+            self.face_colors,
+            self.face_normals,
+            self.face_materials,
+            self.material_names,
+            self.uvs,
+            self.face_uvs,
+            self.material_textures,
+        )
+        # topologi tidak berubah, triangulasi bisa dipakai ulang
+        mesh._triangulation = self._triangulation
+        return mesh
+
+    def triangulate(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fan triangulation semua face sekaligus.
+        Return (triangles (T, 3) int32, face id tiap segitiga (T,) int32).
+        """
+        if self._triangulation is not None:
+            return self._triangulation
+
+        corners, tri_face = self.corner_triangles()
+        tris = self.face_indices[corners].astype(np.int32, copy=False)
+        self._triangulation = (tris, tri_face)
+        return self._triangulation
+
+    def corner_triangles(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sama seperti triangulate(), tapi indeksnya menunjuk ke "corner"
+        (posisi di face_indices), bukan ke vertex. Dipakai untuk flat shading
+        di mana tiap corner punya normal/warna face-nya sendiri.
+        """
+        sizes = self.face_sizes
+        tri_per_face = np.maximum(sizes - 2, 0)
+        tri_face = np.repeat(np.arange(self.face_count, dtype=np.int32), tri_per_face)
+
+        # posisi segitiga di dalam face-nya: 0, 1, 2, ...
+        first_tri = np.cumsum(tri_per_face) - tri_per_face
+        local = np.arange(len(tri_face), dtype=np.int64) - np.repeat(first_tri, tri_per_face)
+
+        base = self.face_offsets[:-1].astype(np.int64)[tri_face]
+        corners = np.empty((len(tri_face), 3), dtype=np.int64)
+        corners[:, 0] = base
+        corners[:, 1] = base + local + 1
+        corners[:, 2] = base + local + 2
+        return corners, tri_face
+
+    def to_arrays(self) -> Tuple[Dict[str, np.ndarray], dict]:
+        """Array + metadata untuk disimpan ke MeshCache."""
+        tris, tri_face = self.triangulate()
+        arrays = {
+            "vertices": self.vertices,
+            "face_indices": self.face_indices,
+            "face_offsets": self.face_offsets,
+            "face_colors": self.face_colors,
+            "face_normals": self.face_normals,
+            "face_materials": self.face_materials,
+            "triangles": tris,
+            "triangle_faces": tri_face,
+        }
+        meta = {"material_names": list(self.material_names)}
+        if self.textured:
+            arrays["uvs"] = self.uvs
+            arrays["face_uvs"] = self.face_uvs
+            meta["material_textures"] = list(self.material_textures)
+        return arrays, meta
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], meta: dict) -> "MeshData":
+        mesh = cls(
+            arrays["vertices"],
+            arrays["face_indices"],
+            arrays["face_offsets"],
+            arrays["face_colors"],
+            arrays["face_normals"],
+            arrays["face_materials"],
+            list(meta.get("material_names", [])),
+            uvs=arrays.get("uvs"),
+            face_uvs=arrays.get("face_uvs"),
+            material_textures=meta.get("material_textures"),
+        )
+        if "triangles" in arrays and "triangle_faces" in arrays:
+            mesh._triangulation = (arrays["triangles"], arrays["triangle_faces"])
+        return mesh
+
+    @classmethod
+    def from_lists(cls, vertices, faces, face_colors, face_normals) -> "MeshData":
+        """Bangun MeshData dari format list lama (mis. kubus fallback)."""
+        sizes = np.array([len(f) for f in faces], dtype=np.int32)
+        offsets = np.zeros(len(faces) + 1, dtype=np.int32)
+        np.cumsum(sizes, out=offsets[1:])
+        flat = [i for f in faces for i in f]
+        return cls(
+            np.asarray(vertices, dtype=np.float32).reshape(-1, 3),
+            np.asarray(flat, dtype=np.int32),
+            offsets,
+            np.asarray(face_colors, dtype=np.float32).reshape(-1, 3),
+            np.asarray(face_normals, dtype=np.float32).reshape(-1, 3),
+            np.full(len(faces), -1, dtype=np.int32),
+            [],
+        )
+
+    def to_lists(self):
+        """Konversi ke format list lama (vertices, faces, face_colors, face_normals)."""
+        vertices = [tuple(v) for v in self.vertices.tolist()]
+        flat = self.face_indices.tolist()
+        offs = self.face_offsets.tolist()
+        faces = [flat[offs[i]:offs[i + 1]] for i in range(self.face_count)]
+        colors = [tuple(c) for c in self.face_colors.tolist()]
+        normals = [tuple(n) for n in self.face_normals.tolist()]
+        return vertices, faces, colors, normals
@@ -0,0 +1,175 @@
+from collections import deque
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .mesh_cache import MeshCache
+from .mesh_data import MeshData
+from .vertex_arrays import RenderArrays, build_render_arrays
+
+
+# ukuran cache post-transform yang disimulasikan (FIFO, tipikal GPU lama)
+DEFAULT_CACHE_SIZE = 16
+# simulasi ACMR pakai loop Python, jadi dibatasi ke sebagian awal index buffer
+ACMR_SAMPLE_TRIANGLES = 200_000
+
+
+class OptimizeStats:
+    def __init__(self):
+        self.vertices_before = 0
+        self.vertices_after = 0
+        self.bytes_before = 0
+        self.bytes_after = 0
+        self.acmr_before = 0.0
+        self.acmr_after = 0.0
+        self.index_dtype = "uint32"
+
+    def to_dict(self) -> dict:
+        return dict(self.__dict__)
+
+    def __str__(self) -> str:
+        return (
+            f"vertices {self.vertices_before} -> {self.vertices_after}, "
+            f"memory {self.bytes_before / 1024:.1f} KiB -> {self.bytes_after / 1024:.1f} KiB, "
+            f"ACMR {self.acmr_before:.3f} -> {self.acmr_after:.3f}, "
+            f"index {self.index_dtype}"
+        )
+
+
+def acmr(indices: np.ndarray, cache_size: int = DEFAULT_CACHE_SIZE,
+         max_triangles: int = ACMR_SAMPLE_TRIANGLES) -> float:
+    """Average cache miss ratio (miss per segitiga) dengan simulasi cache FIFO."""
+    idx = np.asarray(indices[: max_triangles * 3]).tolist()
+    if not idx:
+        return 0.0
+    fifo: deque = deque()
+    cached = set()
+    misses = 0
+    for i in idx:
+        if i not in cached:
+            misses += 1
+            fifo.append(i)
+            cached.add(i)
+            if len(fifo) > cache_size:
+                cached.discard(fifo.popleft())
+    return misses / (len(idx) // 3)
+
+
+def weld_vertices(vertices: np.ndarray, indices: np.ndarray,
+                  tolerance: float = 1e-5) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gabungkan vertex yang semua atributnya (posisi, normal, warna) sama
+    dalam toleransi (dikuantisasi ke grid ukuran `tolerance`).
+    """
+    if len(vertices) == 0:
+        return vertices, indices
+    quantized = np.round(vertices / tolerance).astype(np.int64)
+    _, first, inverse = np.unique(quantized, axis=0, return_index=True, return_inverse=True)
+    return vertices[first], inverse.reshape(-1)[indices]
+
+
+def _morton_codes(points: np.ndarray) -> np.ndarray:
+    """Kode Morton 30-bit (10 bit per sumbu) untuk titik 3D."""
+    lo = points.min(axis=0)
+    extent = np.maximum(points.max(axis=0) - lo, 1e-12)
+    grid = ((points - lo) / extent * 1023.0).astype(np.uint64)
+
+    def spread(v):
+        v = (v | (v << np.uint64(16))) & np.uint64(0x030000FF)
+        v = (v | (v << np.uint64(8))) & np.uint64(0x0300F00F)
+        v = (v | (v << np.uint64(4))) & np.uint64(0x030C30C3)
+        v = (v | (v << np.uint64(2))) & np.uint64(0x09249249)
+        return v
+
+    return (spread(grid[:, 0]) << np.uint64(2)) | (spread(grid[:, 1]) << np.uint64(1)) | spread(grid[:, 2])
+
+
+def reorder_triangles(vertices: np.ndarray, indices: np.ndarray,
+                      ranges: List[Tuple[int, int, int]]) -> np.ndarray:
+    """
+    Urutkan segitiga di dalam tiap range material sepanjang kurva Morton,
+    supaya segitiga yang berdekatan (dan berbagi vertex) digambar berurutan.
+    """
+    tris = indices.reshape(-1, 3)
+    out = tris.copy()
+    centers = vertices[:, 0:3][tris].mean(axis=1)
+    for _, start, count in ranges:
+        a, b = start // 3, (start + count) // 3
+        if b - a < 2:
+            continue
+        order = np.argsort(_morton_codes(centers[a:b]), kind="stable")
+        out[a:b] = tris[a:b][order]
+    return out.reshape(-1)
+
+
+def compact_vertices(vertices: np.ndarray, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Urutkan ulang vertex sesuai pemakaian pertama di index buffer, buang yang tidak dipakai."""
+    used, first = np.unique(indices, return_index=True)
+    order = used[np.argsort(first, kind="stable")]
+    remap = np.empty(len(vertices), dtype=np.int64)
+    remap[order] = np.arange(len(order))
+    return vertices[order], remap[indices]
+
+
+def optimize_render_arrays(
+    arrays: RenderArrays,
+    tolerance: float = 1e-5,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+) -> Tuple[RenderArrays, OptimizeStats]:
+    """Weld → urutan segitiga cache-friendly → kompaksi vertex → index 16/32 bit."""
+    stats = OptimizeStats()
+    stats.vertices_before = len(arrays.vertices)
+    stats.bytes_before = arrays.nbytes
+    stats.acmr_before = acmr(arrays.indices, cache_size)
+
+    vertices, indices = weld_vertices(arrays.vertices, arrays.indices.astype(np.int64), tolerance)
+
+    reordered = reorder_triangles(vertices, indices, arrays.ranges)
+    # urutan Morton tidak selalu lebih baik dari urutan asli file (mis. hasil scan)
+    if acmr(reordered, cache_size) < acmr(indices, cache_size):
+        indices = reordered
+
+    vertices, indices = compact_vertices(vertices, indices)
+
+    index_dtype = np.uint16 if len(vertices) <= 0xFFFF else np.uint32
+    result = RenderArrays(
+        np.ascontiguousarray(vertices, dtype=np.float32),
+        indices.astype(index_dtype),
+        list(arrays.ranges),
+    )
+
+    stats.vertices_after = len(result.vertices)
+    stats.bytes_after = result.nbytes
+    stats.acmr_after = acmr(result.indices, cache_size)
+    stats.index_dtype = np.dtype(index_dtype).name
+    return result, stats
+
+
+def load_optimized_arrays(
+    obj_path: Optional[str],
+    mesh: MeshData,
+    cache: Optional[MeshCache] = None,
+    tolerance: float = 1e-5,
+) -> RenderArrays:
+    """RenderArrays teroptimasi untuk mesh, dibaca/ditulis lewat MeshCache kalau ada."""
+    variant = f"optimized:{tolerance:g}"
+    key = None
+    if cache is not None and obj_path is not None:
+        key = cache.key_for(obj_path, variant)
+        hit = cache.load(obj_path, variant, key)
+        if hit is not None:
+            data, meta = hit
+            print(f"[MeshOptimizer] cache hit: {meta.get('stats', {})}")
+            return RenderArrays.from_arrays(data, meta)
+
+    result, stats = optimize_render_arrays(build_render_arrays(mesh), tolerance)
+    print(f"[MeshOptimizer] {stats}")
+
+    if cache is not None and obj_path is not None:
+        data, meta = result.to_arrays()
+        meta["stats"] = stats.to_dict()
+        try:
+            cache.store(obj_path, data, meta, variant, key)
+        except OSError as e:
+            print(f"[MeshOptimizer] cannot write cache: {e}")
+    return result
@@ -1,9 +1,175 @@
 import os
+import re
+import warnings
 from typing import List, Tuple, Dict, Optional
 
+import numpy as np
+
+from .mesh_data import MeshData
+
+
+DEFAULT_COLOR: Tuple[float, float, float] = (0.8, 0.8, 0.8)
+
+_MTLLIB_RE = re.compile(rb"^[ \t]*mtllib[ \t]+([^\r\n]+)", re.M)
+# indentasi di awal baris (dibuang dulu supaya jenis baris terbaca dari byte pertama)
+_INDENT_RE = re.compile(rb"^[ \t]+", re.M)
+# jenis baris untuk parser cepat
+_OTHER, _VERTEX, _UV, _FACE, _USEMTL, _MTLLIB = range(6)
+_SLASH_TO_SPACE = bytes.maketrans(b"/", b" ")
+# "v/vt/vn" → "v"
+_FACE_ATTR_RE = re.compile(rb"/[^\s]*")
+# corner tanpa vt: "v" → "v/0", lalu "v/vt/vn" → "vt" (0 = tanpa UV)
+_FACE_BARE_RE = re.compile(rb"(?<!\S)([^\s/]+)(?!\S)")
+_FACE_VT_RE = re.compile(rb"[^\s/]+/([^\s/]*)\S*")
+
+# opsi map_Kd yang diikuti argumen (jumlah maksimum; angka saja)
+_MAP_OPTIONS = {
+    "-blendu": 1, "-blendv": 1, "-bm": 1, "-boost": 1, "-cc": 1, "-clamp": 1,
+    "-imfchan": 1, "-texres": 1, "-type": 1, "-mm": 2, "-o": 3, "-s": 3, "-t": 3,
+}
+
+
+def _tokens_per_line(buf: bytes, n_lines: int) -> np.ndarray:
+    """Jumlah token (dipisah whitespace) di tiap baris buffer, tanpa loop Python."""
+    b = np.frombuffer(buf, dtype=np.uint8)
+    ws = (b == 32) | (b == 9) | (b == 10) | (b == 13)
+    start = ~ws
+    start[1:] &= ws[:-1]
+    token_pos = np.flatnonzero(start)
+    newline_pos = np.flatnonzero(b == 10)
+    line_of_token = np.searchsorted(newline_pos, token_pos)
+    return np.bincount(line_of_token, minlength=n_lines)
+
+
+def _is_blank(c: np.ndarray) -> np.ndarray:
+    return (c == 32) | (c == 9)
+
+
+def _line_starts(data: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """(salinan bytes yang bisa ditulis, offset awal tiap baris)."""
+    buf = np.frombuffer(data, dtype=np.uint8).copy()
+    starts = np.flatnonzero(buf == 10) + 1
+    return buf, np.concatenate(([0], starts[starts < len(buf)]))
+
+
+def _classify_lines(b: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Jenis tiap baris (_VERTEX, _FACE, ...) dari beberapa byte pertamanya, tanpa regex."""
+    padded = np.concatenate((b, np.zeros(8, dtype=np.uint8)))
+    c0 = padded[starts]
+    c1 = padded[starts + 1]
+    kind = np.zeros(len(starts), dtype=np.uint8)
+    kind[(c0 == ord("v")) & _is_blank(c1)] = _VERTEX
+    kind[(c0 == ord("v")) & (c1 == ord("t")) & _is_blank(padded[starts + 2])] = _UV
+    kind[(c0 == ord("f")) & _is_blank(c1)] = _FACE
+    for code, word in ((_USEMTL, b"usemtl"), (_MTLLIB, b"mtllib")):
+        rows = np.flatnonzero(c0 == word[0])
+        head = padded[starts[rows, None] + np.arange(len(word) + 1)]
+        match = (head[:, :-1] == np.frombuffer(word, dtype=np.uint8)).all(axis=1) & _is_blank(head[:, -1])
+        kind[rows[match]] = code
+    return kind
+
+
+def _face_corners(f_buf: bytes, corners: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    (indeks v, indeks vt atau None) tiap corner, 1-based. Format seragam
+    (v, v/vt, v/vt/vn, v//vn) diparse sekali setelah "/" jadi spasi, jadi
+    indeks vt ikut tanpa pass kedua; format campuran → regex per token
+    (vt None, lihat _face_uv_indices).
+    """
+    if b"/" not in f_buf:
+        return _parse_numbers(f_buf, corners, np.int64), None
+    buf = f_buf.replace(b"//", b"/0/")
+    b = np.frombuffer(buf, dtype=np.uint8)
+    slashes = np.flatnonzero(b == ord("/"))
+    fields = len(slashes) // max(corners, 1) + 1
+    uniform = fields in (2, 3) and len(slashes) == (fields - 1) * corners
+    if uniform and fields == 2:
+        # jumlah "/" juga cocok untuk campuran "v" + "v/vt/vn": tiap token harus punya tepat satu
+        ws = np.flatnonzero(_is_blank(b) | (b == 10) | (b == 13))
+        token = np.searchsorted(ws, slashes)
+        uniform = not np.any(token[1:] == token[:-1])
+    if uniform:
+        try:
+            values = _parse_numbers(buf.translate(_SLASH_TO_SPACE), fields * corners, np.int64)
+        except ValueError:
+            pass
+        else:
+            values = values.reshape(-1, fields)
+            return values[:, 0], values[:, 1]
+    return _parse_numbers(_FACE_ATTR_RE.sub(b"", f_buf), corners, np.int64), None
+
+
+def _is_number(text: str) -> bool:
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _map_filename(args: str) -> str:
+    """Nama file dari argumen map_Kd ("-s 1 1 1 -clamp on Skull.jpg" → "Skull.jpg")."""
+    tokens = args.split()
+    i = 0
+    while i < len(tokens) and tokens[i] in _MAP_OPTIONS:
+        limit = _MAP_OPTIONS[tokens[i]]
+        i += 1
+        taken = 0
+        while i < len(tokens) - 1 and taken < limit and (
+            _is_number(tokens[i]) or tokens[i] in ("on", "off") or limit == 1
+        ):
+            i += 1
+            taken += 1
+    # sisa token = nama file (boleh mengandung spasi)
+    return " ".join(tokens[i:])
+
+
+def _resolve_map(base_dir: str, name: str) -> Optional[str]:
+    """Path tekstur relatif ke .mtl; path absolut Windows dari exporter dicoba sebagai nama file saja."""
+    name = name.replace("\\", "/")
+    for candidate in (os.path.join(base_dir, name), os.path.join(base_dir, os.path.basename(name))):
+        if os.path.isfile(candidate):
+            return os.path.abspath(candidate)
+    return None
+
+
+def _face_uv_indices(f_buf: bytes, expected: int) -> np.ndarray:
+    """Indeks vt (1-based, 0 = tanpa UV) tiap corner dari baris face mentah."""
+    buf = f_buf.replace(b"//", b"/0/")
+    # format seragam "v/vt" / "v/vt/vn": cukup ganti "/" dengan spasi lalu ambil kolom vt
+    slashes = buf.count(b"/")
+    for fields in (2, 3):
+        if slashes == (fields - 1) * expected:
+            try:
+                values = _parse_numbers(buf.replace(b"/", b" "), fields * expected, np.int64)
+            except ValueError:
+                break
+            return values.reshape(-1, fields)[:, 1]
+    # format campuran dalam satu file: regex per token
+    buf = _FACE_VT_RE.sub(rb"\1", _FACE_BARE_RE.sub(rb"\1/0", buf))
+    return _parse_numbers(buf, expected, np.int64)
+
+
+def _parse_numbers(buf: bytes, expected: int, dtype) -> np.ndarray:
+    """Parse semua angka di buffer sekaligus; ValueError kalau ada token aneh."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        values = np.fromstring(buf, dtype=dtype, sep=" ")
+    if len(values) != expected:
+        raise ValueError("unexpected token in OBJ data")
+    return values
+
+
+def find_mtllib(data: bytes, end: Optional[int] = None) -> Optional[str]:
+    """Nama file dari baris mtllib pertama di data[:end] (buffer OBJ), None kalau tidak ada."""
+    m = _MTLLIB_RE.search(data, 0, len(data) if end is None else end)
+    if m is None:
+        return None
+    return m.group(1).decode("utf-8", "replace").strip()
+
 
 class OBJLoader:
-    def __init__(self, path: str):
+    def __init__(self, path: str, fast: bool = False):
         # daftar vertex global (x, y, z)
         self.vertices: List[Tuple[float, float, float]] = []
         # tiap face: list indeks vertex [v0, v1, v2, ...] (boleh 3, 4, 5, ...)
@@ -12,8 +178,15 @@ class OBJLoader:
         self.face_colors: List[Tuple[float, float, float]] = []
         # normal per-face (dipakai untuk lighting)
         self.face_normals: List[Tuple[float, float, float]] = []
+        # hasil parser cepat (array NumPy), hanya terisi kalau fast=True
+        self.mesh: Optional[MeshData] = None
+        # path tekstur map_Kd per material (hanya yang file-nya ada)
+        self.material_maps: Dict[str, str] = {}
 
-        self._load(path)
+        if fast:
+            self._load_fast(path)
+        else:
+            self._load(path)
 
     def _load(self, path: str):
         base_dir = os.path.dirname(path)
@@ -79,8 +252,180 @@ class OBJLoader:
             f"{len(self.faces)} faces, {len(mtl_colors)} materials"
         )
 
+    def _load_fast(self, path: str):
+        """
+        Parser vektor: jenis tiap baris dibaca dari byte pertamanya (posisi
+        newline via NumPy), prefix record dikosongkan, lalu semua baris v / f /
+        vt dipotong dengan mask byte dan diparse sekaligus oleh np.fromstring
+        ke array float32/int32. Normal & centroid dihitung dalam satu pass.
+        Hasilnya sama dengan _load, tapi disimpan di self.mesh.
+        """
+        base_dir = os.path.dirname(path)
+        with open(path, "rb") as f:
+            data = f.read()
+
+        # 1) batas & jenis baris
+        buf, starts = _line_starts(data)
+        if len(buf) and np.any(_is_blank(buf[starts])):
+            data = _INDENT_RE.sub(b"", data)
+            buf, starts = _line_starts(data)
+        kind = _classify_lines(buf, starts)
+        # prefix "v" / "vt" / "f" jadi spasi → isi baris bisa langsung ke fromstring
+        for code, width in ((_VERTEX, 1), (_UV, 2), (_FACE, 1)):
+            rows = starts[kind == code]
+            for k in range(width):
+                buf[rows + k] = 32
+        byte_kind = np.repeat(kind, np.diff(np.append(starts, len(buf))))
+
+        def lines_of(code: int) -> bytes:
+            return buf[byte_kind == code].tobytes()
+
+        # 2) .mtl (hanya mtllib pertama, sama seperti _load)
+        mtl_colors: Dict[str, Tuple[float, float, float]] = {}
+        mtl_rows = np.flatnonzero(kind == _MTLLIB)
+        if len(mtl_rows):
+            row = int(mtl_rows[0])
+            end = int(starts[row + 1]) if row + 1 < len(starts) else len(data)
+            mtl_name = find_mtllib(data[int(starts[row]):end])
+            if mtl_name is not None:
+                mtl_colors = self._load_mtl(os.path.join(base_dir, mtl_name))
+
+        # 3) vertex: ambil 3 koordinat pertama tiap baris "v"
+        n_vertex_lines = int(np.count_nonzero(kind == _VERTEX))
+        v_buf = lines_of(_VERTEX)
+        v_counts = _tokens_per_line(v_buf, n_vertex_lines)
+        v_values = _parse_numbers(v_buf, int(v_counts.sum()), np.float32)
+        if n_vertex_lines and np.all(v_counts == 3):
+            vertices = v_values.reshape(-1, 3)
+        else:
+            # baris dengan w / warna vertex, atau baris rusak (< 3 koordinat)
+            v_starts = np.cumsum(v_counts) - v_counts
+            v_starts = v_starts[v_counts >= 3]
+            vertices = v_values[v_starts[:, None] + np.arange(3)]
+        vertices = np.ascontiguousarray(vertices, dtype=np.float32)
+        del v_buf, v_values
+
+        # 4) face + urutan usemtl relatif terhadap face
+        n_faces = int(np.count_nonzero(kind == _FACE))
+        raw_f_buf = lines_of(_FACE)
+        f_counts = _tokens_per_line(raw_f_buf, n_faces)
+        f_values, uv_values = _face_corners(raw_f_buf, int(f_counts.sum()))
+
+        # material aktif untuk tiap face (-1 = belum ada usemtl)
+        material_names: List[str] = []
+        material_ids: Dict[str, int] = {}
+        records = np.flatnonzero((kind == _FACE) | (kind == _USEMTL))
+        is_face = kind[records] == _FACE
+        use_rows = records[~is_face]
+        mtl_ids = np.empty(len(use_rows), dtype=np.int32)
+        line_ends = np.append(starts[1:], len(data))
+        for i, row in enumerate(use_rows.tolist()):
+            line = data[int(starts[row]) + len(b"usemtl"):int(line_ends[row])]
+            name = line.decode("utf-8", "replace").strip()
+            if name not in material_ids:
+                material_ids[name] = len(material_names)
+                material_names.append(name)
+            mtl_ids[i] = material_ids[name]
+        if len(mtl_ids):
+            faces_before = np.cumsum(is_face)[np.flatnonzero(~is_face)]
+            pick = np.searchsorted(faces_before, np.arange(n_faces), side="right") - 1
+            face_materials = np.where(pick >= 0, mtl_ids[np.maximum(pick, 0)], -1)
+        else:
+            face_materials = np.full(n_faces, -1)
+
+        # buang face dengan < 3 vertex
+        keep = f_counts >= 3
+        face_indices = (f_values[np.repeat(keep, f_counts)] - 1).astype(np.int32)
+        sizes = f_counts[keep]
+        face_offsets = np.zeros(len(sizes) + 1, dtype=np.int32)
+        np.cumsum(sizes, out=face_offsets[1:])
+        face_materials = face_materials[keep].astype(np.int32)
+
+        # warna per-face dari tabel material
+        palette = np.array(
+            [mtl_colors.get(n, DEFAULT_COLOR) for n in material_names] + [DEFAULT_COLOR],
+            dtype=np.float32,
+        )
+        face_colors = palette[face_materials]  # -1 → warna default (elemen terakhir)
+
+        face_normals = self._compute_normals(vertices, face_indices, face_offsets)
+
+        # 4) UV: hanya di-parse kalau ada material yang dipakai punya map_Kd
+        material_textures = [self.material_maps.get(n) for n in material_names]
+        uvs = face_uvs = None
+        if any(material_textures) and b"/" in raw_f_buf:
+            uvs = self._parse_uvs(lines_of(_UV), int(np.count_nonzero(kind == _UV)))
+            if len(uvs):
+                if uv_values is None:
+                    uv_values = _face_uv_indices(raw_f_buf, int(f_counts.sum()))
+                face_uvs = uv_values[np.repeat(keep, f_counts)] - 1
+                # vt relatif (negatif) / di luar jangkauan → tanpa UV
+                face_uvs[(face_uvs < 0) | (face_uvs >= len(uvs))] = -1
+                face_uvs = face_uvs.astype(np.int32)
+            else:
+                uvs = None
+
+        self.mesh = MeshData(
+            vertices,
+            face_indices,
+            face_offsets,
+            face_colors,
+            face_normals,
+            face_materials,
+            material_names,
+            uvs=uvs,
+            face_uvs=face_uvs,
+            material_textures=material_textures if uvs is not None else None,
+        )
+
+        textured = sum(t is not None for t in material_textures) if uvs is not None else 0
+        print(
+            f"[OBJLoader] loaded {len(vertices)} vertices, "
+            f"{self.mesh.face_count} faces, {len(mtl_colors)} materials"
+            + (f", {textured} textured" if textured else "") + " (fast)"
+        )
+
+    @staticmethod
+    def _parse_uvs(uv_buf: bytes, n_lines: int) -> np.ndarray:
+        """Isi semua baris vt (prefix sudah dibuang) → (M, 2) float32 (u, v); komponen w diabaikan."""
+        counts = _tokens_per_line(uv_buf, n_lines)
+        values = _parse_numbers(uv_buf, int(counts.sum()), np.float32)
+        if n_lines and np.all(counts == 2):
+            return np.ascontiguousarray(values.reshape(-1, 2))
+        # "vt u" (v = 0) atau "vt u v w"
+        starts = np.cumsum(counts) - counts
+        uvs = np.zeros((n_lines, 2), dtype=np.float32)
+        has_u = counts >= 1
+        has_v = counts >= 2
+        uvs[has_u, 0] = values[starts[has_u]]
+        uvs[has_v, 1] = values[starts[has_v] + 1]
+        return uvs
+
+    @staticmethod
+    def _compute_normals(
+        vertices: np.ndarray,
+        face_indices: np.ndarray,
+        face_offsets: np.ndarray,
+    ) -> np.ndarray:
+        """Versi vektor _compute_normal untuk semua face sekaligus."""
+        starts = face_offsets[:-1]
+        v0 = vertices[face_indices[starts]].astype(np.float64)
+        v1 = vertices[face_indices[starts + 1]].astype(np.float64)
+        v2 = vertices[face_indices[starts + 2]].astype(np.float64)
+
+        n = np.cross(v1 - v0, v2 - v0)
+        length = np.sqrt(np.einsum("ij,ij->i", n, n))
+        degenerate = length == 0.0
+        length[degenerate] = 1.0
+        n /= length[:, None]
+        n[degenerate] = (0.0, 0.0, 1.0)
+        return n.astype(np.float32)
+
     def _load_mtl(self, mtl_path: str) -> Dict[str, Tuple[float, float, float]]:
-        """Parse file .mtl dan ambil warna diffuse (Kd) per material."""
+        """
+        Parse file .mtl dan ambil warna diffuse (Kd) per material.
+        Tekstur diffuse (map_Kd) dicatat di self.material_maps.
+        """
         colors: Dict[str, Tuple[float, float, float]] = {}
         if not os.path.exists(mtl_path):
             print(f"[OBJLoader] MTL not found: {mtl_path}")
@@ -104,6 +449,14 @@ class OBJLoader:
                         _, r, g, b = parts[:4]
                         colors[current_name] = (float(r), float(g), float(b))
 
+                elif line.startswith("map_Kd") and current_name is not None:
+                    name = _map_filename(line[len("map_Kd"):])
+                    texture = _resolve_map(os.path.dirname(mtl_path), name) if name else None
+                    if texture is None:
+                        print(f"[OBJLoader] texture not found for {current_name}: {name}")
+                    else:
+                        self.material_maps[current_name] = texture
+
         print(f"[OBJLoader] loaded {len(colors)} materials from {mtl_path}")
         return colors
 
@@ -128,6 +481,9 @@ class OBJLoader:
 
     def compute_centroid(self) -> Tuple[float, float, float]:
         """Hitung titik tengah (centroid) dari semua vertex."""
+        if self.mesh is not None:
+            return self.mesh.centroid()
+
         if not self.vertices:
             return (0.0, 0.0, 0.0)
 
@@ -0,0 +1,243 @@
+import hashlib
+import math
+
+import numpy as np
+
+from .cube_renderer import (
+    CAMERA_DISTANCE, CLEAR_COLOR, FOV_Y, LIGHT_AMBIENT, LIGHT_DIFFUSE, LIGHT_POSITION,
+    Z_FAR, Z_NEAR, CubeRenderer,
+)
+from .vertex_arrays import RenderArrays, build_render_arrays
+
+
+# ambient global default OpenGL (GL_LIGHT_MODEL_AMBIENT)
+MODEL_AMBIENT = 0.2
+# jumlah kandidat pixel maksimum per batch rasterisasi (batas memori)
+CHUNK_PIXELS = 1 << 21
+# depth buffer: key int64 = depth 24 bit (seperti GL) << 31 | nomor fragment
+_DEPTH_MAX = (1 << 24) - 1
+_ID_BITS = 31
+# clear depth 1.0: fragment dengan depth 1.0 tidak lolos GL_LESS
+_DEPTH_CLEAR = (_DEPTH_MAX << _ID_BITS) - 1
+
+
+def _rotation(angle_deg: float, axis: int) -> np.ndarray:
+    """Matriks 4x4 glRotatef terhadap sumbu x (0) / y (1)."""
+    c, s = math.cos(math.radians(angle_deg)), math.sin(math.radians(angle_deg))
+    m = np.eye(4)
+    a, b = (1, 2) if axis == 0 else (2, 0)
+    m[a, a], m[a, b], m[b, a], m[b, b] = c, -s, s, c
+    return m
+
+
+def modelview_matrix(rot_x: float, rot_y: float, scale: float) -> np.ndarray:
+    """gluLookAt(0,0,d → origin) · glScalef · glRotatef(x) · glRotatef(y), sama dengan draw()."""
+    view = np.eye(4)
+    view[2, 3] = -CAMERA_DISTANCE
+    return view @ np.diag([scale, scale, scale, 1.0]) @ _rotation(rot_x, 0) @ _rotation(rot_y, 1)
+
+
+def projection_matrix(width: int, height: int) -> np.ndarray:
+    """gluPerspective(FOV_Y, aspect, Z_NEAR, Z_FAR)."""
+    f = 1.0 / math.tan(math.radians(FOV_Y) / 2.0)
+    aspect = width / float(height)
+    p = np.zeros((4, 4))
+    p[0, 0] = f / aspect
+    p[1, 1] = f
+    p[2, 2] = (Z_FAR + Z_NEAR) / (Z_NEAR - Z_FAR)
+    p[2, 3] = 2.0 * Z_FAR * Z_NEAR / (Z_NEAR - Z_FAR)
+    p[3, 2] = -1.0
+    return p
+
+
+def image_checksum(img: np.ndarray) -> str:
+    return hashlib.blake2b(np.ascontiguousarray(img).tobytes(), digest_size=16).hexdigest()
+
+
+class OffscreenRenderer:
+    """
+    Backend offscreen CubeRenderer tanpa window/context GL: rasterizer NumPy
+    yang mengikuti pipeline fixed-function di init_gl/draw (transformasi,
+    lighting per-vertex GL_LIGHT0 + GL_COLOR_MATERIAL, back-face culling,
+    depth test GL_LESS, interpolasi perspective-correct). Hasil = gambar RGB
+    uint8 (H, W, 3), baris 0 = atas.
+
+    Dibanding Mesa llvmpipe: cakupan pixel sama kecuali beberapa pixel tepi
+    (aturan top-left tidak ditiru persis) dan warna beda maks. 1 level
+    (pembulatan float → 8 bit tergantung driver). Checksum dipakai untuk
+    regresi backend ini sendiri.
+    """
+
+    def __init__(self, renderer: CubeRenderer, width: int = 800, height: int = 600):
+        self.renderer = renderer
+        self.width = width
+        self.height = height
+        arrays: RenderArrays = renderer.render_arrays or build_render_arrays(renderer.mesh)
+        self.arrays = arrays
+
+        v = arrays.vertices
+        self._positions = np.hstack([v[:, 0:3].astype(np.float64), np.ones((len(v), 1))])
+        self._normals = v[:, 3:6].astype(np.float64)
+        self._colors = v[:, 6:9].astype(np.float64)
+        self._tris = arrays.indices.astype(np.int64).reshape(-1, 3)
+
+        self._projection = projection_matrix(width, height)
+        self._clear = np.rint(np.asarray(CLEAR_COLOR[:3]) * 255.0).astype(np.uint8)
+        self._depth = np.empty(width * height, dtype=np.int64)
+        self._next_id = 0
+        self._color = np.empty((width * height, 3), dtype=np.uint8)
+
+    # ---------------- per-vertex ---------------- #
+
+    def _shade(self, eye: np.ndarray, modelview: np.ndarray) -> np.ndarray:
+        """Lighting fixed-function (tanpa GL_NORMALIZE: normal tidak dinormalisasi ulang)."""
+        normal_matrix = np.linalg.inv(modelview[:3, :3]).T
+        n = self._normals @ normal_matrix.T
+        # posisi lampu di-set saat modelview = identitas → sudah koordinat mata
+        light = np.asarray(LIGHT_POSITION[:3]) / LIGHT_POSITION[3]
+        l = light - eye
+        l /= np.maximum(np.linalg.norm(l, axis=1, keepdims=True), 1e-12)
+        ndotl = np.maximum(np.einsum("ij,ij->i", n, l), 0.0)
+
+        ambient = MODEL_AMBIENT + np.asarray(LIGHT_AMBIENT[:3])
+        diffuse = np.asarray(LIGHT_DIFFUSE[:3])
+        color = self._colors * (ambient + ndotl[:, None] * diffuse)
+        return np.clip(color, 0.0, 1.0)
+
+    # ---------------- rasterisasi ---------------- #
+
+    def _rasterize(self, win: np.ndarray, inv_w: np.ndarray, color: np.ndarray) -> None:
+        W, H = self.width, self.height
+        tris = self._tris
+        p0, p1, p2 = win[tris[:, 0]], win[tris[:, 1]], win[tris[:, 2]]
+
+        # back-face culling (CCW = depan) + segitiga degenerate
+        area = (p1[:, 0] - p0[:, 0]) * (p2[:, 1] - p0[:, 1]) - (p2[:, 0] - p0[:, 0]) * (p1[:, 1] - p0[:, 1])
+        lo = np.minimum(np.minimum(p0, p1), p2)
+        hi = np.maximum(np.maximum(p0, p1), p2)
+        x0 = np.maximum(np.ceil(lo[:, 0] - 0.5), 0).astype(np.int64)
+        x1 = np.minimum(np.floor(hi[:, 0] - 0.5), W - 1).astype(np.int64)
+        y0 = np.maximum(np.ceil(lo[:, 1] - 0.5), 0).astype(np.int64)
+        y1 = np.minimum(np.floor(hi[:, 1] - 0.5), H - 1).astype(np.int64)
+        # segitiga yang keluar dari depth range / di belakang kamera dibuang utuh
+        front = (inv_w[tris] > 0).all(axis=1)
+        keep = np.flatnonzero(
+            (area > 0) & front & (x1 >= x0) & (y1 >= y0) & (lo[:, 2] >= 0) & (hi[:, 2] <= 1)
+        )
+        if len(keep) == 0:
+            return
+
+        tris = tris[keep]
+        a, b, c = p0[keep], p1[keep], p2[keep]
+        inv_area = (1.0 / area[keep])[:, None]
+        # edge function = koordinat barycentric: l_i(x, y) = A_i x + B_i y + C_i
+        A = np.stack([b[:, 1] - c[:, 1], c[:, 1] - a[:, 1], a[:, 1] - b[:, 1]], axis=1) * inv_area
+        B = np.stack([c[:, 0] - b[:, 0], a[:, 0] - c[:, 0], b[:, 0] - a[:, 0]], axis=1) * inv_area
+        C = np.stack([
+            b[:, 0] * c[:, 1] - c[:, 0] * b[:, 1],
+            c[:, 0] * a[:, 1] - a[:, 0] * c[:, 1],
+            a[:, 0] * b[:, 1] - b[:, 0] * a[:, 1],
+        ], axis=1) * inv_area
+        # depth juga linear di ruang layar
+        z = np.stack([a[:, 2], b[:, 2], c[:, 2]], axis=1)
+        plane = (
+            (A * z).sum(axis=1), (B * z).sum(axis=1), (C * z).sum(axis=1),
+        )
+        edges = (A, B, C)
+
+        x0, x1, y0 = x0[keep], x1[keep], y0[keep]
+        rows = (y1[keep] - y0 + 1)
+        # batch segitiga supaya kandidat pixel (luas bbox) per batch <= CHUNK_PIXELS
+        ends = np.cumsum(rows * (x1 - x0 + 1))
+        start = 0
+        while start < len(keep):
+            base = ends[start - 1] if start else 0
+            stop = max(int(np.searchsorted(ends, base + CHUNK_PIXELS, side="right")), start + 1)
+            k = np.arange(start, stop)
+            self._raster_chunk(k, tris, edges, plane, x0, x1, y0, rows, inv_w, color)
+            start = stop
+
+    def _raster_chunk(self, k, tris, edges, plane, x0, x1, y0, rows, inv_w, color) -> None:
+        A, B, C = edges
+        W = self.width
+
+        # 1) satu item per (segitiga, baris pixel) di bbox
+        n_rows = rows[k]
+        r_tri = np.repeat(k, n_rows)
+        py = y0[r_tri] + np.arange(len(r_tri)) - np.repeat(np.cumsum(n_rows) - n_rows, n_rows)
+        cy = py + 0.5
+
+        # 2) rentang x di baris itu yang memenuhi ketiga l_i >= 0 (tanpa cek per pixel)
+        Ar = A[r_tri]
+        D = B[r_tri] * cy[:, None] + C[r_tri]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bound = -D / Ar
+        x_lo = np.where(Ar > 0, bound, -np.inf).max(axis=1)
+        x_hi = np.where(Ar < 0, bound, np.inf).min(axis=1)
+        empty = ((Ar == 0) & (D < 0)).any(axis=1)
+        px0 = np.maximum(np.ceil(x_lo - 0.5), x0[r_tri])
+        px1 = np.minimum(np.floor(x_hi - 0.5), x1[r_tri])
+        span = np.where(empty | (px1 < px0), 0, px1 - px0 + 1).astype(np.int64)
+        n = int(span.sum())
+        if n == 0:
+            return
+
+        # 3) pixel di dalam segitiga + depth
+        row = np.repeat(np.arange(len(r_tri)), span)
+        px = px0[row].astype(np.int64) + np.arange(n) - np.repeat(np.cumsum(span) - span, span)
+        tri = r_tri[row]
+        pix = py[row] * W + px
+        Az, Bz, Cz = plane
+        z_row = Bz[r_tri] * cy + Cz[r_tri]
+        z = Az[tri] * (px + 0.5) + z_row[row]
+
+        # 4) depth test GL_LESS lewat satu key int64: depth 24 bit | urutan fragment
+        #    (minimum per pixel = paling dekat, seri → segitiga yang digambar duluan)
+        zq = np.rint(np.clip(z, 0.0, 1.0) * _DEPTH_MAX).astype(np.int64)
+        key = (zq << _ID_BITS) | (self._next_id + np.arange(n))
+        self._next_id += n
+        np.minimum.at(self._depth, pix, key)
+        won = np.flatnonzero(self._depth[pix] == key)
+        if len(won) == 0:
+            return
+
+        # 5) warna perspective-correct (bobot barycentric / w), hanya fragment yang menang
+        tri = tri[won]
+        cx = px[won] + 0.5
+        cyw = cy[row[won]]
+        l = np.maximum(A[tri] * cx[:, None] + B[tri] * cyw[:, None] + C[tri], 0.0)
+        t = tris[tri]
+        wgt = l * inv_w[t]
+        wgt /= wgt.sum(axis=1, keepdims=True)
+        rgb = np.einsum("ni,nij->nj", wgt, color[t])
+        self._color[pix[won]] = np.rint(np.clip(rgb, 0.0, 1.0) * 255.0).astype(np.uint8)
+
+    # ---------------- frame ---------------- #
+
+    def render(self, rot_x: float, rot_y: float, scale: float) -> np.ndarray:
+        """Satu frame; scale = skala GL (CubeRenderer.scale, sudah dikali 0.1)."""
+        modelview = modelview_matrix(rot_x, rot_y, scale)
+        eye = self._positions @ modelview.T
+        clip = eye @ self._projection.T
+        color = self._shade(eye[:, :3], modelview)
+
+        w = clip[:, 3]
+        # objek selalu di depan kamera (d = CAMERA_DISTANCE), clipping near cukup via reject
+        inv_w = 1.0 / np.where(np.abs(w) < 1e-12, 1e-12, w)
+        ndc = clip[:, :3] * inv_w[:, None]
+        win = np.empty_like(ndc)
+        win[:, 0] = (ndc[:, 0] + 1.0) * 0.5 * self.width
+        win[:, 1] = (ndc[:, 1] + 1.0) * 0.5 * self.height
+        win[:, 2] = (ndc[:, 2] + 1.0) * 0.5
+
+        self._depth.fill(_DEPTH_CLEAR)
+        self._next_id = 0
+        self._color[:] = self._clear
+        self._rasterize(win, inv_w, color)
+        # baris 0 framebuffer GL = bawah → balik supaya baris 0 = atas
+        return self._color.reshape(self.height, self.width, 3)[::-1].copy()
+
+    def draw(self) -> np.ndarray:
+        """Pengganti CubeRenderer.draw(): render state renderer saat ini."""
+        r = self.renderer
+        return self.render(r.rot_x, r.rot_y, r.scale)
@@ -0,0 +1,104 @@
+import time
+from collections import deque
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from .render_state import StateSlot
+
+
+class RenderScheduler:
+    """
+    Pacing loop GL berbasis glutTimerFunc (pengganti glutIdleFunc yang spin 100%).
+
+    Tiap tick: redraw hanya kalau ada state baru, state masih diekstrapolasi
+    (velocity != 0 dan belum lewat batas ekstrapolasi), atau invalidate()
+    dipanggil. Tick berikutnya dijadwalkan ke deadline frame berikut
+    (target_fps), di antaranya glutMainLoop tidur menunggu event.
+
+    target_fps=None → ikut vsync: setelah redraw langsung tick lagi (glutSwapBuffers
+    yang menahan sampai vblank), kalau tidak ada yang digambar polling tiap poll_ms.
+
+    state boleh satu StateSlot atau beberapa (satu per viewport); redraw kalau
+    salah satunya berubah.
+    """
+
+    def __init__(self, state: StateSlot | Sequence[StateSlot], target_fps: float | None = 60.0,
+                 poll_ms: int = 4, window: int = 240):
+        self.states = [state] if isinstance(state, StateSlot) else list(state)
+        self.target_fps = target_fps
+        self.period = 1.0 / target_fps if target_fps else 0.0
+        self.poll_ms = poll_ms
+
+        self._drawn_seq: Tuple[int, ...] = ()
+        self._dirty = True
+        self._posted = False
+        self._deadline = time.perf_counter()
+
+        # statistik frame
+        self._intervals = deque(maxlen=window)
+        self._last_draw: float | None = None
+        self.frames = 0
+        self.ticks = 0
+        self.skipped = 0
+
+    def invalidate(self) -> None:
+        """Paksa redraw di tick berikutnya (resize, ganti mode, mesh baru, ...)."""
+        self._dirty = True
+
+    def seq(self) -> Tuple[int, ...]:
+        """Nomor urut semua state (dibaca sebelum sample(), lalu ke frame_drawn)."""
+        return tuple(state.seq for state in self.states)
+
+    def needs_redraw(self, now: float) -> bool:
+        if self._dirty or self.seq() != self._drawn_seq:
+            return True
+        for state in self.states:
+            # state sama, tapi objek masih bergerak selama ekstrapolasi berjalan
+            _, s = state.read()
+            moving = s[4] != 0.0 or s[5] != 0.0 or s[6] != 0.0
+            if moving and now - s[0] < state.max_extrapolation + self.period:
+                return True
+        return False
+
+    def tick(self, now: float) -> bool:
+        """Dipanggil dari timer GLUT; True = perlu glutPostRedisplay()."""
+        self.ticks += 1
+        self._posted = self.needs_redraw(now)
+        if not self._posted:
+            self.skipped += 1
+        return self._posted
+
+    def frame_drawn(self, seq: int | Tuple[int, ...]) -> None:
+        """Dipanggil di akhir display(); seq = StateSlot.seq (atau seq()) yang dibaca sebelum sample()."""
+        self._drawn_seq = seq if isinstance(seq, tuple) else (seq,)
+        self._dirty = False
+        t = time.perf_counter()
+        if self._last_draw is not None:
+            interval = t - self._last_draw
+            # jeda panjang = idle (tidak ada yang berubah), bukan jitter
+            if interval < 0.25:
+                self._intervals.append(interval)
+        self._last_draw = t
+        self.frames += 1
+
+    def next_delay_ms(self) -> int:
+        """Jeda (ms) sampai tick berikutnya."""
+        now = time.perf_counter()
+        if not self.target_fps:
+            return 0 if self._posted else self.poll_ms
+        # deadline absolut supaya tidak drift; kalau telat jauh, mulai lagi dari sekarang
+        self._deadline += self.period
+        if self._deadline < now - self.period:
+            self._deadline = now + self.period
+        return max(0, int(round((self._deadline - now) * 1000.0)))
+
+    def stats(self) -> dict:
+        out = {"frames": self.frames, "ticks": self.ticks, "skipped": self.skipped}
+        if self._intervals:
+            iv = np.asarray(self._intervals)
+            out["fps"] = round(1.0 / float(iv.mean()), 1)
+            out["frame_ms"] = round(1e3 * float(iv.mean()), 2)
+            out["jitter_ms"] = round(1e3 * float(iv.std()), 2)
+            out["p99_ms"] = round(1e3 * float(np.percentile(iv, 99)), 2)
+        return out
@@ -0,0 +1,86 @@
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+# index kolom buffer state
+_T, _ROT_X, _ROT_Y, _SCALE, _V_ROT_X, _V_ROT_Y, _V_SCALE = range(7)
+
+
+class StateSlot:
+    """
+    Slot state terbaru (rot_x, rot_y, scale) dari thread vision ke thread GL.
+
+    Double buffer + nomor urut (seqlock): penulis mengisi buffer belakang lalu
+    menukar index, pembaca menyalin buffer depan dan mengulang kalau nomor urut
+    berubah di tengah jalan. Tidak ada lock dan tidak ada update yang hilang,
+    pembaca selalu dapat state paling baru.
+
+    Tiap state membawa timestamp capture dan velocity (per detik), sehingga
+    renderer bisa mengekstrapolasi ke waktu draw (lihat sample()).
+    """
+
+    def __init__(self, max_extrapolation: float = 0.15, max_gap: float = 0.5):
+        # ekstrapolasi dibatasi supaya objek tidak "kabur" waktu vision macet
+        self.max_extrapolation = max_extrapolation
+        # jarak antar state lebih dari ini → velocity dianggap 0 (tangan baru muncul dll)
+        self.max_gap = max_gap
+
+        self._buffers = np.zeros((2, 7), dtype=np.float64)
+        self._buffers[:, _SCALE] = 1.0
+        self._front = 0
+        self._seq = 0
+
+    @property
+    def seq(self) -> int:
+        """Naik tiap publish; dipakai pembaca untuk tahu ada state baru."""
+        return self._seq
+
+    def publish(self, t: float, rot_x: float, rot_y: float, scale: float,
+                velocity: Sequence[float] | None = None) -> None:
+        """
+        Dipanggil thread vision. velocity = (d rot_x, d rot_y, d scale) per detik;
+        None → beda hingga terhadap state sebelumnya.
+        """
+        prev = self._buffers[self._front]
+        back = 1 - self._front
+        buf = self._buffers[back]
+
+        if velocity is None:
+            dt = t - prev[_T]
+            if self._seq > 0 and 0.0 < dt <= self.max_gap:
+                velocity = (
+                    (rot_x - prev[_ROT_X]) / dt,
+                    (rot_y - prev[_ROT_Y]) / dt,
+                    (scale - prev[_SCALE]) / dt,
+                )
+            else:
+                velocity = (0.0, 0.0, 0.0)
+
+        buf[_T] = t
+        buf[_ROT_X] = rot_x
+        buf[_ROT_Y] = rot_y
+        buf[_SCALE] = scale
+        buf[_V_ROT_X:] = velocity
+
+        # satu assignment (atomic di Python) → pembaca langsung lihat buffer baru
+        self._front = back
+        self._seq += 1
+
+    def read(self) -> Tuple[int, np.ndarray]:
+        """Salinan state terbaru yang konsisten: (seq, [t, rot_x, rot_y, scale, v...])."""
+        while True:
+            seq = self._seq
+            state = self._buffers[self._front].copy()
+            if seq == self._seq:
+                return seq, state
+
+    def sample(self, now: float) -> Tuple[float, float, float]:
+        """(rot_x, rot_y, scale) diekstrapolasi ke waktu now (time.time())."""
+        _, s = self.read()
+        h = min(max(now - s[_T], 0.0), self.max_extrapolation)
+        return (
+            float(s[_ROT_X] + s[_V_ROT_X] * h),
+            float(s[_ROT_Y] + s[_V_ROT_Y] * h),
+            float(s[_SCALE] + s[_V_SCALE] * h),
+        )
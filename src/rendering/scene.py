@@ -0,0 +1,368 @@
+import math
+import os
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+from OpenGL.GL import (
+    GL_MAX_TEXTURE_SIZE, GL_MODELVIEW, GL_PROJECTION, GL_TEXTURE_2D, glBindTexture, glDisable,
+    glEnable, glGetIntegerv, glLoadIdentity, glLoadMatrixf, glMatrixMode, glViewport,
+)
+from OpenGL.GLU import gluPerspective
+
+from .cube_renderer import CAMERA_DISTANCE, FOV_Y, Z_FAR, Z_NEAR, init_gl_state
+from .gpu_mesh import GpuMesh
+from .lod import bounding_radius
+from .mesh_cache import MeshCache, load_mesh
+from .mesh_data import MeshData
+from .mesh_optimizer import load_optimized_arrays
+from .textures import Texture, TextureCache, TextureManager
+from .vertex_arrays import RenderArrays, build_render_arrays
+
+
+class MeshAsset:
+    """Satu file OBJ: data CPU (dibagi semua instance) + buffer GPU ber-refcount."""
+
+    def __init__(self, key: str, path: str, mesh: MeshData, arrays: RenderArrays):
+        self.key = key
+        self.path = path
+        self.mesh = mesh
+        self.arrays = arrays
+        self.radius = bounding_radius(mesh)
+        self.gpu: GpuMesh | None = None
+        self.refs = 0
+
+
+class MeshRegistry:
+    """
+    Load tiap asset sekali saja, berapa pun objek yang memakainya.
+
+    load() hanya kerja CPU (parse/cache, boleh dari thread mana saja);
+    acquire() menambah refcount dan meng-upload VBO/IBO saat pertama kali
+    dipakai, release() menghapus buffer GPU begitu refcount kembali 0.
+    Tekstur map_Kd asset diminta saat upload pertama dan dibagi semua asset
+    lewat satu TextureManager. init_gl/acquire/release harus dipanggil di thread GL.
+    """
+
+    def __init__(self, cache: MeshCache | None = None, use_cache: bool = True,
+                 optimize: bool = False, weld_tolerance: float = 1e-5,
+                 textures: bool = True, texture_cache: TextureCache | None = None):
+        if cache is None and use_cache:
+            cache = MeshCache()
+        self.cache = cache
+        self.optimize = optimize
+        self.weld_tolerance = weld_tolerance
+        self.textures: TextureManager | None = None
+        if textures:
+            self.textures = TextureManager(texture_cache, use_cache=use_cache)
+        self.assets: Dict[str, MeshAsset] = {}
+        self._lock = threading.Lock()
+        self._loading: Dict[str, threading.Event] = {}
+
+        self.loads = 0
+        self.uploads = 0
+
+    def init_gl(self) -> None:
+        if self.textures is not None:
+            # level 0 tidak boleh melebihi batas driver (sebelum decode pertama)
+            max_size = int(glGetIntegerv(GL_MAX_TEXTURE_SIZE))
+            self.textures.max_size = min(self.textures.max_size, max_size)
+
+    @staticmethod
+    def key_for(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def load(self, path: str) -> MeshAsset:
+        key = self.key_for(path)
+        while True:
+            with self._lock:
+                asset = self.assets.get(key)
+                if asset is not None:
+                    return asset
+                pending = self._loading.get(key)
+                if pending is None:
+                    # thread ini yang parse; thread lain menunggu hasilnya
+                    pending = self._loading[key] = threading.Event()
+                    break
+            pending.wait()
+
+        try:
+            mesh, _ = load_mesh(path, self.cache)
+            if self.optimize:
+                arrays = load_optimized_arrays(path, mesh, self.cache, self.weld_tolerance)
+            else:
+                arrays = build_render_arrays(mesh)
+            asset = MeshAsset(key, path, mesh, arrays)
+            with self._lock:
+                self.assets[key] = asset
+                self.loads += 1
+        finally:
+            with self._lock:
+                del self._loading[key]
+            pending.set()
+        return asset
+
+    def acquire(self, path: str) -> MeshAsset:
+        asset = self.load(path)
+        if asset.gpu is None:
+            asset.gpu = GpuMesh(asset.arrays)
+            asset.gpu.upload()
+            asset.gpu.textures = self._request_textures(asset.mesh)
+            self.uploads += 1
+            print(
+                f"[MeshRegistry] uploaded {asset.path}: {len(asset.arrays.vertices)} vertices, "
+                f"{asset.arrays.triangle_count} triangles"
+            )
+        asset.refs += 1
+        return asset
+
+    def release(self, asset: MeshAsset) -> None:
+        asset.refs -= 1
+        if asset.refs > 0:
+            return
+        if asset.gpu is not None:
+            asset.gpu.release()
+            asset.gpu = None
+        # load berikutnya dibaca ulang dari MeshCache (murah)
+        with self._lock:
+            self.assets.pop(asset.key, None)
+            resident = [a for a in self.assets.values() if a.gpu is not None]
+        if self.textures is not None:
+            self.textures.retain(p for a in resident for p in a.mesh.material_textures or ())
+
+    def _request_textures(self, mesh: MeshData) -> Dict[int, Texture]:
+        """material id → Texture (sama seperti CubeRenderer._request_textures)."""
+        if self.textures is None or not mesh.textured:
+            return {}
+        by_path = self.textures.request(mesh.material_textures)
+        return {i: by_path[p] for i, p in enumerate(mesh.material_textures) if p is not None}
+
+    def upload_textures(self) -> None:
+        """Potongan upload tekstur berikutnya (sekali per frame, dibatasi budget)."""
+        if self.textures is not None:
+            self.textures.upload()
+
+    def stats(self) -> dict:
+        with self._lock:
+            assets = list(self.assets.values())
+        return {
+            "assets": len(assets),
+            "resident": sum(a.gpu is not None for a in assets),
+            "refs": sum(a.refs for a in assets),
+            "gpu_bytes": sum(a.arrays.nbytes for a in assets if a.gpu is not None),
+            "loads": self.loads,
+            "uploads": self.uploads,
+        }
+
+
+class SceneInstance:
+    """Satu objek di scene: referensi ke asset + transform sendiri."""
+
+    def __init__(self, asset: MeshAsset, position: Sequence[float] = (0.0, 0.0, 0.0),
+                 rot_x: float = 0.0, rot_y: float = 0.0, scale: float = 1.0):
+        self.asset = asset
+        self.position = tuple(float(v) for v in position)
+        self.rot_x = rot_x
+        self.rot_y = rot_y
+        self.scale = scale
+        self.visible = True
+
+    def update_state(self, rot_x: float, rot_y: float, scale: float) -> None:
+        self.rot_x = rot_x
+        self.rot_y = rot_y
+        self.scale = scale
+
+
+def instance_matrices(positions: np.ndarray, rot_x: np.ndarray, rot_y: np.ndarray,
+                      scale: np.ndarray, camera_distance: float = CAMERA_DISTANCE) -> np.ndarray:
+    """
+    Modelview (N, 4, 4) untuk N instance sekaligus:
+    lookAt(0,0,d → origin) · translate · scale · rotX · rotY (urutan sama dengan
+    CubeRenderer.draw_object). Hasil sudah ditranspose (column-major untuk glLoadMatrixf).
+    """
+    ax = np.radians(rot_x)
+    ay = np.radians(rot_y)
+    cx, sx = np.cos(ax), np.sin(ax)
+    cy, sy = np.cos(ay), np.sin(ay)
+
+    # rotX · rotY
+    r = np.zeros((len(positions), 3, 3))
+    r[:, 0, 0] = cy
+    r[:, 0, 2] = sy
+    r[:, 1, 0] = sx * sy
+    r[:, 1, 1] = cx
+    r[:, 1, 2] = -sx * cy
+    r[:, 2, 0] = -cx * sy
+    r[:, 2, 1] = sx
+    r[:, 2, 2] = cx * cy
+
+    m = np.zeros((len(positions), 4, 4))
+    m[:, :3, :3] = r * scale[:, None, None]
+    m[:, :3, 3] = positions
+    m[:, 2, 3] -= camera_distance
+    m[:, 3, 3] = 1.0
+    return np.ascontiguousarray(m.transpose(0, 2, 1), dtype=np.float32)
+
+
+class Scene:
+    """
+    Banyak objek (boleh mesh yang sama) dalam satu viewport.
+
+    Instance dikelompokkan per asset: buffer di-bind dan pointer vertex di-set
+    sekali per asset, lalu tiap instance cukup glLoadMatrixf + satu
+    glDrawElements untuk seluruh index buffer (warna material ada di atribut
+    vertex, jadi range per material tidak perlu dipisah). Asset bertekstur
+    digambar per range material: tekstur di-bind sekali per range, lalu semua
+    instance. Instance di luar frustum dilewati.
+    """
+
+    def __init__(self, registry: MeshRegistry | None = None,
+                 camera_distance: float = CAMERA_DISTANCE):
+        self.registry = registry or MeshRegistry()
+        self.groups: Dict[str, List[SceneInstance]] = {}
+        self.viewport: Tuple[int, int, int, int] | None = None
+        self.aspect = 4.0 / 3.0
+        self.camera_distance = CAMERA_DISTANCE
+        self.z_far = Z_FAR
+        self.set_camera(camera_distance)
+
+        self.drawn = 0
+        self.culled = 0
+        self.draw_calls = 0
+
+    def init_gl(self, width: int = 800, height: int = 600) -> None:
+        init_gl_state()
+        self.set_viewport(0, 0, width, height)
+        self.registry.init_gl()
+
+    def begin_frame(self) -> None:
+        """Pekerjaan sekali per frame (bukan per viewport): upload tekstur."""
+        self.registry.upload_textures()
+
+    def set_camera(self, distance: float) -> None:
+        """Jarak kamera; far plane ikut mundur supaya katalog besar tidak terpotong."""
+        self.camera_distance = distance
+        self.z_far = max(Z_FAR, 2.0 * distance)
+        if self.viewport is not None:
+            self.set_viewport(*self.viewport)
+
+    def set_viewport(self, x: int, y: int, width: int, height: int) -> None:
+        glViewport(x, y, width, height)
+        self.viewport = (x, y, width, height)
+        self.aspect = width / float(max(height, 1))
+        glMatrixMode(GL_PROJECTION)
+        glLoadIdentity()
+        gluPerspective(FOV_Y, self.aspect, Z_NEAR, self.z_far)
+        glMatrixMode(GL_MODELVIEW)
+        glLoadIdentity()
+
+    @property
+    def instances(self) -> List[SceneInstance]:
+        return [inst for group in self.groups.values() for inst in group]
+
+    def add(self, path: str, position: Sequence[float] = (0.0, 0.0, 0.0),
+            rot_x: float = 0.0, rot_y: float = 0.0, scale: float = 1.0) -> SceneInstance:
+        """Tambah objek (thread GL: upload pertama terjadi di sini)."""
+        asset = self.registry.acquire(path)
+        instance = SceneInstance(asset, position, rot_x, rot_y, scale)
+        self.groups.setdefault(asset.key, []).append(instance)
+        return instance
+
+    def remove(self, instance: SceneInstance) -> None:
+        group = self.groups.get(instance.asset.key, [])
+        if instance in group:
+            group.remove(instance)
+            if not group:
+                del self.groups[instance.asset.key]
+            self.registry.release(instance.asset)
+
+    def clear(self) -> None:
+        for instance in self.instances:
+            self.remove(instance)
+
+    def _visible(self, matrices: np.ndarray, radius: np.ndarray) -> np.ndarray:
+        """Test bola pembatas terhadap frustum (di view space)."""
+        center = matrices[:, 3, :3]
+        x, y, z = center[:, 0], center[:, 1], center[:, 2]
+        half_y = math.radians(FOV_Y) / 2.0
+        half_x = math.atan(math.tan(half_y) * self.aspect)
+        ok = (-z + radius > Z_NEAR) & (-z - radius < self.z_far)
+        for half, coord in ((half_x, x), (half_y, y)):
+            c, s = math.cos(half), math.sin(half)
+            ok &= (c * coord + s * z <= radius) & (-c * coord + s * z <= radius)
+        return ok
+
+    def draw(self) -> None:
+        """Gambar semua instance di viewport aktif (tanpa clear/swap; begin_frame() dulu)."""
+        self.drawn = self.culled = self.draw_calls = 0
+        for group in self.groups.values():
+            group = [inst for inst in group if inst.visible]
+            if not group:
+                continue
+            asset = group[0].asset
+            scale = np.array([inst.scale for inst in group], dtype=np.float64)
+            matrices = instance_matrices(
+                np.array([inst.position for inst in group], dtype=np.float64),
+                np.array([inst.rot_x for inst in group], dtype=np.float64),
+                np.array([inst.rot_y for inst in group], dtype=np.float64),
+                scale,
+                self.camera_distance,
+            )
+            visible = self._visible(matrices, asset.radius * np.abs(scale))
+            self.culled += int(len(group) - visible.sum())
+            if not visible.any():
+                continue
+
+            gpu = asset.gpu
+            gpu.bind()
+            if gpu.textures:
+                self._draw_textured(gpu, matrices[visible])
+            else:
+                count = len(asset.arrays.indices)
+                for m in matrices[visible]:
+                    glLoadMatrixf(m)
+                    gpu.draw_range(0, count)
+                self.draw_calls += int(visible.sum())
+            gpu.unbind()
+            self.drawn += int(visible.sum())
+        glLoadIdentity()
+
+    def _draw_textured(self, gpu: GpuMesh, matrices: np.ndarray) -> None:
+        """Per range material: bind tekstur (kalau sudah di GPU) sekali, lalu semua instance."""
+        textured = False
+        for material, start, count in gpu.arrays.ranges:
+            texture = gpu.textures.get(material)
+            use = texture is not None and texture.bind()
+            if use != textured:
+                if use:
+                    glEnable(GL_TEXTURE_2D)
+                else:
+                    glDisable(GL_TEXTURE_2D)
+                textured = use
+            for m in matrices:
+                glLoadMatrixf(m)
+                gpu.draw_range(start, count)
+            self.draw_calls += len(matrices)
+        if textured:
+            glDisable(GL_TEXTURE_2D)
+            glBindTexture(GL_TEXTURE_2D, 0)
+
+    def stats(self) -> dict:
+        return {
+            "instances": len(self.instances),
+            "drawn": self.drawn,
+            "culled": self.culled,
+            "draw_calls": self.draw_calls,
+            **self.registry.stats(),
+        }
+
+
+def grid_positions(n: int, spacing: float = 2.5) -> List[Tuple[float, float, float]]:
+    """Posisi n objek dalam grid di bidang z=0, berpusat di origin (katalog)."""
+    cols = max(1, math.ceil(math.sqrt(n)))
+    rows = max(1, math.ceil(n / cols))
+    out = []
+    for i in range(n):
+        row, col = divmod(i, cols)
+        out.append(((col - (cols - 1) / 2.0) * spacing, ((rows - 1) / 2.0 - row) * spacing, 0.0))
+    return out
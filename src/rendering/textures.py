@@ -0,0 +1,321 @@
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from OpenGL.GL import *
+
+from .mesh_cache import DEFAULT_MAX_BYTES, MeshCache
+
+
+DEFAULT_TEXTURE_CACHE_DIR = os.environ.get(
+    "OBJECT_ROTATOR_TEXTURE_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "object-rotator", "textures"),
+)
+# sisi terpanjang level 0 (dibatasi lagi oleh GL_MAX_TEXTURE_SIZE di init_gl)
+DEFAULT_MAX_SIZE = 4096
+# batas upload per frame: byte dan waktu, sisanya dilanjutkan frame berikutnya
+DEFAULT_UPLOAD_BUDGET = 4 * 1024 * 1024
+DEFAULT_UPLOAD_TIME = 0.004
+
+
+class TextureCache(MeshCache):
+    """
+    Cache disk mip chain hasil decode. Satu entry per gambar (key = path,
+    ukuran, mtime + ukuran maksimum; hash isi hanya kalau stat berubah, lihat
+    MeshCache), tiap level disimpan sebagai
+    RGB uint8 mentah dengan format file MeshCache, jadi launch berikutnya
+    cukup membaca file tanpa decode JPEG/PNG dan tanpa membuat mip ulang.
+    """
+
+    # 2: key dari stat + sumber di meta (lihat MeshCache.version)
+    version = 2
+    suffix = ".tex"
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_TEXTURE_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        verify_content: bool = True,
+    ):
+        super().__init__(cache_dir, max_bytes, verify_content)
+
+    def source_files(self, image_path: str, digests: Optional[Dict[str, str]] = None) -> List[str]:
+        return [image_path]
+
+
+def decode_image(path: str) -> np.ndarray:
+    """File gambar → (H, W, 3) RGB uint8, baris 0 = bawah (origin vt OBJ dan GL)."""
+    import cv2
+
+    image = cv2.imread(path, cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError(f"cannot decode image: {path}")
+    return np.ascontiguousarray(image[::-1, :, ::-1])
+
+
+def build_mip_chain(image: np.ndarray, max_size: int = DEFAULT_MAX_SIZE) -> List[np.ndarray]:
+    """Level 0 (diperkecil ke max_size kalau perlu) sampai 1x1, ukuran ikut aturan GL (floor / 2)."""
+    import cv2
+
+    h, w = image.shape[:2]
+    if max(h, w) > max_size:
+        f = max_size / max(h, w)
+        w, h = max(1, int(w * f)), max(1, int(h * f))
+        image = cv2.resize(image, (w, h), interpolation=cv2.INTER_AREA)
+
+    levels = [np.ascontiguousarray(image)]
+    while max(h, w) > 1:
+        w, h = max(1, w // 2), max(1, h // 2)
+        levels.append(np.ascontiguousarray(cv2.resize(levels[-1], (w, h), interpolation=cv2.INTER_AREA)))
+    return levels
+
+
+class Texture:
+    """
+    Satu gambar tekstur. Worker mengisi `levels` (mip chain, level 0 = terbesar);
+    thread GL meng-upload bertahap mulai dari level terkecil dan menurunkan
+    GL_TEXTURE_BASE_LEVEL tiap kali satu level lengkap, jadi tekstur sudah
+    bisa dipakai (masih buram) begitu level 1x1 ter-upload dan makin tajam
+    selama upload berjalan.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.levels: List[np.ndarray] | None = None
+        self.size: Tuple[int, int] | None = None
+        self.error: str | None = None
+        self.tex_id: int | None = None
+        # level terhalus yang sudah lengkap di GPU (None = belum bisa dipakai)
+        self.base_level: int | None = None
+        # posisi upload berikutnya (level, baris)
+        self._level = 0
+        self._row = 0
+        self._total_bytes = 0
+        self._sent_bytes = 0
+
+        self.timings: Dict[str, float] = {}
+        self.upload_frames = 0
+
+    @property
+    def ready(self) -> bool:
+        return self.base_level is not None
+
+    @property
+    def complete(self) -> bool:
+        return self.base_level == 0
+
+    @property
+    def uploading(self) -> bool:
+        """Sudah di-decode, masih ada level yang belum di GPU."""
+        return self.levels is not None and not self.complete
+
+    @property
+    def stage(self) -> str:
+        if self.error is not None:
+            return "failed"
+        if self.complete:
+            return "done"
+        if self.levels is None:
+            return "decode"
+        return f"upload {100 * self._sent_bytes // max(self._total_bytes, 1)}%"
+
+    def set_levels(self, levels: List[np.ndarray]) -> None:
+        """Dipanggil worker; satu assignment `levels` → terlihat utuh oleh thread GL."""
+        self.size = (levels[0].shape[1], levels[0].shape[0])
+        self._total_bytes = sum(level.nbytes for level in levels)
+        self.levels = levels
+
+    def _allocate(self) -> None:
+        levels = self.levels
+        tex_id = int(glGenTextures(1))
+        glBindTexture(GL_TEXTURE_2D, tex_id)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
+        # level base..max harus lengkap; base mulai dari level terkecil
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAX_LEVEL, len(levels) - 1)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_BASE_LEVEL, len(levels) - 1)
+        # alokasi storage semua level tanpa data (isi dikirim lewat glTexSubImage2D)
+        for i, level in enumerate(levels):
+            h, w = level.shape[:2]
+            glTexImage2D(GL_TEXTURE_2D, i, GL_RGB8, w, h, 0, GL_RGB, GL_UNSIGNED_BYTE, None)
+        self.tex_id = tex_id
+        self._level = len(levels) - 1
+        self._row = 0
+
+    def upload_step(self, budget: int, deadline: float) -> int:
+        """
+        Upload potongan baris berikutnya (thread GL) sampai budget byte habis
+        atau deadline (perf_counter) lewat; minimal satu potongan per panggilan.
+        Return jumlah byte yang dikirim.
+        """
+        if not self.uploading:
+            return 0
+        t = time.perf_counter()
+        if self.tex_id is None:
+            self._allocate()
+        glBindTexture(GL_TEXTURE_2D, self.tex_id)
+        # baris RGB tidak selalu kelipatan 4 byte
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+
+        sent = 0
+        while self._level >= 0:
+            level = self.levels[self._level]
+            h, w = level.shape[:2]
+            row_bytes = w * 3
+            rows = min(h - self._row, max(1, (budget - sent) // row_bytes))
+            glTexSubImage2D(GL_TEXTURE_2D, self._level, 0, self._row, w, rows,
+                            GL_RGB, GL_UNSIGNED_BYTE, level[self._row:self._row + rows])
+            sent += rows * row_bytes
+            self._row += rows
+            if self._row == h:
+                # level ini lengkap → boleh dipakai untuk sampling
+                glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_BASE_LEVEL, self._level)
+                self.base_level = self._level
+                self._level -= 1
+                self._row = 0
+            if sent >= budget or time.perf_counter() >= deadline:
+                break
+
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 4)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        self._sent_bytes += sent
+        self.upload_frames += 1
+        self.timings["upload"] = self.timings.get("upload", 0.0) + time.perf_counter() - t
+        if self.complete:
+            # data CPU tidak dibutuhkan lagi
+            self.levels = None
+        return sent
+
+    def bind(self) -> bool:
+        """Bind ke GL_TEXTURE_2D kalau sudah ada level yang bisa dipakai."""
+        if self.base_level is None:
+            return False
+        glBindTexture(GL_TEXTURE_2D, self.tex_id)
+        return True
+
+    def release(self) -> None:
+        if self.tex_id is not None:
+            glDeleteTextures([self.tex_id])
+        self.tex_id = None
+        self.base_level = None
+
+
+class TextureManager:
+    """
+    Tekstur milik satu context GL: decode + mip chain di thread background
+    (atau dibaca dari TextureCache), upload bertahap di thread GL dengan
+    budget per frame supaya gambar besar tidak menahan satu frame penuh.
+
+    request() boleh dipanggil dari thread mana saja; upload() dan retain()
+    hanya di thread GL.
+    """
+
+    def __init__(self, cache: TextureCache | None = None, use_cache: bool = True,
+                 max_size: int = DEFAULT_MAX_SIZE,
+                 upload_budget: int = DEFAULT_UPLOAD_BUDGET,
+                 upload_time: float = DEFAULT_UPLOAD_TIME):
+        if cache is None and use_cache:
+            cache = TextureCache()
+        self.cache = cache
+        self.max_size = max_size
+        self.upload_budget = upload_budget
+        self.upload_time = upload_time
+        self.textures: Dict[str, Texture] = {}
+        self._lock = threading.Lock()
+
+    def request(self, paths: Iterable[Optional[str]]) -> Dict[str, Texture]:
+        """Texture untuk tiap path (None dilewati); path baru mulai di-decode di background."""
+        out: Dict[str, Texture] = {}
+        started = []
+        with self._lock:
+            for path in paths:
+                if path is None or path in out:
+                    continue
+                texture = self.textures.get(path)
+                if texture is None:
+                    texture = self.textures[path] = Texture(path)
+                    started.append(texture)
+                out[path] = texture
+        for texture in started:
+            threading.Thread(
+                target=self._decode_worker, args=(texture,),
+                name="texture-loader", daemon=True,
+            ).start()
+        return out
+
+    def _decode_worker(self, texture: Texture) -> None:
+        t = time.perf_counter()
+        try:
+            levels, source = self.load_levels(texture.path)
+        except Exception as e:
+            print(f"[Texture] cannot load {texture.path}: {e}")
+            texture.error = str(e)
+            return
+        texture.timings[source] = time.perf_counter() - t
+        texture.set_levels(levels)
+
+    def load_levels(self, path: str) -> Tuple[List[np.ndarray], str]:
+        """Mip chain dari TextureCache ("cache") atau decode file gambar ("decode")."""
+        variant = f"mip:{self.max_size}"
+        key = None
+        if self.cache is not None:
+            key = self.cache.key_for(path, variant)
+            hit = self.cache.load(path, variant, key)
+            if hit is not None:
+                arrays, meta = hit
+                # salin dari memmap di sini supaya thread GL tidak menunggu disk
+                return [np.array(arrays[f"level{i}"]) for i in range(meta["levels"])], "cache"
+
+        levels = build_mip_chain(decode_image(path), self.max_size)
+        if self.cache is not None:
+            arrays = {f"level{i}": level for i, level in enumerate(levels)}
+            try:
+                self.cache.store(path, arrays, {"levels": len(levels)}, variant, key)
+            except OSError as e:
+                print(f"[TextureCache] cannot write cache: {e}")
+        return levels, "decode"
+
+    def _snapshot(self) -> List[Texture]:
+        with self._lock:
+            return list(self.textures.values())
+
+    @property
+    def uploading(self) -> bool:
+        return any(t.uploading for t in self._snapshot())
+
+    def status(self) -> List[Tuple[str, str]]:
+        """(path, stage) tekstur yang belum selesai (untuk judul window)."""
+        return [(t.path, t.stage) for t in self._snapshot() if t.error is None and not t.complete]
+
+    def upload(self) -> int:
+        """Lanjutkan upload tekstur yang sudah di-decode dalam budget satu frame; return byte."""
+        textures = [t for t in self._snapshot() if t.uploading]
+        if not textures:
+            return 0
+        deadline = time.perf_counter() + self.upload_time
+        sent = 0
+        for texture in textures:
+            if sent >= self.upload_budget or time.perf_counter() >= deadline:
+                break
+            sent += texture.upload_step(self.upload_budget - sent, deadline)
+            if texture.complete:
+                w, h = texture.size
+                print(
+                    f"[Texture] {os.path.basename(texture.path)} {w}x{h} ready: "
+                    + ", ".join(f"{k} {1e3 * v:.1f} ms" for k, v in texture.timings.items())
+                    + f" over {texture.upload_frames} frames"
+                )
+        return sent
+
+    def retain(self, paths: Iterable[Optional[str]]) -> None:
+        """Hapus tekstur yang tidak dipakai lagi (mis. setelah ganti model)."""
+        keep = {p for p in paths if p is not None}
+        with self._lock:
+            dropped = [t for p, t in self.textures.items() if p not in keep]
+            self.textures = {p: t for p, t in self.textures.items() if p in keep}
+        for texture in dropped:
+            texture.release()
@@ -0,0 +1,101 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .mesh_data import MeshData
+
+
+# layout vertex interleaved: posisi (3) | normal (3) | warna (3) [| uv (2)], float32
+# uv hanya ada kalau mesh punya material bertekstur
+VERTEX_FLOATS = 9
+TEXTURED_VERTEX_FLOATS = 11
+VERTEX_STRIDE = VERTEX_FLOATS * 4
+NORMAL_OFFSET = 3 * 4
+COLOR_OFFSET = 6 * 4
+UV_OFFSET = 9 * 4
+
+
+class RenderArrays:
+    """Data siap upload ke GPU: vertex interleaved + index buffer per material."""
+
+    def __init__(
+        self,
+        vertices: np.ndarray,
+        indices: np.ndarray,
+        ranges: List[Tuple[int, int, int]],
+    ):
+        # (V, 9) float32, (V, 11) kalau bertekstur
+        self.vertices = vertices
+        # index segitiga (T * 3), uint16 atau uint32
+        self.indices = indices
+        # (material id, index awal, jumlah index) → satu draw call per item
+        self.ranges = ranges
+
+    @property
+    def textured(self) -> bool:
+        return self.vertices.shape[1] >= TEXTURED_VERTEX_FLOATS
+
+    @property
+    def stride(self) -> int:
+        return self.vertices.shape[1] * 4
+
+    @property
+    def triangle_count(self) -> int:
+        return len(self.indices) // 3
+
+    @property
+    def nbytes(self) -> int:
+        return self.vertices.nbytes + self.indices.nbytes
+
+    def to_arrays(self) -> Tuple[Dict[str, np.ndarray], dict]:
+        """Array + metadata untuk disimpan ke MeshCache."""
+        arrays = {
+            "vertices": self.vertices,
+            "indices": self.indices,
+            "ranges": np.asarray(self.ranges, dtype=np.int64).reshape(-1, 3),
+        }
+        return arrays, {}
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], meta: dict) -> "RenderArrays":
+        ranges = [tuple(int(v) for v in r) for r in np.asarray(arrays["ranges"]).tolist()]
+        return cls(arrays["vertices"], arrays["indices"], ranges)
+
+
+def build_render_arrays(mesh: MeshData) -> RenderArrays:
+    """
+    Fan-triangulate mesh sekali ke array interleaved.
+    Tiap corner face jadi satu vertex (flat shading: normal & warna per-face),
+    segitiga diurutkan per material supaya bisa digambar satu call per material.
+    Mesh bertekstur mendapat UV per corner (corner tanpa vt → (0, 0)).
+    """
+    sizes = mesh.face_sizes
+    corner_face = np.repeat(np.arange(mesh.face_count), sizes)
+
+    floats = TEXTURED_VERTEX_FLOATS if mesh.textured else VERTEX_FLOATS
+    vertices = np.empty((len(mesh.face_indices), floats), dtype=np.float32)
+    vertices[:, 0:3] = mesh.vertices[mesh.face_indices]
+    vertices[:, 3:6] = mesh.face_normals[corner_face]
+    vertices[:, 6:9] = mesh.face_colors[corner_face]
+    if mesh.textured:
+        face_uvs = mesh.face_uvs
+        vertices[:, 9:11] = mesh.uvs[np.maximum(face_uvs, 0)]
+        vertices[face_uvs < 0, 9:11] = 0.0
+
+    corners, tri_face = mesh.corner_triangles()
+    tri_material = mesh.face_materials[tri_face]
+    order = np.argsort(tri_material, kind="stable")
+    corners = corners[order]
+    tri_material = tri_material[order]
+
+    indices = corners.astype(np.uint32).reshape(-1)
+
+    ranges: List[Tuple[int, int, int]] = []
+    if len(tri_material):
+        bounds = np.flatnonzero(np.diff(tri_material)) + 1
+        starts = np.concatenate(([0], bounds))
+        ends = np.concatenate((bounds, [len(tri_material)]))
+        for s, e in zip(starts.tolist(), ends.tolist()):
+            ranges.append((int(tri_material[s]), s * 3, (e - s) * 3))
+
+    return RenderArrays(vertices, indices, ranges)
@@ -0,0 +1,60 @@
+import math
+from typing import List, Sequence, Tuple
+
+from OpenGL.GL import GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, glClear
+from OpenGL.GLUT import glutSwapBuffers
+
+from .cube_renderer import CubeRenderer
+
+
+def grid_shape(n: int) -> Tuple[int, int]:
+    """(kolom, baris) grid hampir persegi untuk n viewport."""
+    cols = max(1, math.ceil(math.sqrt(n)))
+    return cols, max(1, math.ceil(n / cols))
+
+
+def grid_layout(n: int, width: int, height: int) -> List[Tuple[int, int, int, int]]:
+    """
+    n viewport (x, y, w, h), urut baris dari kiri atas (origin GL ada di
+    kiri bawah).
+    """
+    if n <= 0:
+        return []
+    cols, rows = grid_shape(n)
+    tile_w = width // cols
+    tile_h = height // rows
+    tiles = []
+    for i in range(n):
+        row, col = divmod(i, cols)
+        tiles.append((col * tile_w, height - (row + 1) * tile_h, tile_w, tile_h))
+    return tiles
+
+
+class ViewportGrid:
+    """
+    Beberapa objek (satu per session) dalam satu window / context GL,
+    masing-masing di viewport sendiri. Renderer boleh dipakai bersama oleh
+    beberapa viewport (mesh yang sama cukup di-upload sekali); state
+    rotasi/scale di-set tepat sebelum tiap viewport digambar.
+    """
+
+    def __init__(self, n: int, width: int, height: int):
+        self.n = n
+        self.resize(width, height)
+
+    def resize(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.tiles = grid_layout(self.n, width, height)
+
+    def draw(self, items: Sequence[Tuple[CubeRenderer, Tuple[float, float, float]]]) -> None:
+        """items[i] = (renderer, (rot_x, rot_y, scale)) untuk viewport i."""
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        # renderer bersama cukup sekali per frame (budget upload tekstur)
+        for renderer in {id(r): r for r, _ in items}.values():
+            renderer.begin_frame()
+        for (renderer, state), (x, y, w, h) in zip(items, self.tiles):
+            renderer.set_viewport(x, y, w, h)
+            renderer.update_state(*state)
+            renderer.draw_object()
+        glutSwapBuffers()